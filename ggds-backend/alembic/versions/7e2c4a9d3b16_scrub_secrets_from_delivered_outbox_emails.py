@@ -0,0 +1,29 @@
+"""Scrub secrets from delivered outbox emails
+
+Revision ID: 7e2c4a9d3b16
+Revises: 5b7d2e9c1f38
+Create Date: 2026-10-17 23:41:27.305918
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7e2c4a9d3b16'
+down_revision = '5b7d2e9c1f38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sent and failed entries no longer need their initial passwords
+    # (the worker now removes them itself, see email_outbox.SECRET_PAYLOAD_KEYS)
+    op.execute(
+        "UPDATE email_outbox SET payload = (payload::jsonb - 'initial_password')::json "
+        "WHERE status IN ('SENT', 'FAILED') AND payload::jsonb ? 'initial_password'"
+    )
+
+
+def downgrade() -> None:
+    # The removed passwords cannot be restored
+    pass
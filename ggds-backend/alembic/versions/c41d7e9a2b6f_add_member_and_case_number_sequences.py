@@ -0,0 +1,53 @@
+"""Add member and case number sequences
+
+Revision ID: c41d7e9a2b6f
+Revises: 8a317fca7c64
+Create Date: 2026-10-17 09:12:44.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d7e9a2b6f'
+down_revision = '8a317fca7c64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('member_number_seq')))
+    op.execute(sa.schema.CreateSequence(sa.Sequence('case_number_seq')))
+
+    # Continue numbering after existing IDs (GGDS-0001 and legacy GGDS-2025-001)
+    op.execute("""
+        SELECT setval(
+            'member_number_seq',
+            COALESCE(
+                (SELECT MAX(CAST(substring(member_id from '([0-9]+)$') AS INTEGER))
+                 FROM members WHERE member_id LIKE 'GGDS-%'),
+                0
+            ) + 1,
+            false
+        )
+    """)
+    op.execute("""
+        SELECT setval(
+            'case_number_seq',
+            GREATEST(
+                COALESCE((SELECT MAX(case_number) FROM cases), 0),
+                COALESCE(
+                    (SELECT MAX(CAST(substring(case_id from '([0-9]+)$') AS INTEGER))
+                     FROM cases WHERE case_id LIKE 'CASE-%'),
+                    0
+                )
+            ) + 1,
+            false
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence('case_number_seq')))
+    op.execute(sa.schema.DropSequence(sa.Sequence('member_number_seq')))
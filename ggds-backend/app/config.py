@@ -2,6 +2,14 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
+def _async_database_url(url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the psycopg3 driver, which supports asyncio"""
+    scheme, _, rest = url.partition("://")
+    if scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+        return f"postgresql+psycopg://{rest}"
+    return url
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
 
@@ -12,12 +20,37 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    database_read_url: Optional[str] = None  # Read replica for reporting/dashboard queries
+    read_your_writes_seconds: int = 5  # Keep a client on the primary after it writes (0 disables)
+    n_plus_one_threshold: int = 5  # Warn when one statement shape repeats this often in a request
+
+    @property
+    def async_database_url(self) -> str:
+        """Database URL using the psycopg3 driver, which supports asyncio"""
+        return _async_database_url(self.database_url)
+
+    @property
+    def async_database_read_url(self) -> Optional[str]:
+        """Read replica URL using the psycopg3 driver (None if no replica is configured)"""
+        if not self.database_read_url:
+            return None
+        return _async_database_url(self.database_read_url)
 
     # Security
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    # Per worker and only invalidated by ORM writes in that worker: other workers
+    # and Core/bulk UPDATEs see a deactivated user or changed role this late
+    user_cache_ttl_seconds: int = 10  # Cache authenticated users (0 disables)
+    user_cache_max_size: int = 4096
+    password_hash_workers: int = 4  # Threads running bcrypt concurrently
+    password_hash_max_queue: int = 256  # Reject with 503 beyond this many waiting hashes
+
+    # Bulk member import
+    member_import_batch_size: int = 500  # CSV rows validated and inserted per batch
+    member_import_max_rows: int = 5000  # Reject imports larger than this
 
     # Frontend CORS
     frontend_url: str = "http://localhost:3000"
@@ -30,6 +63,20 @@ class Settings(BaseSettings):
     smtp_use_tls: bool = True
     email_from: str = "lifeline@ggdi.net"
     admin_email: str = "lifeline@ggdi.net"
+    smtp_timeout_seconds: int = 30
+    smtp_pool_size: int = 3  # Persistent SMTP connections per worker
+    smtp_pool_health_check_seconds: int = 30  # NOOP-check connections idle longer than this
+    smtp_pool_max_messages: int = 100  # Reconnect after this many messages on one connection
+    email_outbox_batch_size: int = 50  # Emails leased and sent per worker iteration
+    email_outbox_poll_seconds: int = 5  # Worker poll interval when the outbox is idle
+    email_outbox_lease_seconds: int = 300  # Retry an in-flight email after this if its worker died
+    email_outbox_max_attempts: int = 8
+    email_outbox_retry_base_seconds: int = 30  # Backoff doubles per failed attempt
+    email_outbox_retry_max_seconds: int = 3600
+    broadcast_rate_per_second: float = 10  # Broadcast emails per second per worker (0 = unlimited)
+    broadcast_concurrency: int = 3  # Broadcast emails in flight at once
+    broadcast_batch_size: int = 100  # Recipients fetched and recorded per batch
+    broadcast_lease_seconds: int = 300  # Resume a running broadcast whose sender stopped heartbeating
 
     # Digital Ocean Spaces (S3 compatible)
     spaces_region: str = "fra1"
@@ -37,6 +84,10 @@ class Settings(BaseSettings):
     spaces_access_key: str
     spaces_secret_key: str
     spaces_endpoint: Optional[str] = None  # Auto-generated from region if not provided
+    spaces_max_pool_connections: int = 20  # HTTP connections to Spaces, also the storage thread count
+    spaces_connect_timeout_seconds: int = 5
+    spaces_read_timeout_seconds: int = 60
+    spaces_max_attempts: int = 3  # Including the first try; botocore retries throttling and 5xx
 
     @property
     def spaces_endpoint_url(self) -> str:
@@ -45,6 +96,29 @@ class Settings(BaseSettings):
             return self.spaces_endpoint
         return f"https://{self.spaces_region}.digitaloceanspaces.com"
 
+    # Uploads
+    storage_backend: str = "spaces"  # "spaces" or "local"; Spaces falls back to local when unreachable
+    local_storage_dir: str = "uploads"
+    upload_max_bytes: int = 10 * 1024 * 1024  # 10MB per file
+    upload_chunk_bytes: int = 256 * 1024  # Read from the request this much at a time
+    download_chunk_bytes: int = 256 * 1024  # Read from storage this much at a time when streaming files out
+    upload_part_bytes: int = 5 * 1024 * 1024  # Multipart part size (S3 minimum is 5MB)
+    upload_batch_max_files: int = 10  # Files accepted by one multi-file upload
+    upload_batch_concurrency: int = 3  # Files of one multi-file upload read and stored at once
+    upload_presign_expiration_seconds: int = 3600  # Validity of direct upload URLs
+    spaces_proxy_downloads: bool = False  # Stream downloads through the API instead of redirecting to Spaces
+    presigned_url_cache_size: int = 10000  # Download URLs kept per worker (0 disables)
+    presigned_url_safety_margin_seconds: int = 300  # Re-sign when a cached URL has less validity left
+    image_display_max_px: int = 1600  # Longest side of the normalized copy of uploaded images
+    image_thumbnail_px: int = 320  # Longest side of thumbnails
+    image_jpeg_quality: int = 82
+    image_processing_workers: int = 2  # Images decoded and resized at once
+    storage_gc_interval_hours: int = 24  # How often each worker tries to collect garbage (0 disables)
+    storage_gc_orphan_document_hours: int = 168  # Delete documents uploaded without a case or member after this (0 keeps them)
+    storage_gc_pending_upload_hours: int = 24  # Delete direct uploads never completed after this
+    storage_gc_min_object_age_hours: int = 6  # Never delete objects or blobs newer than this (uploads in flight)
+    storage_gc_batch_size: int = 500  # Rows deleted per transaction
+
     # Optional
     sentry_dsn: Optional[str] = None
     log_level: str = "INFO"
@@ -1,7 +1,11 @@
+import time
+from fastapi import Request, Response
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
+from app.utils.query_counter import install_query_counter
 
 # Create SQLAlchemy engine
 engine = create_engine(
@@ -12,12 +16,85 @@ engine = create_engine(
     echo=settings.debug   # Log SQL statements in debug mode
 )
 
+# Create async SQLAlchemy engine (psycopg3 async driver)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+    echo=settings.debug
+)
+
+# Create async engine for the read replica (falls back to the primary)
+if settings.async_database_read_url:
+    read_async_engine = create_async_engine(
+        settings.async_database_read_url,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        echo=settings.debug
+    )
+else:
+    read_async_engine = async_engine
+
+# Count statements and DB time per request (see app.utils.query_counter)
+install_query_counter(engine)
+install_query_counter(async_engine.sync_engine)
+if read_async_engine is not async_engine:
+    install_query_counter(read_async_engine.sync_engine)
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create AsyncSessionLocal class
+# expire_on_commit=False keeps loaded attributes usable after commit, since
+# async sessions cannot lazily reload expired attributes during serialization
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Create ReadAsyncSessionLocal class (read replica)
+ReadAsyncSessionLocal = async_sessionmaker(
+    bind=read_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create Base class for models
 Base = declarative_base()
 
+# Read-your-writes: after a write the response carries the time (Unix
+# seconds) until which the client's reads stay on the primary, and the client
+# sends it back. The pin travels with the client, so every worker honours it.
+PRIMARY_PIN_HEADER = "X-Primary-Until"
+
+
+def record_primary_write(response: Response) -> None:
+    """
+    Pin the client to the primary for the read-your-writes window.
+
+    Called after a successful write so that the client's next reads do not
+    hit a replica that has not caught up yet.
+    """
+    if not settings.read_your_writes_seconds or read_async_engine is async_engine:
+        return
+    response.headers[PRIMARY_PIN_HEADER] = f"{time.time() + settings.read_your_writes_seconds:.3f}"
+
+
+def _is_pinned_to_primary(request: Request) -> bool:
+    """Check whether the client wrote within the read-your-writes window"""
+    try:
+        until = float(request.headers.get(PRIMARY_PIN_HEADER, ""))
+    except ValueError:
+        return False
+    now = time.time()
+    # A pin further out than one window (plus rounding) was not issued by us
+    return now < until <= now + settings.read_your_writes_seconds + 1
+
 
 # Dependency to get database session
 def get_db():
@@ -34,3 +111,42 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get async database session
+async def get_async_db():
+    """
+    Async database session dependency for FastAPI routes.
+
+    Queries are awaited, so the event loop keeps serving other requests
+    while this one waits on the database.
+
+    Usage:
+        @app.get("/items")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Dependency to get read-only async database session
+async def get_read_db(request: Request):
+    """
+    Read replica session dependency for read-only FastAPI routes.
+
+    Uses the primary when no replica is configured, or when the client
+    wrote within the last READ_YOUR_WRITES_SECONDS.
+
+    Usage:
+        @app.get("/reports")
+        async def read_reports(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    session_factory = ReadAsyncSessionLocal
+    if read_async_engine is not async_engine and _is_pinned_to_primary(request):
+        session_factory = AsyncSessionLocal
+
+    async with session_factory() as db:
+        yield db
@@ -4,8 +4,16 @@ from fastapi.responses import JSONResponse
 import time
 
 from app.config import settings
-from app.database import engine, Base
+from app.database import engine, async_engine, read_async_engine, Base, PRIMARY_PIN_HEADER, record_primary_write
 from app.schemas.common import HealthCheck
+from app.services.email_service import email_service
+from app.services.email_outbox import email_outbox_worker
+from app.services.broadcast_service import broadcast_runner
+from app.services.s3_service import async_s3_service
+from app.services.image_service import image_processor
+from app.services.storage_gc import storage_gc
+from app.utils.query_counter import track_queries
+from app.utils.security import password_hash_stats
 
 # Create FastAPI app
 app = FastAPI(
@@ -22,6 +30,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all methods (GET, POST, PUT, DELETE, etc.)
     allow_headers=["*"],  # Allow all headers
+    expose_headers=[PRIMARY_PIN_HEADER],  # Read-your-writes pin, sent back by the frontend
 )
 
 
@@ -36,6 +45,34 @@ async def add_process_time_header(request: Request, call_next):
     return response
 
 
+# Query counting middleware
+@app.middleware("http")
+async def count_queries(request: Request, call_next):
+    """Warn about likely N+1 queries, and add statement count and DB time headers in debug mode"""
+    with track_queries() as stats:
+        response = await call_next(request)
+
+    # Query counts hint at data volumes, so they stay out of production responses
+    if settings.debug:
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Time"] = f"{stats.total_time:.6f}"
+
+    for shape, count in stats.repeated_statements(settings.n_plus_one_threshold):
+        print(f"⚠️  Possible N+1 on {request.method} {request.url.path}: {count}x {shape[:200]}")
+
+    return response
+
+
+# Read-your-writes middleware
+@app.middleware("http")
+async def pin_writers_to_primary(request: Request, call_next):
+    """Keep clients on the primary database briefly after a successful write"""
+    response = await call_next(request)
+    if request.method in ("POST", "PUT", "PATCH", "DELETE") and response.status_code < 400:
+        record_primary_write(response)
+    return response
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -66,8 +103,8 @@ async def health_check():
     try:
         # Test database connection
         from sqlalchemy import text
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
         db_status = "connected"
     except Exception as e:
         db_status = f"error: {str(e)}"
@@ -75,7 +112,8 @@ async def health_check():
     return {
         "status": "healthy",
         "version": "1.0.0",
-        "database": db_status
+        "database": db_status,
+        "password_hashing": password_hash_stats()
     }
 
 
@@ -107,12 +145,32 @@ async def startup_event():
         print("🔧 Debug mode: Creating database tables if they don't exist...")
         Base.metadata.create_all(bind=engine)
 
+    # Deliver queued emails in the background
+    if email_service.configured:
+        email_outbox_worker.start()
+        await broadcast_runner.resume_stale()
+
+    # Finish image derivatives interrupted by the last shutdown
+    await image_processor.resume_pending()
+
+    # Remove stale documents and unreferenced files periodically
+    storage_gc.start()
+
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
     print(f"👋 {settings.app_name} shutting down...")
+    await broadcast_runner.stop()
+    await email_outbox_worker.stop()
+    await image_processor.stop()
+    await storage_gc.stop()
+    await email_service.close()
+    async_s3_service.shutdown()
+    await async_engine.dispose()
+    if read_async_engine is not async_engine:
+        await read_async_engine.dispose()
 
 
 if __name__ == "__main__":
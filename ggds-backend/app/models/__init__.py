@@ -8,10 +8,13 @@ from app.models.family_member import FamilyMember, FamilyType, Relationship
 from app.models.next_of_kin import NextOfKin
 from app.models.case import Case, CaseType, UrgencyLevel, CaseStatus, RelationshipType  # PIVOT v2.0: Added RelationshipType
 from app.models.verification_contact import VerificationContact, ContactType
-from app.models.document import Document
+from app.models.document import Document, DocumentStatus
+from app.models.stored_blob import StoredBlob
 from app.models.contribution import Contribution, ContributionStatus  # PIVOT v2.0: Removed PaymentMethod
 from app.models.probation import Probation  # PIVOT v2.0: New model
 from app.models.covered_person import CoveredPerson  # PIVOT v2.0: Insured individuals
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.models.email_broadcast import EmailBroadcast, EmailBroadcastRecipient, BroadcastStatus, BroadcastRecipientStatus
 
 __all__ = [
     "User",
@@ -30,8 +33,16 @@ __all__ = [
     "VerificationContact",
     "ContactType",
     "Document",
+    "DocumentStatus",
+    "StoredBlob",
     "Contribution",
     "ContributionStatus",
     "Probation",  # PIVOT v2.0
     "CoveredPerson",  # PIVOT v2.0
+    "EmailOutbox",
+    "EmailOutboxStatus",
+    "EmailBroadcast",
+    "EmailBroadcastRecipient",
+    "BroadcastStatus",
+    "BroadcastRecipientStatus",
 ]
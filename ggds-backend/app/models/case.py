@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, Date, DateTime, Enum, ForeignKey, Integer, Float, Boolean
+from sqlalchemy import Column, String, Text, Date, DateTime, Enum, ForeignKey, Integer, Float, Boolean, Sequence
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship as sa_relationship
@@ -7,6 +7,10 @@ import enum
 from app.database import Base
 
 
+# Allocates case numbers (and the CASE-001 case IDs derived from them)
+case_number_seq = Sequence("case_number_seq", metadata=Base.metadata)
+
+
 # PIVOT v2.0: Immediate family only
 class RelationshipType(str, enum.Enum):
     """Immediate family relationship types (PIVOT v2.0)"""
@@ -1,11 +1,18 @@
 import uuid
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship as sa_relationship
+import enum
 from app.database import Base
 
 
+class DocumentStatus(str, enum.Enum):
+    """Document upload status enumeration"""
+    PENDING = "pending"  # Presigned URL issued, waiting for the client to upload and complete
+    UPLOADED = "uploaded"
+
+
 class Document(Base):
     """Document/file upload model"""
     __tablename__ = "documents"
@@ -24,6 +31,16 @@ class Document(Base):
     s3_key = Column(String(500), nullable=True)  # S3 object key
     s3_url = Column(String(1000), nullable=True)  # Signed URL or permanent URL
     local_path = Column(String(500), nullable=True)  # For local storage during development
+    blob_id = Column(UUID(as_uuid=True), ForeignKey("stored_blobs.id"), nullable=True, index=True)  # Shared content-addressed object
+
+    # Image derivatives, stored next to the original
+    display_key = Column(String(500), nullable=True)  # Downscaled, recompressed, EXIF-free copy
+    thumbnail_key = Column(String(500), nullable=True)
+    image_processed_at = Column(DateTime(timezone=True), nullable=True)  # Set once derivatives are done (or impossible)
+
+    # Direct-to-Spaces uploads
+    status = Column(Enum(DocumentStatus), default=DocumentStatus.UPLOADED, server_default="UPLOADED", nullable=False)
+    upload_id = Column(String(255), nullable=True)  # Multipart upload ID while pending
 
     # Timestamps
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,81 @@
+"""
+Email broadcast models
+A broadcast sends one email (e.g. a contribution call for an approved case)
+to every member matching a selector, recording each recipient's delivery so
+an interrupted broadcast resumes where it left off
+"""
+import uuid
+from sqlalchemy import Column, String, Integer, Text, DateTime, Enum, ForeignKey, JSON, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship as sa_relationship
+import enum
+from app.database import Base
+
+
+class BroadcastStatus(str, enum.Enum):
+    """Broadcast status enumeration"""
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+class BroadcastRecipientStatus(str, enum.Enum):
+    """Per-recipient delivery status enumeration"""
+    SENT = "sent"
+    FAILED = "failed"  # Retried when the broadcast is resumed
+
+
+class EmailBroadcast(Base):
+    """Broadcast model - one email sent to a selection of members"""
+    __tablename__ = "email_broadcasts"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id"), nullable=False, index=True)
+    created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    selector = Column(JSON, nullable=False)  # BroadcastMemberSelector
+
+    # Progress
+    status = Column(Enum(BroadcastStatus), default=BroadcastStatus.RUNNING, nullable=False)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # Updated by the sender after each batch
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Relationships
+    case = sa_relationship("Case")
+    recipients = sa_relationship("EmailBroadcastRecipient", back_populates="broadcast", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<EmailBroadcast {self.id} {self.status}>"
+
+
+class EmailBroadcastRecipient(Base):
+    """Delivery record for one member of a broadcast"""
+    __tablename__ = "email_broadcast_recipients"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    broadcast_id = Column(UUID(as_uuid=True), ForeignKey("email_broadcasts.id"), nullable=False)
+    member_id = Column(UUID(as_uuid=True), ForeignKey("members.id"), nullable=False)
+    email = Column(String(255), nullable=False)
+
+    status = Column(Enum(BroadcastRecipientStatus), nullable=False)
+    attempts = Column(Integer, default=1, nullable=False)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("broadcast_id", "member_id", name="uq_email_broadcast_recipients_broadcast_member"),
+    )
+
+    # Relationships
+    broadcast = sa_relationship("EmailBroadcast", back_populates="recipients")
+
+    def __repr__(self):
+        return f"<EmailBroadcastRecipient {self.email} {self.status}>"
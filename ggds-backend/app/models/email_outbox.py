@@ -0,0 +1,51 @@
+"""
+Email outbox model
+Emails are queued in the same transaction as the change that triggers them
+and delivered by a background worker (app/services/email_outbox.py)
+"""
+import uuid
+from sqlalchemy import Column, String, Integer, Text, DateTime, Enum, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import enum
+from app.database import Base
+
+
+class EmailOutboxStatus(str, enum.Enum):
+    """Outbox delivery status enumeration"""
+    PENDING = "pending"  # Waiting for (re)delivery at next_attempt_at
+    SENT = "sent"
+    FAILED = "failed"  # Gave up after the maximum number of attempts
+
+
+class EmailOutbox(Base):
+    """
+    Outbox entry - one email waiting to be delivered
+
+    `kind` names the EmailService method that renders and sends the email
+    (e.g. send_welcome_email) and `payload` holds its keyword arguments.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+
+    # Delivery tracking
+    status = Column(Enum(EmailOutboxStatus), default=EmailOutboxStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # The worker polls for due pending entries
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<EmailOutbox {self.kind} {self.status}>"
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Date, DateTime, Enum, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, String, Date, DateTime, Enum, ForeignKey, Boolean, JSON, Sequence
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship as sa_relationship
@@ -7,6 +7,10 @@ import enum
 from app.database import Base
 
 
+# Allocates the numeric part of member IDs (GGDS-0001) without scanning members
+member_number_seq = Sequence("member_number_seq", metadata=Base.metadata)
+
+
 class MemberStatus(str, enum.Enum):
     """Member status enumeration"""
     PENDING = "pending"
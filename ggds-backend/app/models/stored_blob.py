@@ -0,0 +1,36 @@
+"""
+Stored blob model
+Uploaded files are stored once per distinct content under a key derived from
+their SHA-256; documents with the same content share the blob
+"""
+import uuid
+from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class StoredBlob(Base):
+    """
+    One object in Spaces, shared by every document with the same content
+
+    Documents reference the blob through `documents.blob_id`; the storage
+    garbage collector deletes blobs no document references. `deleting_at` is
+    set while the object is being deleted, and uploads of the same content
+    wait for the row to disappear before storing it again.
+    """
+    __tablename__ = "stored_blobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    sha256 = Column(String(64), unique=True, nullable=False)
+    s3_key = Column(String(500), nullable=False)
+    size = Column(Integer, nullable=False)  # Size in bytes
+    content_type = Column(String(100), nullable=False)
+    deleting_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # Last stored or reused
+
+    def __repr__(self):
+        return f"<StoredBlob {self.sha256[:12]}>"
@@ -1,16 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, File, HTTPException, status, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
 from typing import Dict, Any, List, Optional
-from datetime import date, datetime, timedelta
+from uuid import UUID
+from datetime import date, datetime, timedelta, timezone
 
-from app.database import get_db
-from app.models import User, Member, Case
+from app.config import settings
+from app.database import get_async_db, get_read_db
+from app.models import User, Member, Case, CaseStatus, Document, DocumentStatus, EmailBroadcast, BroadcastStatus
 from app.utils.dependencies import get_current_admin_user
+from app.utils.loaders import CASE_WITH_REPORTER_OPTIONS
 from app.schemas.case import CaseStatusUpdate, CaseResponse
-from app.schemas.member import MemberResponse, AdminMemberCreate, AdminMemberCreateResponse
-from app.utils.member_utils import generate_member_id, generate_initial_password
-from app.utils.security import get_password_hash
+from app.schemas.broadcast import BroadcastCreate, BroadcastResponse
+from app.schemas.document import AdminDocumentResponse, StorageGCReport
+from app.services.broadcast_service import broadcast_counts, broadcast_runner, create_broadcast
+from app.services.email_service import email_service
+from app.schemas.member import MemberResponse, AdminMemberCreate, AdminMemberCreateResponse, MemberImportResponse
+from app.services.email_outbox import queue_email
+from app.services.member_import_service import import_members_from_csv
+from app.services.storage import local_storage, spaces_storage
+from app.services.storage_gc import storage_gc
+from app.services.upload_service import upload_service
+from app.utils.member_utils import build_full_name, generate_member_id, generate_initial_password
+from app.utils.security import get_password_hash_async
+from app.utils.zip_stream import ZipEntry, stream_zip, unique_name
 
 router = APIRouter()
 
@@ -19,7 +33,7 @@ router = APIRouter()
 @router.post("/members/create", response_model=AdminMemberCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_member_account(
     member_data: AdminMemberCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -33,11 +47,12 @@ async def create_member_account(
     1. Generate unique Member ID (GGDS-XXXX format)
     2. Generate secure initial password
     3. Create Member and User records
-    4. Send welcome email with credentials
+    4. Queue welcome email with credentials
     5. Return member details including initial password
     """
     # Check if email already exists
-    existing_user = db.query(User).filter(User.email == member_data.email).first()
+    result = await db.execute(select(User).where(User.email == member_data.email))
+    existing_user = result.scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,7 +60,8 @@ async def create_member_account(
         )
 
     # Check if phone already exists
-    existing_member = db.query(Member).filter(Member.phone == member_data.phone).first()
+    result = await db.execute(select(Member).where(Member.phone == member_data.phone))
+    existing_member = result.scalar_one_or_none()
     if existing_member:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,28 +69,24 @@ async def create_member_account(
         )
 
     # Generate unique member ID
-    member_id = generate_member_id(db)
+    member_id = await generate_member_id(db)
 
     # Generate initial password
     initial_password = generate_initial_password()
 
     # Construct full name
-    full_name_parts = [member_data.first_name]
-    if member_data.middle_name:
-        full_name_parts.append(member_data.middle_name)
-    full_name_parts.append(member_data.surname)
-    full_name = " ".join(full_name_parts)
+    full_name = build_full_name(member_data.first_name, member_data.middle_name, member_data.surname)
 
     # Create User record
     from app.models import UserRole
     new_user = User(
         email=member_data.email,
-        hashed_password=get_password_hash(initial_password),
+        hashed_password=await get_password_hash_async(initial_password),
         is_active=True,
         role=UserRole.MEMBER
     )
     db.add(new_user)
-    db.flush()  # Get user ID without committing
+    await db.flush()  # Get user ID without committing
 
     # Create Member record (PIVOT v2.0: profile_completed=False, is_first_login=True)
     new_member = Member(
@@ -90,18 +102,20 @@ async def create_member_account(
         join_date=date.today()
     )
     db.add(new_member)
-    db.commit()
-    db.refresh(new_member)
 
-    # PIVOT v2.0: Send welcome email with credentials
-    from app.services.email_service import email_service
-    await email_service.send_welcome_email(
+    # PIVOT v2.0: Queue welcome email with credentials
+    queue_email(
+        db,
+        "send_welcome_email",
         to_email=member_data.email,
         member_name=full_name,
         member_id=member_id,
         initial_password=initial_password
     )
 
+    await db.commit()
+    await db.refresh(new_member)
+
     # Return response with initial password (for admin's records)
     return AdminMemberCreateResponse(
         id=new_member.id,
@@ -114,9 +128,38 @@ async def create_member_account(
     )
 
 
+@router.post("/members/import", response_model=MemberImportResponse)
+async def import_members(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Create member accounts in bulk from a CSV file (admin only)
+
+    Columns: first_name, middle_name (optional), surname, phone, email.
+    Rows are validated and inserted in batches; invalid or duplicate rows
+    are reported without stopping the import. Welcome emails are queued in
+    the outbox with each batch.
+
+    Returns a per-row report with the Member ID of each created member.
+    """
+    if not (file.filename or "").lower().endswith(".csv"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload a .csv file"
+        )
+
+    initial_password = generate_initial_password()
+    report = await import_members_from_csv(db, file, initial_password)
+
+    print(f"📥 Member import by {current_user.email}: {report.created} created, {report.failed} failed")
+    return report
+
+
 @router.get("/stats")
 async def get_admin_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user)
 ) -> Dict[str, Any]:
     """
@@ -130,32 +173,34 @@ async def get_admin_stats(
     - Recent activity
     """
     # Member statistics
-    total_members = db.query(Member).count()
-    active_members = db.query(Member).filter(Member.status == "active").count()
-    pending_members = db.query(Member).filter(Member.status == "pending").count()
+    total_members = await db.scalar(select(func.count(Member.id)))
+    active_members = await db.scalar(select(func.count(Member.id)).where(Member.status == "active"))
+    pending_members = await db.scalar(select(func.count(Member.id)).where(Member.status == "pending"))
 
     # Case statistics
-    total_cases = db.query(Case).count()
-    pending_cases = db.query(Case).filter(Case.status == "pending").count()
-    active_cases = db.query(Case).filter(Case.status.in_(["pending", "under_review"])).count()
+    total_cases = await db.scalar(select(func.count(Case.id)))
+    pending_cases = await db.scalar(select(func.count(Case.id)).where(Case.status == "pending"))
+    active_cases = await db.scalar(
+        select(func.count(Case.id)).where(Case.status.in_(["pending", "under_review"]))
+    )
 
-    cases_by_status = dict(
-        db.query(Case.status, func.count(Case.id))
+    result = await db.execute(
+        select(Case.status, func.count(Case.id))
         .group_by(Case.status)
-        .all()
     )
+    cases_by_status = dict(result.all())
 
-    cases_by_type = dict(
-        db.query(Case.case_type, func.count(Case.id))
+    result = await db.execute(
+        select(Case.case_type, func.count(Case.id))
         .group_by(Case.case_type)
-        .all()
     )
+    cases_by_type = dict(result.all())
 
-    cases_by_urgency = dict(
-        db.query(Case.urgency_level, func.count(Case.id))
+    result = await db.execute(
+        select(Case.urgency_level, func.count(Case.id))
         .group_by(Case.urgency_level)
-        .all()
     )
+    cases_by_urgency = dict(result.all())
 
     # TODO: Add amount field to Case model to track disbursements
     # For now, set to 0 as Case model doesn't have amount field
@@ -163,8 +208,12 @@ async def get_admin_stats(
 
     # Recent activity (last 30 days)
     thirty_days_ago = date.today() - timedelta(days=30)
-    recent_cases = db.query(Case).filter(Case.submitted_date >= thirty_days_ago).count()
-    recent_members = db.query(Member).filter(func.date(Member.created_at) >= thirty_days_ago).count()
+    recent_cases = await db.scalar(
+        select(func.count(Case.id)).where(Case.submitted_date >= thirty_days_ago)
+    )
+    recent_members = await db.scalar(
+        select(func.count(Member.id)).where(func.date(Member.created_at) >= thirty_days_ago)
+    )
 
     return {
         # Flat structure for frontend dashboard
@@ -195,7 +244,7 @@ async def get_all_cases(
     urgency: Optional[str] = None,
     sort_by: str = Query("created_at", regex="^(created_at|urgency_level|status)$"),
     order: str = Query("desc", regex="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -206,15 +255,15 @@ async def get_all_cases(
     - Filter by status, type, urgency
     - Sorting by various fields
     """
-    query = db.query(Case)
+    query = select(Case)
 
     # Apply filters
     if status:
-        query = query.filter(Case.status == status)
+        query = query.where(Case.status == status)
     if case_type:
-        query = query.filter(Case.case_type == case_type)
+        query = query.where(Case.case_type == case_type)
     if urgency:
-        query = query.filter(Case.urgency_level == urgency)
+        query = query.where(Case.urgency_level == urgency)
 
     # Apply sorting
     sort_column = getattr(Case, sort_by)
@@ -224,7 +273,8 @@ async def get_all_cases(
         query = query.order_by(sort_column.asc())
 
     # Apply pagination
-    cases = query.offset(skip).limit(limit).all()
+    result = await db.execute(query.offset(skip).limit(limit))
+    cases = result.scalars().all()
 
     return cases
 
@@ -235,7 +285,7 @@ async def get_all_members(
     limit: int = Query(50, ge=1, le=100),
     status: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -246,29 +296,154 @@ async def get_all_members(
     - Filter by status
     - Search by name, email, member ID
     """
-    query = db.query(Member)
+    query = select(Member)
 
     if status:
-        query = query.filter(Member.status == status)
+        query = query.where(Member.status == status)
 
     if search:
         search_pattern = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             (Member.full_name.ilike(search_pattern)) |
             (Member.email.ilike(search_pattern)) |
             (Member.member_id.ilike(search_pattern))
         )
 
-    members = query.order_by(Member.created_at.desc()).offset(skip).limit(limit).all()
+    result = await db.execute(query.order_by(Member.created_at.desc()).offset(skip).limit(limit))
+    members = result.scalars().all()
 
     return members
 
 
+@router.get("/documents", response_model=List[AdminDocumentResponse])
+async def get_all_documents(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    case_id: Optional[str] = None,
+    member_id: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Get uploaded documents (admin only)
+
+    Images link to their thumbnail and downscaled display copy rather than
+    the full-size original; all URLs for the page are signed in one batch.
+    """
+    query = select(Document).where(Document.status == DocumentStatus.UPLOADED)
+
+    if case_id:
+        query = query.join(Case, Case.id == Document.case_id).where(Case.case_id == case_id)
+    if member_id:
+        query = query.where(Document.member_id == member_id)
+
+    result = await db.execute(query.order_by(Document.uploaded_at.desc()).offset(skip).limit(limit))
+    documents = result.scalars().all()
+
+    keys = []
+    for document in documents:
+        keys += [key for key in (document.s3_key, document.display_key, document.thumbnail_key) if key]
+    urls = await upload_service.generate_presigned_urls(keys)
+
+    return [
+        AdminDocumentResponse(
+            id=document.id,
+            case_id=document.case_id,
+            member_id=document.member_id,
+            file_name=document.file_name,
+            file_type=document.file_type,
+            file_size=document.file_size,
+            status=document.status.value,
+            uploaded_at=document.uploaded_at,
+            thumbnail_url=urls.get(document.thumbnail_key),
+            view_url=urls.get(document.display_key) or urls.get(document.s3_key),
+            download_url=urls.get(document.s3_key)
+        )
+        for document in documents
+    ]
+
+
+@router.get("/cases/{case_id}/documents/archive")
+async def download_case_documents(
+    case_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Download all documents of a case as one ZIP archive (admin only)
+
+    The archive is built while it is sent, reading each file from storage
+    chunk by chunk, so the download starts immediately and memory use does
+    not grow with the size of the case.
+    """
+    result = await db.execute(select(Case.id).where(Case.case_id == case_id))
+    case_pk = result.scalar_one_or_none()
+
+    if not case_pk:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found"
+        )
+
+    result = await db.execute(
+        select(Document)
+        .where(Document.case_id == case_pk, Document.status == DocumentStatus.UPLOADED)
+        .order_by(Document.uploaded_at)
+    )
+    documents = result.scalars().all()
+
+    # Resolve everything now: the archive is written after this session is closed
+    chunk_bytes = settings.download_chunk_bytes
+    used_names = set()
+    entries = []
+    for document in documents:
+        if document.local_path:
+            open_file = lambda path=document.local_path: local_storage.iter_chunks(
+                local_storage.key_for_path(path), chunk_bytes
+            )
+        elif document.s3_key:
+            open_file = lambda key=document.s3_key: spaces_storage.iter_chunks(key, chunk_bytes)
+        else:
+            continue
+        entries.append(ZipEntry(
+            name=unique_name(document.file_name, used_names),
+            size=document.file_size,
+            modified=document.uploaded_at,
+            open=open_file
+        ))
+
+    return StreamingResponse(
+        stream_zip(entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{case_id}-documents.zip"'}
+    )
+
+
+@router.post("/storage/gc", response_model=StorageGCReport)
+async def collect_storage_garbage(
+    dry_run: bool = Query(True, description="Only report what would be deleted"),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Delete stale documents and unreferenced stored files now (admin only)
+
+    Runs the same collection as the periodic background job. Defaults to a
+    dry run.
+    """
+    report = await storage_gc.collect(dry_run=dry_run)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Storage garbage collection is already running"
+        )
+    return report
+
+
 @router.patch("/cases/{case_id}/approve", response_model=CaseResponse)
 async def approve_case(
     case_id: str,
     notes: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -276,7 +451,12 @@ async def approve_case(
 
     Sets case status to 'approved' and adds optional reviewer notes.
     """
-    case = db.query(Case).filter(Case.case_id == case_id).first()
+    result = await db.execute(
+        select(Case)
+        .where(Case.case_id == case_id)
+        .options(*CASE_WITH_REPORTER_OPTIONS)
+    )
+    case = result.scalar_one_or_none()
 
     if not case:
         raise HTTPException(
@@ -284,25 +464,27 @@ async def approve_case(
             detail="Case not found"
         )
 
+    reporter = case.reported_by_user
+
     case.status = "approved"
     case.reviewed_date = date.today()
     if notes:
         case.reviewer_notes = notes
 
-    db.commit()
-    db.refresh(case)
-
-    # Send notification email
-    from app.services.email_service import email_service
-    reporter = db.query(User).filter(User.id == case.reported_by_user_id).first()
+    # Queue notification email with the change
     if reporter:
-        await email_service.send_case_status_update(
-            reporter.email,
-            case.case_id,
-            "approved",
-            notes
+        queue_email(
+            db,
+            "send_case_status_update",
+            to_email=reporter.email,
+            case_id=case.case_id,
+            new_status="approved",
+            notes=notes
         )
 
+    await db.commit()
+    await db.refresh(case)
+
     return case
 
 
@@ -310,7 +492,7 @@ async def approve_case(
 async def reject_case(
     case_id: str,
     reason: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -318,7 +500,12 @@ async def reject_case(
 
     Sets case status to 'rejected' and requires a reason.
     """
-    case = db.query(Case).filter(Case.case_id == case_id).first()
+    result = await db.execute(
+        select(Case)
+        .where(Case.case_id == case_id)
+        .options(*CASE_WITH_REPORTER_OPTIONS)
+    )
+    case = result.scalar_one_or_none()
 
     if not case:
         raise HTTPException(
@@ -326,31 +513,192 @@ async def reject_case(
             detail="Case not found"
         )
 
+    reporter = case.reported_by_user
+
     case.status = "rejected"
     case.reviewed_date = date.today()
     case.reviewer_notes = reason
 
-    db.commit()
-    db.refresh(case)
-
-    # Send notification email
-    from app.services.email_service import email_service
-    reporter = db.query(User).filter(User.id == case.reported_by_user_id).first()
+    # Queue notification email with the change
     if reporter:
-        await email_service.send_case_status_update(
-            reporter.email,
-            case.case_id,
-            "rejected",
-            reason
+        queue_email(
+            db,
+            "send_case_status_update",
+            to_email=reporter.email,
+            case_id=case.case_id,
+            new_status="rejected",
+            notes=reason
         )
 
+    await db.commit()
+    await db.refresh(case)
+
     return case
 
 
+async def _broadcast_response(db: AsyncSession, broadcast: EmailBroadcast, case_id: str) -> BroadcastResponse:
+    counts = (await broadcast_counts(db, [broadcast.id]))[broadcast.id]
+    return BroadcastResponse(
+        id=broadcast.id,
+        case_id=case_id,
+        status=broadcast.status,
+        selector=broadcast.selector,
+        sent=counts["sent"],
+        failed=counts["failed"],
+        created_at=broadcast.created_at,
+        completed_at=broadcast.completed_at
+    )
+
+
+async def _get_broadcast(db: AsyncSession, broadcast_id: UUID) -> tuple:
+    result = await db.execute(
+        select(EmailBroadcast, Case.case_id)
+        .join(Case, Case.id == EmailBroadcast.case_id)
+        .where(EmailBroadcast.id == broadcast_id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Broadcast not found"
+        )
+    return row
+
+
+async def _other_broadcast_running(db: AsyncSession, case_pk: UUID, broadcast_id: Optional[UUID] = None) -> bool:
+    """
+    Whether another broadcast for the case is running or waiting to be resumed
+
+    Lock the case row first, so concurrent requests for the same case
+    cannot both see none.
+    """
+    result = await db.execute(
+        select(EmailBroadcast.id)
+        .where(
+            EmailBroadcast.case_id == case_pk,
+            EmailBroadcast.status == BroadcastStatus.RUNNING,
+            EmailBroadcast.id != broadcast_id
+        )
+        .limit(1)
+    )
+    return result.first() is not None
+
+
+@router.post("/cases/{case_id}/broadcast", response_model=BroadcastResponse, status_code=status.HTTP_202_ACCEPTED)
+async def broadcast_contribution_call(
+    case_id: str,
+    broadcast_data: BroadcastCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Email a contribution call for an approved case to selected members (admin only)
+
+    Sending runs in the background at BROADCAST_RATE_PER_SECOND; poll
+    GET /broadcasts/{id} for progress.
+    """
+    if not email_service.configured:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Email service is not configured"
+        )
+
+    # Locked until the broadcast is created
+    result = await db.execute(select(Case).where(Case.case_id == case_id).with_for_update())
+    case = result.scalar_one_or_none()
+    if not case:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found"
+        )
+    if case.status != CaseStatus.APPROVED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Contribution calls can only be sent for approved cases"
+        )
+    if await _other_broadcast_running(db, case.id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A contribution call for this case is already being sent"
+        )
+
+    broadcast = await create_broadcast(db, case, broadcast_data.selector, current_user.id)
+    broadcast_runner.start(broadcast.id)
+
+    return await _broadcast_response(db, broadcast, case.case_id)
+
+
+@router.get("/broadcasts/{broadcast_id}", response_model=BroadcastResponse)
+async def get_broadcast(
+    broadcast_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Get broadcast progress (admin only)"""
+    broadcast, case_id = await _get_broadcast(db, broadcast_id)
+    return await _broadcast_response(db, broadcast, case_id)
+
+
+@router.post("/broadcasts/{broadcast_id}/resume", response_model=BroadcastResponse)
+async def resume_broadcast(
+    broadcast_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Resume a broadcast (admin only)
+
+    Sends to members not yet reached and retries failed recipients.
+    """
+    broadcast, case_id = await _get_broadcast(db, broadcast_id)
+    await db.execute(select(Case.id).where(Case.id == broadcast.case_id).with_for_update())
+    await db.refresh(broadcast)  # A concurrent resume may have committed while we waited
+
+    heartbeat_cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.broadcast_lease_seconds)
+    if broadcast_runner.is_running(broadcast.id) or (
+        broadcast.status == BroadcastStatus.RUNNING
+        and broadcast.heartbeat_at is not None
+        and broadcast.heartbeat_at > heartbeat_cutoff
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Broadcast is already running"
+        )
+    if await _other_broadcast_running(db, broadcast.case_id, broadcast.id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Another contribution call for this case is being sent"
+        )
+
+    broadcast.status = BroadcastStatus.RUNNING
+    broadcast.heartbeat_at = datetime.now(timezone.utc)
+    broadcast.completed_at = None
+    await db.commit()
+    broadcast_runner.start(broadcast.id)
+
+    return await _broadcast_response(db, broadcast, case_id)
+
+
+@router.post("/broadcasts/{broadcast_id}/cancel", response_model=BroadcastResponse)
+async def cancel_broadcast(
+    broadcast_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Stop a running broadcast after its current batch (admin only)"""
+    broadcast, case_id = await _get_broadcast(db, broadcast_id)
+
+    if broadcast.status == BroadcastStatus.RUNNING:
+        broadcast.status = BroadcastStatus.CANCELLED
+        await db.commit()
+
+    return await _broadcast_response(db, broadcast, case_id)
+
+
 @router.patch("/members/{member_id}/activate", response_model=MemberResponse)
 async def activate_member(
     member_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -358,7 +706,8 @@ async def activate_member(
 
     Sets member status to 'active'.
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    member = result.scalar_one_or_none()
 
     if not member:
         raise HTTPException(
@@ -367,8 +716,8 @@ async def activate_member(
         )
 
     member.status = "active"
-    db.commit()
-    db.refresh(member)
+    await db.commit()
+    await db.refresh(member)
 
     return member
 
@@ -376,7 +725,7 @@ async def activate_member(
 @router.patch("/members/{member_id}/suspend", response_model=MemberResponse)
 async def suspend_member(
     member_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -384,7 +733,8 @@ async def suspend_member(
 
     Sets member status to 'suspended'.
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    member = result.scalar_one_or_none()
 
     if not member:
         raise HTTPException(
@@ -393,8 +743,8 @@ async def suspend_member(
         )
 
     member.status = "suspended"
-    db.commit()
-    db.refresh(member)
+    await db.commit()
+    await db.refresh(member)
 
     return member
 
@@ -403,7 +753,7 @@ async def suspend_member(
 async def generate_cases_report(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -412,14 +762,31 @@ async def generate_cases_report(
     Optional date range filtering.
     Returns summary statistics for reporting purposes.
     """
-    query = db.query(Case)
+    query = select(Case)
 
     if start_date:
-        query = query.filter(Case.submitted_date >= start_date)
+        query = query.where(Case.submitted_date >= start_date)
     if end_date:
-        query = query.filter(Case.submitted_date <= end_date)
+        query = query.where(Case.submitted_date <= end_date)
+
+    result = await db.execute(query)
+    cases = result.scalars().all()
+
+    result = await db.execute(
+        select(Case.status, func.count(Case.id))
+        .where(Case.submitted_date >= start_date if start_date else True)
+        .where(Case.submitted_date <= end_date if end_date else True)
+        .group_by(Case.status)
+    )
+    by_status = dict(result.all())
 
-    cases = query.all()
+    result = await db.execute(
+        select(Case.case_type, func.count(Case.id))
+        .where(Case.submitted_date >= start_date if start_date else True)
+        .where(Case.submitted_date <= end_date if end_date else True)
+        .group_by(Case.case_type)
+    )
+    by_type = dict(result.all())
 
     return {
         "period": {
@@ -428,20 +795,8 @@ async def generate_cases_report(
         },
         "total_cases": len(cases),
         "summary": {
-            "by_status": dict(
-                db.query(Case.status, func.count(Case.id))
-                .filter(Case.submitted_date >= start_date if start_date else True)
-                .filter(Case.submitted_date <= end_date if end_date else True)
-                .group_by(Case.status)
-                .all()
-            ),
-            "by_type": dict(
-                db.query(Case.case_type, func.count(Case.id))
-                .filter(Case.submitted_date >= start_date if start_date else True)
-                .filter(Case.submitted_date <= end_date if end_date else True)
-                .group_by(Case.case_type)
-                .all()
-            )
+            "by_status": by_status,
+            "by_type": by_type
         },
         "cases": cases
     }
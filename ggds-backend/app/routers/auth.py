@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models import User, Member, UserRole
 from app.schemas.auth import (
     UserRegister,
@@ -16,8 +17,8 @@ from app.schemas.auth import (
     PasswordChangeResponse
 )
 from app.utils.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     verify_token
@@ -29,7 +30,7 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register(user_data: UserRegister, db: AsyncSession = Depends(get_async_db)):
     """
     Register a new user account
 
@@ -37,7 +38,8 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     Returns JWT access and refresh tokens.
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    existing_user = result.scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,7 +47,7 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
         )
 
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(
         email=user_data.email,
         hashed_password=hashed_password,
@@ -54,8 +56,8 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     # Generate tokens
     access_token = create_access_token(data={"sub": str(new_user.id)})
@@ -75,16 +77,17 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Login with email and password
 
     Returns JWT access and refresh tokens on successful authentication.
     """
     # Find user by email
-    user = db.query(User).filter(User.email == credentials.email).first()
+    result = await db.execute(select(User).where(User.email == credentials.email))
+    user = result.scalar_one_or_none()
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not user or not await verify_password_async(credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -115,7 +118,7 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(token_data: TokenRefresh, db: Session = Depends(get_db)):
+async def refresh_token(token_data: TokenRefresh, db: AsyncSession = Depends(get_async_db)):
     """
     Refresh access token using refresh token
 
@@ -131,7 +134,8 @@ async def refresh_token(token_data: TokenRefresh, db: Session = Depends(get_db))
         )
 
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -161,14 +165,15 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/forgot-password", status_code=status.HTTP_200_OK)
-async def forgot_password(request: PasswordResetRequest, db: Session = Depends(get_db)):
+async def forgot_password(request: PasswordResetRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Request password reset
 
     Sends password reset email to user (if email exists).
     Always returns success to prevent email enumeration.
     """
-    user = db.query(User).filter(User.email == request.email).first()
+    result = await db.execute(select(User).where(User.email == request.email))
+    user = result.scalar_one_or_none()
 
     if user:
         # Generate reset token (expires in 1 hour)
@@ -186,7 +191,7 @@ async def forgot_password(request: PasswordResetRequest, db: Session = Depends(g
 
 
 @router.post("/reset-password", status_code=status.HTTP_200_OK)
-async def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db)):
+async def reset_password(reset_data: PasswordReset, db: AsyncSession = Depends(get_async_db)):
     """
     Reset password using reset token
 
@@ -202,7 +207,8 @@ async def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db
         )
 
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
 
     if not user:
         raise HTTPException(
@@ -211,8 +217,8 @@ async def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db
         )
 
     # Update password
-    user.hashed_password = get_password_hash(reset_data.new_password)
-    db.commit()
+    user.hashed_password = await get_password_hash_async(reset_data.new_password)
+    await db.commit()
 
     return {"message": "Password has been reset successfully"}
 
@@ -221,7 +227,7 @@ async def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db
 @router.post("/change-password", response_model=PasswordChangeResponse)
 async def change_password(
     password_change: PasswordChange,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -232,7 +238,7 @@ async def change_password(
     - Useful after first login with temporary password
     """
     # Verify current password
-    if not verify_password(password_change.current_password, current_user.hashed_password):
+    if not await verify_password_async(password_change.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -246,14 +252,15 @@ async def change_password(
         )
 
     # Update password
-    current_user.hashed_password = get_password_hash(password_change.new_password)
+    current_user.hashed_password = await get_password_hash_async(password_change.new_password)
 
     # Mark first login as false if this was a password change
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
+    result = await db.execute(select(Member).where(Member.user_id == current_user.id))
+    member = result.scalar_one_or_none()
     if member and member.is_first_login:
         member.is_first_login = False
 
-    db.commit()
+    await db.commit()
 
     return PasswordChangeResponse(
         success=True,
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models import User, Case, Member
 from app.schemas.case import (
     CaseCreate,
@@ -13,8 +14,9 @@ from app.schemas.case import (
     CaseListResponse
 )
 from app.utils.dependencies import get_current_user, get_current_admin_user
+from app.utils.loaders import CASE_DETAIL_OPTIONS, CASE_WITH_REPORTER_OPTIONS
 from app.services.case_service import create_case_report
-from app.services.email_service import email_service
+from app.services.email_outbox import queue_email
 
 router = APIRouter()
 
@@ -22,7 +24,7 @@ router = APIRouter()
 @router.post("", response_model=CaseDetailResponse, status_code=status.HTTP_201_CREATED)
 async def submit_case(
     case_data: CaseCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -30,27 +32,12 @@ async def submit_case(
 
     - Creates case with all details
     - Adds verification contacts (village elder, chiefs, referee)
-    - Sends confirmation email to reporter
-    - Notifies admin of new case
+    - Queues confirmation email to reporter
+    - Queues admin notification of new case
     """
     try:
-        # Create case
-        new_case = create_case_report(db, current_user, case_data)
-
-        # Send confirmation email to user
-        await email_service.send_case_confirmation(
-            current_user.email,
-            new_case.case_id,
-            new_case.case_type
-        )
-
-        # Notify admin of new case
-        await email_service.send_admin_notification(
-            new_case.case_id,
-            new_case.case_type,
-            new_case.affected_member_name,
-            new_case.urgency_level
-        )
+        # Create case (queues the emails in the same transaction)
+        new_case = await create_case_report(db, current_user, case_data)
 
         return new_case
 
@@ -68,7 +55,7 @@ async def list_cases(
     status: Optional[str] = None,
     case_type: Optional[str] = None,
     urgency: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -79,25 +66,26 @@ async def list_cases(
     - Supports filtering by status, type, urgency
     - Paginated results
     """
-    query = db.query(Case)
+    query = select(Case)
 
     # Regular users can only see their own cases
     if current_user.role != "admin":
-        query = query.filter(Case.reported_by_user_id == current_user.id)
+        query = query.where(Case.reported_by_user_id == current_user.id)
 
     # Filters
     if status:
-        query = query.filter(Case.status == status)
+        query = query.where(Case.status == status)
     if case_type:
-        query = query.filter(Case.case_type == case_type)
+        query = query.where(Case.case_type == case_type)
     if urgency:
-        query = query.filter(Case.urgency_level == urgency)
+        query = query.where(Case.urgency_level == urgency)
 
     # Get total count
-    total = query.count()
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
     # Apply pagination
-    cases = query.order_by(Case.created_at.desc()).offset(skip).limit(limit).all()
+    result = await db.execute(query.order_by(Case.created_at.desc()).offset(skip).limit(limit))
+    cases = result.scalars().all()
 
     return {
         "cases": cases,
@@ -110,7 +98,7 @@ async def list_cases(
 @router.get("/{case_id}", response_model=CaseDetailResponse)
 async def get_case(
     case_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -119,7 +107,12 @@ async def get_case(
     Returns complete case information including verification contacts.
     Users can only view their own cases unless they are admin.
     """
-    case = db.query(Case).filter(Case.case_id == case_id).first()
+    result = await db.execute(
+        select(Case)
+        .where(Case.case_id == case_id)
+        .options(*CASE_DETAIL_OPTIONS)
+    )
+    case = result.scalar_one_or_none()
 
     if not case:
         raise HTTPException(
@@ -141,7 +134,7 @@ async def get_case(
 async def update_case(
     case_id: str,
     case_update: CaseUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -150,7 +143,8 @@ async def update_case(
     Users can update their own pending cases.
     Admins can update any case.
     """
-    case = db.query(Case).filter(Case.case_id == case_id).first()
+    result = await db.execute(select(Case).where(Case.case_id == case_id))
+    case = result.scalar_one_or_none()
 
     if not case:
         raise HTTPException(
@@ -177,8 +171,8 @@ async def update_case(
     for field, value in update_data.items():
         setattr(case, field, value)
 
-    db.commit()
-    db.refresh(case)
+    await db.commit()
+    await db.refresh(case)
 
     return case
 
@@ -187,7 +181,7 @@ async def update_case(
 async def update_case_status(
     case_id: str,
     status_update: CaseStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -198,7 +192,12 @@ async def update_case_status(
     - Sets reviewed date
     - Sends status update email to case reporter
     """
-    case = db.query(Case).filter(Case.case_id == case_id).first()
+    result = await db.execute(
+        select(Case)
+        .where(Case.case_id == case_id)
+        .options(*CASE_WITH_REPORTER_OPTIONS)
+    )
+    case = result.scalar_one_or_none()
 
     if not case:
         raise HTTPException(
@@ -206,6 +205,8 @@ async def update_case_status(
             detail="Case not found"
         )
 
+    reporter = case.reported_by_user
+
     # Update status and notes
     case.status = status_update.status
     if status_update.reviewer_notes:
@@ -226,26 +227,27 @@ async def update_case_status(
         case.start_date = date.today() + timedelta(days=1)  # Starts tomorrow
         case.due_date = case.start_date + timedelta(days=case.duration_days)
 
-    db.commit()
-    db.refresh(case)
-
-    # Send status update email
-    reporter = db.query(User).filter(User.id == case.reported_by_user_id).first()
+    # Queue status update email with the change
     if reporter:
-        await email_service.send_case_status_update(
-            reporter.email,
-            case.case_id,
-            case.status,
-            case.reviewer_notes
+        queue_email(
+            db,
+            "send_case_status_update",
+            to_email=reporter.email,
+            case_id=case.case_id,
+            new_status=case.status,
+            notes=case.reviewer_notes
         )
 
+    await db.commit()
+    await db.refresh(case)
+
     return case
 
 
 @router.delete("/{case_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_case(
     case_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -254,7 +256,8 @@ async def delete_case(
     - Users can delete their own pending cases
     - Admins can delete any case
     """
-    case = db.query(Case).filter(Case.case_id == case_id).first()
+    result = await db.execute(select(Case).where(Case.case_id == case_id))
+    case = result.scalar_one_or_none()
 
     if not case:
         raise HTTPException(
@@ -276,7 +279,7 @@ async def delete_case(
             detail="Can only delete pending cases"
         )
 
-    db.delete(case)
-    db.commit()
+    await db.delete(case)
+    await db.commit()
 
     return None
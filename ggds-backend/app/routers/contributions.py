@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, extract, select
 from typing import List, Optional
 from datetime import date, datetime
 from decimal import Decimal
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models import User, Member, Contribution
 from app.schemas.contribution import (
     ContributionCreate,
@@ -16,7 +16,7 @@ from app.schemas.contribution import (
     ContributionStats,
     ContributionListResponse
 )
-from app.utils.dependencies import get_current_user, get_current_admin_user
+from app.utils.dependencies import get_current_user, get_current_admin_user, get_optional_current_member
 
 router = APIRouter()
 
@@ -24,7 +24,7 @@ router = APIRouter()
 @router.post("", response_model=ContributionResponse, status_code=status.HTTP_201_CREATED)
 async def record_contribution(
     contribution_data: ContributionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -33,7 +33,8 @@ async def record_contribution(
     Creates a new contribution record for a member.
     """
     # Verify member exists
-    member = db.query(Member).filter(Member.member_id == contribution_data.member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == contribution_data.member_id))
+    member = result.scalar_one_or_none()
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -52,8 +53,8 @@ async def record_contribution(
     )
 
     db.add(new_contribution)
-    db.commit()
-    db.refresh(new_contribution)
+    await db.commit()
+    await db.refresh(new_contribution)
 
     return new_contribution
 
@@ -67,7 +68,7 @@ async def list_contributions(
     payment_method: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -77,25 +78,28 @@ async def list_contributions(
     - Pagination
     - Filter by member, status, payment method, date range
     """
-    query = db.query(Contribution)
+    query = select(Contribution)
 
     # Apply filters
     if member_id:
-        query = query.filter(Contribution.member_id == member_id)
+        query = query.where(Contribution.member_id == member_id)
     if status:
-        query = query.filter(Contribution.status == status)
+        query = query.where(Contribution.status == status)
     if payment_method:
-        query = query.filter(Contribution.payment_method == payment_method)
+        query = query.where(Contribution.payment_method == payment_method)
     if start_date:
-        query = query.filter(Contribution.payment_date >= start_date)
+        query = query.where(Contribution.payment_date >= start_date)
     if end_date:
-        query = query.filter(Contribution.payment_date <= end_date)
+        query = query.where(Contribution.payment_date <= end_date)
 
     # Get total count
-    total = query.count()
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
     # Apply pagination and ordering
-    contributions = query.order_by(Contribution.payment_date.desc()).offset(skip).limit(limit).all()
+    result = await db.execute(
+        query.order_by(Contribution.payment_date.desc()).offset(skip).limit(limit)
+    )
+    contributions = result.scalars().all()
 
     return {
         "contributions": contributions,
@@ -108,8 +112,9 @@ async def list_contributions(
 @router.get("/member/{member_id}", response_model=List[ContributionResponse])
 async def get_member_contributions(
     member_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    user_member: Optional[Member] = Depends(get_optional_current_member)
 ):
     """
     Get contribution history for a specific member
@@ -118,7 +123,8 @@ async def get_member_contributions(
     Admins can view any member's contributions.
     """
     # Verify member exists
-    member = db.query(Member).filter(Member.member_id == member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    member = result.scalar_one_or_none()
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -127,16 +133,18 @@ async def get_member_contributions(
 
     # Check authorization (own profile or admin)
     if current_user.role != "admin":
-        user_member = db.query(Member).filter(Member.user_id == current_user.id).first()
         if not user_member or user_member.member_id != member_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to view this member's contributions"
             )
 
-    contributions = db.query(Contribution).filter(
-        Contribution.member_id == member_id
-    ).order_by(Contribution.payment_date.desc()).all()
+    result = await db.execute(
+        select(Contribution)
+        .where(Contribution.member_id == member_id)
+        .order_by(Contribution.payment_date.desc())
+    )
+    contributions = result.scalars().all()
 
     return contributions
 
@@ -144,14 +152,16 @@ async def get_member_contributions(
 @router.get("/member/{member_id}/summary", response_model=MemberContributionSummary)
 async def get_member_contribution_summary(
     member_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    user_member: Optional[Member] = Depends(get_optional_current_member)
 ):
     """
     Get contribution summary for a specific member
     """
     # Verify member exists
-    member = db.query(Member).filter(Member.member_id == member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    member = result.scalar_one_or_none()
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -160,7 +170,6 @@ async def get_member_contribution_summary(
 
     # Check authorization
     if current_user.role != "admin":
-        user_member = db.query(Member).filter(Member.user_id == current_user.id).first()
         if not user_member or user_member.member_id != member_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -168,7 +177,8 @@ async def get_member_contribution_summary(
             )
 
     # Calculate summary
-    contributions = db.query(Contribution).filter(Contribution.member_id == member_id).all()
+    result = await db.execute(select(Contribution).where(Contribution.member_id == member_id))
+    contributions = result.scalars().all()
 
     total_contributions = sum(c.amount for c in contributions)
     pending_amount = sum(c.amount for c in contributions if c.status == "pending")
@@ -190,7 +200,7 @@ async def get_member_contribution_summary(
 async def get_contribution_stats(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -198,15 +208,16 @@ async def get_contribution_stats(
 
     Returns overall contribution statistics with optional date range filtering.
     """
-    query = db.query(Contribution)
+    query = select(Contribution)
 
     # Apply date filters
     if start_date:
-        query = query.filter(Contribution.payment_date >= start_date)
+        query = query.where(Contribution.payment_date >= start_date)
     if end_date:
-        query = query.filter(Contribution.payment_date <= end_date)
+        query = query.where(Contribution.payment_date <= end_date)
 
-    contributions = query.all()
+    result = await db.execute(query)
+    contributions = result.scalars().all()
 
     # Calculate statistics
     total_collected = sum(c.amount for c in contributions)
@@ -256,7 +267,7 @@ async def get_contribution_stats(
 async def verify_contribution(
     contribution_id: str,
     verify_data: ContributionVerify,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -264,7 +275,8 @@ async def verify_contribution(
 
     Sets contribution status to 'verified' or 'rejected' and records admin who verified.
     """
-    contribution = db.query(Contribution).filter(Contribution.id == contribution_id).first()
+    result = await db.execute(select(Contribution).where(Contribution.id == contribution_id))
+    contribution = result.scalar_one_or_none()
 
     if not contribution:
         raise HTTPException(
@@ -280,8 +292,8 @@ async def verify_contribution(
     if verify_data.notes:
         contribution.notes = f"{contribution.notes}\n\n[Admin notes]: {verify_data.notes}" if contribution.notes else f"[Admin notes]: {verify_data.notes}"
 
-    db.commit()
-    db.refresh(contribution)
+    await db.commit()
+    await db.refresh(contribution)
 
     return contribution
 
@@ -290,7 +302,7 @@ async def verify_contribution(
 async def update_contribution(
     contribution_id: str,
     update_data: ContributionUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -298,7 +310,8 @@ async def update_contribution(
 
     Only pending contributions can be updated.
     """
-    contribution = db.query(Contribution).filter(Contribution.id == contribution_id).first()
+    result = await db.execute(select(Contribution).where(Contribution.id == contribution_id))
+    contribution = result.scalar_one_or_none()
 
     if not contribution:
         raise HTTPException(
@@ -317,8 +330,8 @@ async def update_contribution(
     for field, value in update_dict.items():
         setattr(contribution, field, value)
 
-    db.commit()
-    db.refresh(contribution)
+    await db.commit()
+    await db.refresh(contribution)
 
     return contribution
 
@@ -326,7 +339,7 @@ async def update_contribution(
 @router.delete("/{contribution_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contribution(
     contribution_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -334,7 +347,8 @@ async def delete_contribution(
 
     Only pending contributions can be deleted.
     """
-    contribution = db.query(Contribution).filter(Contribution.id == contribution_id).first()
+    result = await db.execute(select(Contribution).where(Contribution.id == contribution_id))
+    contribution = result.scalar_one_or_none()
 
     if not contribution:
         raise HTTPException(
@@ -348,7 +362,7 @@ async def delete_contribution(
             detail="Can only delete pending contributions"
         )
 
-    db.delete(contribution)
-    db.commit()
+    await db.delete(contribution)
+    await db.commit()
 
     return None
@@ -4,13 +4,13 @@ from typing import List
 from uuid import UUID
 
 from app.database import get_db
-from app.models import User, Member, CoveredPerson
+from app.models import Member, CoveredPerson
 from app.schemas.covered_person import (
     CoveredPersonCreate,
     CoveredPersonUpdate,
     CoveredPersonResponse
 )
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_current_member
 
 router = APIRouter()
 
@@ -19,22 +19,13 @@ router = APIRouter()
 async def add_covered_person(
     covered_person_data: CoveredPersonCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    member: Member = Depends(get_current_member)
 ):
     """
     Add a covered person (insured individual)
 
     Members can add covered persons to their profile.
     """
-    # Get member for current user
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Member profile not found"
-        )
-
     # Create covered person
     covered_person = CoveredPerson(
         member_id=member.id,
@@ -54,22 +45,13 @@ async def add_covered_person(
 @router.get("", response_model=List[CoveredPersonResponse])
 async def list_covered_persons(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    member: Member = Depends(get_current_member)
 ):
     """
     List all covered persons for the current member
 
     Returns all insured individuals registered under the member's profile.
     """
-    # Get member for current user
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Member profile not found"
-        )
-
     covered_persons = db.query(CoveredPerson).filter(
         CoveredPerson.member_id == member.id
     ).all()
@@ -81,22 +63,13 @@ async def list_covered_persons(
 async def get_covered_person(
     covered_person_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    member: Member = Depends(get_current_member)
 ):
     """
     Get details of a specific covered person
 
     Members can only view their own covered persons.
     """
-    # Get member for current user
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Member profile not found"
-        )
-
     covered_person = db.query(CoveredPerson).filter(
         CoveredPerson.id == covered_person_id,
         CoveredPerson.member_id == member.id
@@ -116,22 +89,13 @@ async def update_covered_person(
     covered_person_id: UUID,
     update_data: CoveredPersonUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    member: Member = Depends(get_current_member)
 ):
     """
     Update a covered person's information
 
     Members can update their own covered persons.
     """
-    # Get member for current user
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Member profile not found"
-        )
-
     covered_person = db.query(CoveredPerson).filter(
         CoveredPerson.id == covered_person_id,
         CoveredPerson.member_id == member.id
@@ -158,22 +122,13 @@ async def update_covered_person(
 async def delete_covered_person(
     covered_person_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    member: Member = Depends(get_current_member)
 ):
     """
     Delete a covered person
 
     Members can remove covered persons from their profile.
     """
-    # Get member for current user
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Member profile not found"
-        )
-
     covered_person = db.query(CoveredPerson).filter(
         CoveredPerson.id == covered_person_id,
         CoveredPerson.member_id == member.id
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from typing import Dict, Any, Optional
 
-from app.database import get_db
+from app.database import get_async_db, get_read_db
 from app.models import User, Member, Case
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_current_user, get_optional_current_member
+from app.utils.loaders import MEMBER_DETAIL_OPTIONS
 from app.schemas.member import MemberDetailResponse
 from app.schemas.case import CaseResponse
 
@@ -14,8 +15,9 @@ router = APIRouter()
 
 @router.get("/stats")
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+    member: Optional[Member] = Depends(get_optional_current_member)
 ) -> Dict[str, Any]:
     """
     Get dashboard statistics for current user
@@ -26,9 +28,6 @@ async def get_dashboard_stats(
     - Recent cases
     - Member information
     """
-    # Get member info
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
     if not member:
         return {
             "has_member_profile": False,
@@ -36,23 +35,25 @@ async def get_dashboard_stats(
         }
 
     # Get case statistics
-    total_cases = db.query(Case).filter(Case.reported_by_user_id == current_user.id).count()
+    total_cases = await db.scalar(
+        select(func.count(Case.id)).where(Case.reported_by_user_id == current_user.id)
+    )
 
-    cases_by_status = dict(
-        db.query(Case.status, func.count(Case.id))
-        .filter(Case.reported_by_user_id == current_user.id)
+    result = await db.execute(
+        select(Case.status, func.count(Case.id))
+        .where(Case.reported_by_user_id == current_user.id)
         .group_by(Case.status)
-        .all()
     )
+    cases_by_status = dict(result.all())
 
     # Get recent cases (last 5)
-    recent_cases = (
-        db.query(Case)
-        .filter(Case.reported_by_user_id == current_user.id)
+    result = await db.execute(
+        select(Case)
+        .where(Case.reported_by_user_id == current_user.id)
         .order_by(Case.created_at.desc())
         .limit(5)
-        .all()
     )
+    recent_cases = result.scalars().all()
 
     return {
         "has_member_profile": True,
@@ -82,7 +83,7 @@ async def get_dashboard_stats(
 
 @router.get("/profile", response_model=MemberDetailResponse)
 async def get_dashboard_profile(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -90,7 +91,12 @@ async def get_dashboard_profile(
 
     Returns detailed member information including family and next of kin.
     """
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
+    result = await db.execute(
+        select(Member)
+        .where(Member.user_id == current_user.id)
+        .options(*MEMBER_DETAIL_OPTIONS)
+    )
+    member = result.scalar_one_or_none()
 
     if not member:
         raise HTTPException(
@@ -103,7 +109,7 @@ async def get_dashboard_profile(
 
 @router.get("/cases")
 async def get_dashboard_cases(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -112,12 +118,12 @@ async def get_dashboard_cases(
     Returns all cases submitted by the authenticated user,
     sorted by most recent first.
     """
-    cases = (
-        db.query(Case)
-        .filter(Case.reported_by_user_id == current_user.id)
+    result = await db.execute(
+        select(Case)
+        .where(Case.reported_by_user_id == current_user.id)
         .order_by(Case.created_at.desc())
-        .all()
     )
+    cases = result.scalars().all()
 
     return {
         "total": len(cases),
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models import User, Member, FamilyMember, NextOfKin, CoveredPerson
 from app.models.member import MemberStatus
 from app.models.family_member import FamilyType
@@ -14,9 +16,9 @@ from app.schemas.member import (
     ProfileCompletionData,
     ProfileCompletionResponse
 )
-from app.utils.dependencies import get_current_user, get_current_admin_user
+from app.utils.dependencies import get_current_user, get_current_admin_user, get_optional_current_member
+from app.utils.loaders import MEMBER_DETAIL_OPTIONS
 from app.services.member_service import create_member_registration
-from app.services.email_service import email_service
 
 router = APIRouter()
 
@@ -35,7 +37,7 @@ async def register_member(
     - Adds siblings (up to 15)
     - Adds next of kin contacts (2 required)
     - Generates unique member ID (GGDS-YYYY-XXX)
-    - Sends welcome email
+    - Queues welcome email
     """
     # Check if user already has a member profile
     existing_member = db.query(Member).filter(Member.user_id == current_user.id).first()
@@ -45,16 +47,9 @@ async def register_member(
             detail="User already has a member profile"
         )
 
-    # Create member registration
+    # Create member registration (queues the welcome email)
     new_member = create_member_registration(db, current_user, member_data)
 
-    # Send welcome email
-    await email_service.send_welcome_email(
-        new_member.email,
-        new_member.full_name,
-        new_member.member_id
-    )
-
     return new_member
 
 
@@ -107,7 +102,12 @@ async def get_member(
     Returns complete member information including family and next of kin.
     Users can only view their own profile unless they are admin.
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
+    member = (
+        db.query(Member)
+        .options(*MEMBER_DETAIL_OPTIONS)
+        .filter(Member.member_id == member_id)
+        .first()
+    )
 
     if not member:
         raise HTTPException(
@@ -135,7 +135,12 @@ async def get_my_profile(
 
     Returns complete member information for the authenticated user.
     """
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
+    member = (
+        db.query(Member)
+        .options(*MEMBER_DETAIL_OPTIONS)
+        .filter(Member.user_id == current_user.id)
+        .first()
+    )
 
     if not member:
         raise HTTPException(
@@ -215,8 +220,8 @@ async def delete_member(
 @router.post("/complete-profile", response_model=ProfileCompletionResponse)
 async def complete_member_profile(
     profile_data: ProfileCompletionData,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    member: Optional[Member] = Depends(get_optional_current_member)
 ):
     """
     Complete member profile after first login (PIVOT v2.0 flow)
@@ -229,15 +234,23 @@ async def complete_member_profile(
     - Locks profile data as immutable JSON
     - Activates member status
     """
-    # Get existing member record (created by admin)
-    member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
+    # Existing member record (created by admin), loaded with the current user
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member record not found. Please contact administrator."
         )
 
+    # The principal may come from the user cache; re-read and lock the row so
+    # concurrent submissions see each other's result
+    result = await db.execute(
+        select(Member)
+        .where(Member.id == member.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    member = result.scalar_one()
+
     # Check if profile already completed
     if member.profile_completed:
         raise HTTPException(
@@ -312,8 +325,7 @@ async def complete_member_profile(
     member.is_first_login = False
     member.status = MemberStatus.ACTIVE
 
-    db.commit()
-    db.refresh(member)
+    await db.commit()
 
     return ProfileCompletionResponse(
         success=True,
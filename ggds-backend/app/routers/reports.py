@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, extract, select
 from typing import Dict, Any, List, Optional
 from datetime import date, datetime, timedelta
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models import User, Member, Case, Contribution
 from app.utils.dependencies import get_current_admin_user
 
@@ -15,7 +15,7 @@ router = APIRouter()
 async def get_member_reports(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user)
 ) -> Dict[str, Any]:
     """
@@ -33,21 +33,24 @@ async def get_member_reports(
         start_date = end_date - timedelta(days=365)
 
     # Total members by status
-    status_distribution = dict(
-        db.query(Member.status, func.count(Member.id))
+    result = await db.execute(
+        select(Member.status, func.count(Member.id))
         .group_by(Member.status)
-        .all()
     )
+    status_distribution = dict(result.all())
 
     # Registration trends by month (last 12 months)
-    monthly_registrations = db.query(
-        extract('year', Member.join_date).label('year'),
-        extract('month', Member.join_date).label('month'),
-        func.count(Member.id).label('count')
-    ).filter(
-        Member.join_date >= start_date,
-        Member.join_date <= end_date
-    ).group_by('year', 'month').order_by('year', 'month').all()
+    result = await db.execute(
+        select(
+            extract('year', Member.join_date).label('year'),
+            extract('month', Member.join_date).label('month'),
+            func.count(Member.id).label('count')
+        ).where(
+            Member.join_date >= start_date,
+            Member.join_date <= end_date
+        ).group_by('year', 'month').order_by('year', 'month')
+    )
+    monthly_registrations = result.all()
 
     registration_trends = [
         {
@@ -59,9 +62,12 @@ async def get_member_reports(
 
     # Recent registrations (last 30 days)
     thirty_days_ago = date.today() - timedelta(days=30)
-    recent_members = db.query(Member).filter(
-        Member.join_date >= thirty_days_ago
-    ).order_by(Member.join_date.desc()).limit(10).all()
+    result = await db.execute(
+        select(Member).where(
+            Member.join_date >= thirty_days_ago
+        ).order_by(Member.join_date.desc()).limit(10)
+    )
+    recent_members = result.scalars().all()
 
     recent_registrations = [
         {
@@ -75,10 +81,10 @@ async def get_member_reports(
     ]
 
     # Total counts
-    total_members = db.query(Member).count()
-    active_members = db.query(Member).filter(Member.status == "active").count()
-    pending_members = db.query(Member).filter(Member.status == "pending").count()
-    suspended_members = db.query(Member).filter(Member.status == "suspended").count()
+    total_members = await db.scalar(select(func.count(Member.id)))
+    active_members = await db.scalar(select(func.count(Member.id)).where(Member.status == "active"))
+    pending_members = await db.scalar(select(func.count(Member.id)).where(Member.status == "pending"))
+    suspended_members = await db.scalar(select(func.count(Member.id)).where(Member.status == "suspended"))
 
     return {
         "summary": {
@@ -98,7 +104,7 @@ async def get_member_reports(
 async def get_case_reports(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user)
 ) -> Dict[str, Any]:
     """
@@ -116,35 +122,38 @@ async def get_case_reports(
         start_date = end_date - timedelta(days=365)
 
     # Cases by status
-    cases_by_status = dict(
-        db.query(Case.status, func.count(Case.id))
+    result = await db.execute(
+        select(Case.status, func.count(Case.id))
         .group_by(Case.status)
-        .all()
     )
+    cases_by_status = dict(result.all())
 
     # Cases by type
-    cases_by_type = dict(
-        db.query(Case.case_type, func.count(Case.id))
+    result = await db.execute(
+        select(Case.case_type, func.count(Case.id))
         .group_by(Case.case_type)
-        .all()
     )
+    cases_by_type = dict(result.all())
 
     # Cases by urgency
-    cases_by_urgency = dict(
-        db.query(Case.urgency_level, func.count(Case.id))
+    result = await db.execute(
+        select(Case.urgency_level, func.count(Case.id))
         .group_by(Case.urgency_level)
-        .all()
     )
+    cases_by_urgency = dict(result.all())
 
     # Monthly submission trends
-    monthly_submissions = db.query(
-        extract('year', Case.submitted_date).label('year'),
-        extract('month', Case.submitted_date).label('month'),
-        func.count(Case.id).label('count')
-    ).filter(
-        Case.submitted_date >= start_date,
-        Case.submitted_date <= end_date
-    ).group_by('year', 'month').order_by('year', 'month').all()
+    result = await db.execute(
+        select(
+            extract('year', Case.submitted_date).label('year'),
+            extract('month', Case.submitted_date).label('month'),
+            func.count(Case.id).label('count')
+        ).where(
+            Case.submitted_date >= start_date,
+            Case.submitted_date <= end_date
+        ).group_by('year', 'month').order_by('year', 'month')
+    )
+    monthly_submissions = result.all()
 
     submission_trends = [
         {
@@ -156,9 +165,12 @@ async def get_case_reports(
 
     # Recent cases (last 30 days)
     thirty_days_ago = date.today() - timedelta(days=30)
-    recent_cases = db.query(Case).filter(
-        Case.submitted_date >= thirty_days_ago
-    ).order_by(Case.submitted_date.desc()).limit(10).all()
+    result = await db.execute(
+        select(Case).where(
+            Case.submitted_date >= thirty_days_ago
+        ).order_by(Case.submitted_date.desc()).limit(10)
+    )
+    recent_cases = result.scalars().all()
 
     recent_cases_list = [
         {
@@ -172,10 +184,10 @@ async def get_case_reports(
     ]
 
     # Total counts
-    total_cases = db.query(Case).count()
-    pending_cases = db.query(Case).filter(Case.status == "pending").count()
-    approved_cases = db.query(Case).filter(Case.status == "approved").count()
-    rejected_cases = db.query(Case).filter(Case.status == "rejected").count()
+    total_cases = await db.scalar(select(func.count(Case.id)))
+    pending_cases = await db.scalar(select(func.count(Case.id)).where(Case.status == "pending"))
+    approved_cases = await db.scalar(select(func.count(Case.id)).where(Case.status == "approved"))
+    rejected_cases = await db.scalar(select(func.count(Case.id)).where(Case.status == "rejected"))
 
     return {
         "summary": {
@@ -197,7 +209,7 @@ async def get_case_reports(
 async def get_financial_reports(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user)
 ) -> Dict[str, Any]:
     """
@@ -216,47 +228,50 @@ async def get_financial_reports(
         start_date = end_date - timedelta(days=365)
 
     # Total contributions
-    total_collected = db.query(func.sum(Contribution.amount)).scalar() or 0
-    total_verified = db.query(func.sum(Contribution.amount)).filter(
+    total_collected = await db.scalar(select(func.sum(Contribution.amount))) or 0
+    total_verified = await db.scalar(select(func.sum(Contribution.amount)).where(
         Contribution.status == "verified"
-    ).scalar() or 0
-    total_pending = db.query(func.sum(Contribution.amount)).filter(
+    )) or 0
+    total_pending = await db.scalar(select(func.sum(Contribution.amount)).where(
         Contribution.status == "pending"
-    ).scalar() or 0
-    total_rejected = db.query(func.sum(Contribution.amount)).filter(
+    )) or 0
+    total_rejected = await db.scalar(select(func.sum(Contribution.amount)).where(
         Contribution.status == "rejected"
-    ).scalar() or 0
+    )) or 0
 
     # Contribution counts
-    contribution_count = db.query(Contribution).count()
-    verified_count = db.query(Contribution).filter(Contribution.status == "verified").count()
-    pending_count = db.query(Contribution).filter(Contribution.status == "pending").count()
+    contribution_count = await db.scalar(select(func.count(Contribution.id)))
+    verified_count = await db.scalar(select(func.count(Contribution.id)).where(Contribution.status == "verified"))
+    pending_count = await db.scalar(select(func.count(Contribution.id)).where(Contribution.status == "pending"))
 
     # Payment method distribution
-    payment_methods = dict(
-        db.query(Contribution.payment_method, func.count(Contribution.id))
+    result = await db.execute(
+        select(Contribution.payment_method, func.count(Contribution.id))
         .group_by(Contribution.payment_method)
-        .all()
     )
+    payment_methods = dict(result.all())
 
-    payment_method_amounts = dict(
-        db.query(Contribution.payment_method, func.sum(Contribution.amount))
-        .filter(Contribution.status == "verified")
+    result = await db.execute(
+        select(Contribution.payment_method, func.sum(Contribution.amount))
+        .where(Contribution.status == "verified")
         .group_by(Contribution.payment_method)
-        .all()
     )
+    payment_method_amounts = dict(result.all())
 
     # Monthly collection trends
-    monthly_collections = db.query(
-        extract('year', Contribution.payment_date).label('year'),
-        extract('month', Contribution.payment_date).label('month'),
-        func.sum(Contribution.amount).label('total'),
-        func.count(Contribution.id).label('count')
-    ).filter(
-        Contribution.payment_date >= start_date,
-        Contribution.payment_date <= end_date,
-        Contribution.status == "verified"
-    ).group_by('year', 'month').order_by('year', 'month').all()
+    result = await db.execute(
+        select(
+            extract('year', Contribution.payment_date).label('year'),
+            extract('month', Contribution.payment_date).label('month'),
+            func.sum(Contribution.amount).label('total'),
+            func.count(Contribution.id).label('count')
+        ).where(
+            Contribution.payment_date >= start_date,
+            Contribution.payment_date <= end_date,
+            Contribution.status == "verified"
+        ).group_by('year', 'month').order_by('year', 'month')
+    )
+    monthly_collections = result.all()
 
     collection_trends = [
         {
@@ -268,15 +283,18 @@ async def get_financial_reports(
     ]
 
     # Top contributors
-    top_contributors = db.query(
-        Contribution.member_id,
-        func.sum(Contribution.amount).label('total_contributed'),
-        func.count(Contribution.id).label('contribution_count')
-    ).filter(
-        Contribution.status == "verified"
-    ).group_by(Contribution.member_id).order_by(
-        func.sum(Contribution.amount).desc()
-    ).limit(10).all()
+    result = await db.execute(
+        select(
+            Contribution.member_id,
+            func.sum(Contribution.amount).label('total_contributed'),
+            func.count(Contribution.id).label('contribution_count')
+        ).where(
+            Contribution.status == "verified"
+        ).group_by(Contribution.member_id).order_by(
+            func.sum(Contribution.amount).desc()
+        ).limit(10)
+    )
+    top_contributors = result.all()
 
     top_contributors_list = [
         {
@@ -1,31 +1,131 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
+import os
+from typing import List, Optional, Tuple
+from uuid import UUID
 
-from app.database import get_db
-from app.models import User, Document
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import get_async_db
+from app.models import User, Case, Member, Document, DocumentStatus
+from app.schemas.document import PresignedUploadRequest, PresignedUploadResponse, UploadCompleteRequest
 from app.utils.dependencies import get_current_user
-from app.services.upload_service import upload_service
+from app.services.upload_service import UploadRejected, upload_service
+from app.services.image_service import image_processor, is_processable
+from app.services.storage import local_storage, spaces_storage
 
 router = APIRouter()
 
 
+async def _resolve_links(
+    db: AsyncSession,
+    case_id: Optional[str],
+    member_id: Optional[str],
+    current_user: User
+) -> Tuple[Optional[UUID], Optional[UUID]]:
+    """
+    Look up the case and member an upload belongs to
+
+    Users can attach files to cases they reported and to their own member
+    record; admins to any case or member.
+
+    Args:
+        db: Database session
+        case_id: Case ID (e.g. CASE-001), if any
+        member_id: Member ID (e.g. GGDS-0001), if any
+        current_user: Uploading user
+
+    Returns:
+        Tuple of (case primary key or None, member primary key or None)
+
+    Raises:
+        HTTPException: 404 if the case or member does not exist, 403 if the
+            user may not attach files to it
+    """
+    is_admin = current_user.role == "admin"
+    case_pk = member_pk = None
+
+    if case_id:
+        result = await db.execute(
+            select(Case.id, Case.reported_by_user_id).where(Case.case_id == case_id)
+        )
+        case = result.one_or_none()
+        if not case:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Case not found"
+            )
+        if case.reported_by_user_id != current_user.id and not is_admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to add documents to this case"
+            )
+        case_pk = case.id
+
+    if member_id:
+        result = await db.execute(
+            select(Member.id, Member.user_id).where(Member.member_id == member_id)
+        )
+        member = result.one_or_none()
+        if not member:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Member not found"
+            )
+        if member.user_id != current_user.id and not is_admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to add documents to this member"
+            )
+        member_pk = member.id
+
+    return case_pk, member_pk
+
+
+def _new_document(
+    upload_result: dict,
+    current_user: User,
+    case_pk: Optional[UUID] = None,
+    member_pk: Optional[UUID] = None
+) -> Document:
+    """Document record for an uploaded file"""
+    return Document(
+        case_id=case_pk,
+        member_id=member_pk,
+        uploaded_by_user_id=current_user.id,
+        file_name=upload_result["file_name"],
+        file_type=upload_result["file_type"],
+        file_size=upload_result["file_size"],
+        s3_key=upload_result.get("s3_key"),
+        s3_url=upload_result.get("s3_url"),
+        local_path=upload_result.get("local_path"),
+        blob_id=upload_result.get("blob_id")
+    )
+
+
 @router.post("")
 async def upload_file(
     file: UploadFile = File(...),
     case_id: str | None = None,
     member_id: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Upload a file
 
     - Validates file type and size
+    - Links the document to the given case and/or member
     - Uploads to local storage (or S3 when configured)
     - Creates document record in database
+    - Queues display copy and thumbnail generation for images
     - Returns file information
     """
     try:
+        # Check the case/member before storing anything
+        case_pk, member_pk = await _resolve_links(db, case_id, member_id, current_user)
+
         # Determine folder based on type
         folder = "cases" if case_id else "members"
 
@@ -33,21 +133,13 @@ async def upload_file(
         upload_result = await upload_service.upload_file(file, folder=folder)
 
         # Create document record
-        document = Document(
-            case_id=None,  # Will be linked later when case is created
-            member_id=None,  # Will be linked later when member is created
-            uploaded_by_user_id=current_user.id,
-            file_name=upload_result["file_name"],
-            file_type=upload_result["file_type"],
-            file_size=upload_result["file_size"],
-            s3_key=upload_result.get("s3_key"),
-            s3_url=upload_result.get("s3_url"),
-            local_path=upload_result.get("local_path")
-        )
+        document = _new_document(upload_result, current_user, case_pk, member_pk)
 
         db.add(document)
-        db.commit()
-        db.refresh(document)
+        await db.commit()
+
+        if document.s3_key and is_processable(document.file_type):
+            image_processor.schedule(document.id)
 
         return {
             "document_id": str(document.id),
@@ -66,10 +158,205 @@ async def upload_file(
         )
 
 
+@router.post("/batch")
+async def upload_files(
+    files: List[UploadFile] = File(...),
+    case_id: str | None = None,
+    member_id: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Upload several files in one request
+
+    - Validates and stores the files concurrently (a few at a time)
+    - Links every document to the given case and/or member
+    - Creates all document records in one transaction
+    - Reports a result per file; a rejected file does not fail the others
+    """
+    if len(files) > settings.upload_batch_max_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.upload_batch_max_files} files can be uploaded at once"
+        )
+
+    try:
+        case_pk, member_pk = await _resolve_links(db, case_id, member_id, current_user)
+
+        folder = "cases" if case_id else "members"
+        upload_results = await upload_service.upload_files(files, folder=folder)
+
+        documents = {
+            i: _new_document(upload_result, current_user, case_pk, member_pk)
+            for i, upload_result in enumerate(upload_results)
+            if "error" not in upload_result
+        }
+        db.add_all(documents.values())
+        await db.commit()
+        document_ids = {i: document.id for i, document in documents.items()}
+
+        for i in documents:
+            if upload_results[i]["s3_key"] and is_processable(upload_results[i]["file_type"]):
+                image_processor.schedule(document_ids[i])
+
+        results = []
+        for i, upload_result in enumerate(upload_results):
+            if i in documents:
+                results.append({
+                    "document_id": str(document_ids[i]),
+                    "file_id": upload_result["file_id"],
+                    "file_name": upload_result["file_name"],
+                    "file_size": upload_result["file_size"]
+                })
+            else:
+                results.append({
+                    "file_name": upload_result["file_name"],
+                    "error": upload_result["error"],
+                    "status_code": upload_result["status_code"]
+                })
+
+        return {
+            "files": results,
+            "uploaded": len(documents),
+            "failed": len(upload_results) - len(documents),
+            "message": f"{len(documents)} of {len(upload_results)} files uploaded successfully"
+        }
+
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"File upload failed: {str(e)}"
+        )
+
+
+@router.post("/presign", response_model=PresignedUploadResponse)
+async def create_presigned_upload(
+    request: PresignedUploadRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Start a direct-to-Spaces upload
+
+    - Validates the declared file type and size
+    - Creates a pending document record, linked to the given case and/or member
+    - Returns a presigned PUT URL, or presigned part URLs for large files
+
+    The client uploads the file straight to Spaces, then calls
+    `POST /api/upload/{document_id}/complete`.
+    """
+    case_pk, member_pk = await _resolve_links(db, request.case_id, request.member_id, current_user)
+
+    folder = "cases" if request.case_id else "members"
+    presigned = await upload_service.create_direct_upload(
+        request.file_name,
+        request.file_type,
+        request.file_size,
+        folder=folder
+    )
+
+    document = Document(
+        case_id=case_pk,
+        member_id=member_pk,
+        uploaded_by_user_id=current_user.id,
+        file_name=request.file_name,
+        file_type=request.file_type,
+        file_size=request.file_size,
+        s3_key=presigned["s3_key"],
+        status=DocumentStatus.PENDING,
+        upload_id=presigned["upload_id"]
+    )
+    db.add(document)
+    await db.commit()
+
+    return PresignedUploadResponse(
+        document_id=document.id,
+        s3_key=presigned["s3_key"],
+        method=presigned["method"],
+        url=presigned["url"],
+        content_type=request.file_type,
+        part_size=presigned["part_size"],
+        parts=presigned["parts"],
+        expires_in=presigned["expires_in"]
+    )
+
+
+@router.post("/{document_id}/complete")
+async def complete_presigned_upload(
+    document_id: UUID,
+    request: UploadCompleteRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Finish a direct-to-Spaces upload
+
+    Verifies the uploaded object (size and content) with Spaces and marks the
+    document as uploaded. Completing an already uploaded document is a no-op.
+
+    A rejected single PUT can be sent again while its URL is valid. A rejected
+    multipart upload cannot (completing it used it up), so its document is
+    deleted and the client has to request a new upload.
+    """
+    document = await db.get(Document, document_id)
+
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
+        )
+
+    if document.uploaded_by_user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to complete this upload"
+        )
+
+    if document.status == DocumentStatus.PENDING:
+        try:
+            verified = await upload_service.complete_direct_upload(
+                document.s3_key,
+                document.file_name,
+                document.file_size,
+                upload_id=document.upload_id,
+                parts=[(part.part_number, part.etag) for part in request.parts]
+            )
+        except UploadRejected as e:
+            # The object is deleted. A single PUT URL stays usable, so the
+            # record stays pending; a completed multipart upload is gone.
+            if document.upload_id:
+                await db.delete(document)
+                await db.commit()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"{e.detail}. Request a new upload and send the file again"
+                )
+            raise
+
+        document.file_size = verified["file_size"]
+        document.file_type = verified["file_type"]
+        document.s3_url = verified["s3_url"]
+        document.status = DocumentStatus.UPLOADED
+        document.upload_id = None
+        await db.commit()
+
+        if is_processable(document.file_type):
+            image_processor.schedule(document.id)
+
+    return {
+        "document_id": str(document.id),
+        "file_name": document.file_name,
+        "file_size": document.file_size,
+        "message": "File uploaded successfully"
+    }
+
+
 @router.get("/{document_id}")
 async def get_document_info(
-    document_id: str,
-    db: Session = Depends(get_db),
+    document_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -77,7 +364,7 @@ async def get_document_info(
 
     Returns information about an uploaded document.
     """
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = await db.get(Document, document_id)
 
     if not document:
         raise HTTPException(
@@ -98,15 +385,108 @@ async def get_document_info(
         "file_type": document.file_type,
         "file_size": document.file_size,
         "uploaded_at": document.uploaded_at,
+        "status": document.status.value,
         "s3_url": document.s3_url,
-        "local_path": document.local_path
+        "local_path": document.local_path,
+        "download_url": f"/api/upload/{document.id}/download"
     }
 
 
+@router.get("/{document_id}/download")
+async def download_document(
+    document_id: UUID,
+    request: Request,
+    original: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download a document
+
+    Locally stored files are streamed from disk; files in Spaces redirect to
+    a short-lived presigned URL, or are streamed through the API when
+    SPACES_PROXY_DOWNLOADS is set. Both honour Range requests, so large files
+    can be resumed and previewed page by page; proxied downloads also answer
+    If-None-Match with 304.
+
+    Images are served as their display copy, which carries no EXIF or GPS
+    metadata. Admins can ask for the untouched original with original=true.
+    """
+    document = await db.get(Document, document_id)
+
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
+        )
+
+    # Check authorization (document owner or admin)
+    if document.uploaded_by_user_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this document"
+        )
+
+    if document.status == DocumentStatus.PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload has not been completed"
+        )
+
+    is_admin = current_user.role == "admin"
+    if original and not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can download original images"
+        )
+
+    if is_processable(document.file_type) and not original:
+        if document.display_key:
+            return await spaces_storage.download_response(
+                document.display_key,
+                f"{os.path.splitext(document.file_name)[0]}.jpg",
+                "image/jpeg",
+                request.headers
+            )
+        # Admins fall back to the original; nobody else gets its metadata
+        if not is_admin:
+            if document.s3_key and document.image_processed_at is None:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Image is still being processed, try again shortly"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No downloadable copy of this image is available"
+            )
+
+    if document.local_path:
+        try:
+            key = local_storage.key_for_path(document.local_path)
+        except ValueError:
+            key = None
+        if key is None or not await local_storage.exists(key):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="File not found in storage"
+            )
+        return await local_storage.download_response(key, document.file_name, document.file_type, request.headers)
+
+    if document.s3_key:
+        return await spaces_storage.download_response(
+            document.s3_key, document.file_name, document.file_type, request.headers
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="File not found in storage"
+    )
+
+
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
-    document_id: str,
-    db: Session = Depends(get_db),
+    document_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -114,7 +494,7 @@ async def delete_document(
 
     Removes both database record and file from storage.
     """
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = await db.get(Document, document_id)
 
     if not document:
         raise HTTPException(
@@ -129,14 +509,9 @@ async def delete_document(
             detail="Not authorized to delete this document"
         )
 
-    # Delete file from storage
-    await upload_service.delete_file(
-        s3_key=document.s3_key,
-        local_path=document.local_path
-    )
-
-    # Delete database record
-    db.delete(document)
-    db.commit()
+    # Delete database record, then the file (shared files are collected once unreferenced)
+    await db.delete(document)
+    await db.commit()
+    await upload_service.delete_document_file(document)
 
     return None
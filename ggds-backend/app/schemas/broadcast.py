@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+
+from app.models.member import MemberStatus
+
+
+class BroadcastMemberSelector(BaseModel):
+    """Which members receive a broadcast"""
+    statuses: List[MemberStatus] = [MemberStatus.ACTIVE]
+    exclude_on_probation: bool = False
+    exclude_case_member: bool = True  # Skip the member who filed the case
+
+
+class BroadcastCreate(BaseModel):
+    """Schema for starting a contribution call broadcast"""
+    selector: BroadcastMemberSelector = BroadcastMemberSelector()
+
+
+class BroadcastResponse(BaseModel):
+    """Broadcast progress"""
+    id: UUID
+    case_id: str  # CASE-XXX
+    status: str
+    selector: BroadcastMemberSelector
+    sent: int
+    failed: int
+    created_at: datetime
+    completed_at: Optional[datetime] = None
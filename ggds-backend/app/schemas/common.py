@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Message(BaseModel):
@@ -17,3 +17,4 @@ class HealthCheck(BaseModel):
     status: str
     version: str
     database: str
+    password_hashing: Optional[Dict[str, int]] = None  # bcrypt pool queue metrics
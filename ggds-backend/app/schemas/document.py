@@ -0,0 +1,69 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+
+
+class PresignedUploadRequest(BaseModel):
+    """Schema for requesting a direct-to-Spaces upload"""
+    file_name: str = Field(..., max_length=255)
+    file_type: str = Field(..., max_length=100)  # MIME type the client will send
+    file_size: int = Field(..., gt=0)  # Size in bytes
+    case_id: Optional[str] = None
+    member_id: Optional[str] = None
+
+
+class PresignedUploadPart(BaseModel):
+    """Presigned URL for one part of a multipart upload"""
+    part_number: int
+    url: str
+
+
+class PresignedUploadResponse(BaseModel):
+    """Where and how the client uploads the file"""
+    document_id: UUID
+    s3_key: str
+    method: str  # PUT (single request) or MULTIPART
+    url: Optional[str] = None  # PUT URL; send the file with this Content-Type
+    content_type: str
+    part_size: Optional[int] = None  # Bytes per part (the last part may be smaller)
+    parts: List[PresignedUploadPart] = []
+    expires_in: int  # Seconds the URLs stay valid
+
+
+class CompletedPart(BaseModel):
+    """ETag returned by Spaces for an uploaded part"""
+    part_number: int = Field(..., ge=1)
+    etag: str
+
+
+class UploadCompleteRequest(BaseModel):
+    """Schema for finalizing a direct upload"""
+    parts: List[CompletedPart] = []  # Required for MULTIPART uploads
+
+
+class AdminDocumentResponse(BaseModel):
+    """Document in admin listings, with short-lived download URLs"""
+    id: UUID
+    case_id: Optional[UUID] = None
+    member_id: Optional[UUID] = None
+    file_name: str
+    file_type: str
+    file_size: int
+    status: str
+    uploaded_at: datetime
+    thumbnail_url: Optional[str] = None  # Small JPEG preview (images only)
+    view_url: Optional[str] = None  # Display copy for images, otherwise the original
+    download_url: Optional[str] = None  # Original file
+
+
+class StorageGCReport(BaseModel):
+    """Outcome of a storage garbage collection run"""
+    dry_run: bool
+    documents_deleted: int  # Unlinked documents and abandoned direct uploads
+    blobs_deleted: int  # Shared content blobs no document referenced
+    objects_scanned: int  # Objects listed in the bucket sweep
+    objects_deleted: int  # Unreferenced objects deleted by the bucket sweep
+    bytes_reclaimed: int  # Derivative sizes are only known to the bucket sweep
+    errors: int
+    duration_seconds: float
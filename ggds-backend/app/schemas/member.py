@@ -28,6 +28,24 @@ class AdminMemberCreateResponse(BaseModel):
         from_attributes = True
 
 
+class MemberImportRowResult(BaseModel):
+    """Outcome of one CSV row in a bulk member import"""
+    row: int  # Line number in the CSV file (header is line 1)
+    status: str  # created, failed
+    email: Optional[str] = None
+    member_id: Optional[str] = None  # Set when the member was created
+    errors: List[str] = []
+
+
+class MemberImportResponse(BaseModel):
+    """Per-row report of a bulk member import"""
+    total_rows: int
+    created: int
+    failed: int
+    initial_password: str  # Shared temporary password for first login
+    results: List[MemberImportRowResult]
+
+
 class FamilyMemberCreate(BaseModel):
     """Schema for creating a family member"""
     family_type: str  # nuclear or sibling
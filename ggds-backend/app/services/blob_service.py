@@ -0,0 +1,114 @@
+"""
+Content-addressed document storage
+
+Uploaded files are stored once per distinct content, under a key derived
+from their SHA-256 (blobs/ab/abcdef...). Documents reference their blob
+through documents.blob_id; there is no counter to keep in sync, so cascades
+and bulk deletes need no special handling. The storage garbage collector
+deletes blobs no document references.
+
+No row lock is ever held while talking to Spaces. An upload either touches
+the existing blob row (which keeps the collector away from it for
+STORAGE_GC_MIN_OBJECT_AGE_HOURS) or stores the object first and registers
+the row afterwards; storing the same content twice is harmless. The
+collector marks a row as deleting before it deletes the object, and uploads
+wait for such rows to disappear before storing the content again.
+"""
+
+import uuid
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import AsyncSessionLocal
+from app.models import StoredBlob
+
+# Give up instead of waiting indefinitely for a locked blob row
+BLOB_LOCK_TIMEOUT = "5s"
+
+
+class BlobReference(NamedTuple):
+    """Stored content a document can reference"""
+    blob_id: uuid.UUID
+    s3_key: str
+
+
+def content_key(sha256: str) -> str:
+    """Object key for content with the given SHA-256"""
+    return f"blobs/{sha256[:2]}/{sha256}"
+
+
+async def touch_blobs(sha256s: List[str]) -> Tuple[Dict[str, BlobReference], Set[str]]:
+    """
+    Reuse content that is already stored
+
+    Touching a blob keeps the collector from deleting it until the
+    referencing document is committed. Rows are locked in SHA-256 order so
+    concurrent batches cannot deadlock.
+
+    Returns:
+        (blobs per SHA-256 that can be referenced, SHA-256s being deleted)
+    """
+    if not sha256s:
+        return {}, set()
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(text(f"SET LOCAL lock_timeout = '{BLOB_LOCK_TIMEOUT}'"))
+        await db.execute(
+            select(StoredBlob.id)
+            .where(StoredBlob.sha256.in_(sha256s))
+            .order_by(StoredBlob.sha256)
+            .with_for_update()
+        )
+        result = await db.execute(
+            update(StoredBlob)
+            .where(StoredBlob.sha256.in_(sha256s))
+            .values(updated_at=func.now())
+            .returning(StoredBlob.id, StoredBlob.sha256, StoredBlob.s3_key, StoredBlob.deleting_at)
+        )
+        rows = result.all()
+        await db.commit()
+
+    stored = {row.sha256: BlobReference(row.id, row.s3_key) for row in rows if row.deleting_at is None}
+    deleting = {row.sha256 for row in rows if row.deleting_at is not None}
+    return stored, deleting
+
+
+async def register_blobs(blobs: List[Tuple[str, int, str]]) -> Dict[str, BlobReference]:
+    """
+    Record content that was just stored
+
+    Args:
+        blobs: (SHA-256, size, content type) of each stored object
+
+    Returns:
+        Blobs per SHA-256; content that turned out to be being deleted is
+        missing and must be stored again once its row is gone
+    """
+    if not blobs:
+        return {}
+
+    stmt = pg_insert(StoredBlob).values([
+        {
+            "id": uuid.uuid4(),
+            "sha256": sha256,
+            "s3_key": content_key(sha256),
+            "size": size,
+            "content_type": content_type,
+        }
+        # Sorted like touch_blobs, so conflicting rows are locked in the same order
+        for sha256, size, content_type in sorted(blobs)
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[StoredBlob.sha256],
+        set_={"updated_at": func.now()},
+        where=StoredBlob.deleting_at.is_(None)
+    ).returning(StoredBlob.id, StoredBlob.sha256, StoredBlob.s3_key)
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(text(f"SET LOCAL lock_timeout = '{BLOB_LOCK_TIMEOUT}'"))
+        rows = (await db.execute(stmt)).all()
+        await db.commit()
+
+    return {row.sha256: BlobReference(row.id, row.s3_key) for row in rows}
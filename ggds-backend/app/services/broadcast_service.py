@@ -0,0 +1,281 @@
+"""
+Bulk broadcast mailer for case contribution calls
+
+Recipients are streamed from the members table with a server-side cursor,
+so memory stays flat however many members match. Each batch is sent over the
+pooled SMTP connections with bounded concurrency and a global rate limit, and
+its per-recipient outcome is upserted into email_broadcast_recipients.
+Members already marked sent are excluded from the stream, so a resumed
+broadcast (after a restart or via the resume endpoint) continues where it
+left off and retries only failed recipients.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import (
+    BroadcastRecipientStatus,
+    BroadcastStatus,
+    Case,
+    EmailBroadcast,
+    EmailBroadcastRecipient,
+    Member,
+)
+from app.schemas.broadcast import BroadcastMemberSelector
+from app.services.email_service import email_service
+from app.services.email_templates import render_email
+from app.utils.rate_limit import RateLimiter
+
+
+def recipient_query(broadcast: EmailBroadcast, case: Case):
+    """Members selected by the broadcast that have not been sent the email yet"""
+    selector = BroadcastMemberSelector(**broadcast.selector)
+    already_sent = exists().where(
+        EmailBroadcastRecipient.broadcast_id == broadcast.id,
+        EmailBroadcastRecipient.member_id == Member.id,
+        EmailBroadcastRecipient.status == BroadcastRecipientStatus.SENT
+    )
+
+    query = (
+        select(Member.id, Member.email, Member.full_name)
+        .where(Member.status.in_(selector.statuses))
+        .where(~already_sent)
+    )
+    if selector.exclude_on_probation:
+        query = query.where(Member.on_probation.is_(False))
+    if selector.exclude_case_member:
+        query = query.where(Member.id != case.member_id)
+    return query.order_by(Member.id)
+
+
+async def broadcast_counts(db: AsyncSession, broadcast_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Dict[str, int]]:
+    """Sent and failed recipient counts per broadcast"""
+    counts = {broadcast_id: {"sent": 0, "failed": 0} for broadcast_id in broadcast_ids}
+    if not broadcast_ids:
+        return counts
+
+    result = await db.execute(
+        select(
+            EmailBroadcastRecipient.broadcast_id,
+            EmailBroadcastRecipient.status,
+            func.count(EmailBroadcastRecipient.id)
+        )
+        .where(EmailBroadcastRecipient.broadcast_id.in_(broadcast_ids))
+        .group_by(EmailBroadcastRecipient.broadcast_id, EmailBroadcastRecipient.status)
+    )
+    for broadcast_id, status, count in result.all():
+        counts[broadcast_id][BroadcastRecipientStatus(status).value] = count
+    return counts
+
+
+def _contribution_call_context(case: Case) -> dict:
+    return {
+        "case_id": case.case_id,
+        "case_type": str(getattr(case.case_type, "value", case.case_type)).replace('_', ' ').title(),
+        "affected_member_name": case.deceased_name or case.affected_member_name or "a fellow member",
+        "due_date": case.due_date.strftime("%d %B %Y") if case.due_date else "the case due date",
+    }
+
+
+class BroadcastRunner:
+    """Runs broadcasts as background tasks in this worker process"""
+
+    def __init__(self):
+        self._tasks: Dict[uuid.UUID, asyncio.Task] = {}
+        self._limiter: Optional[RateLimiter] = None
+
+    def _get_limiter(self) -> RateLimiter:
+        # One limiter per process, shared by concurrent broadcasts
+        if self._limiter is None:
+            self._limiter = RateLimiter(settings.broadcast_rate_per_second)
+        return self._limiter
+
+    def is_running(self, broadcast_id: uuid.UUID) -> bool:
+        task = self._tasks.get(broadcast_id)
+        return task is not None and not task.done()
+
+    def start(self, broadcast_id: uuid.UUID) -> None:
+        """Start sending a broadcast in the background"""
+        if self.is_running(broadcast_id):
+            return
+        task = asyncio.create_task(self._run(broadcast_id))
+        self._tasks[broadcast_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(broadcast_id, None))
+
+    async def resume_stale(self) -> List[uuid.UUID]:
+        """
+        Claim and resume running broadcasts whose sender stopped heartbeating
+
+        Called at startup. The conditional UPDATE ensures only one worker
+        process picks up each broadcast.
+        """
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=settings.broadcast_lease_seconds)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(EmailBroadcast)
+                .where(
+                    EmailBroadcast.status == BroadcastStatus.RUNNING,
+                    or_(EmailBroadcast.heartbeat_at.is_(None), EmailBroadcast.heartbeat_at < stale_before)
+                )
+                .values(heartbeat_at=now)
+                .returning(EmailBroadcast.id)
+            )
+            broadcast_ids = list(result.scalars().all())
+            await db.commit()
+
+        for broadcast_id in broadcast_ids:
+            print(f"📣 Resuming broadcast {broadcast_id}")
+            self.start(broadcast_id)
+        return broadcast_ids
+
+    async def stop(self) -> None:
+        """Cancel running broadcasts; they resume from their recorded progress"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        member: Tuple[uuid.UUID, str, str],
+        context: dict
+    ) -> Optional[str]:
+        """Send to one member; returns an error message on failure"""
+        _, to_email, member_name = member
+        async with semaphore:
+            await self._get_limiter().wait()
+            try:
+                subject, html = render_email("contribution_call", member_name=member_name, **context)
+                await email_service.deliver(to_email, subject, html)
+            except Exception as e:
+                return str(e) or e.__class__.__name__
+        return None
+
+    async def _record_batch(
+        self,
+        broadcast_id: uuid.UUID,
+        batch: List[Tuple[uuid.UUID, str, str]],
+        errors: List[Optional[str]]
+    ) -> BroadcastStatus:
+        """Upsert recipient outcomes, heartbeat, and return the current broadcast status"""
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "broadcast_id": broadcast_id,
+                "member_id": member_id,
+                "email": to_email,
+                "status": BroadcastRecipientStatus.FAILED if error else BroadcastRecipientStatus.SENT,
+                "attempts": 1,
+                "last_error": error,
+                "sent_at": None if error else now,
+            }
+            for (member_id, to_email, _), error in zip(batch, errors)
+        ]
+        stmt = pg_insert(EmailBroadcastRecipient).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmailBroadcastRecipient.broadcast_id, EmailBroadcastRecipient.member_id],
+            set_={
+                "status": stmt.excluded.status,
+                "attempts": EmailBroadcastRecipient.attempts + 1,
+                "last_error": stmt.excluded.last_error,
+                "sent_at": stmt.excluded.sent_at,
+                "updated_at": now,
+            }
+        )
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(stmt)
+            result = await db.execute(
+                update(EmailBroadcast)
+                .where(EmailBroadcast.id == broadcast_id)
+                .values(heartbeat_at=now)
+                .returning(EmailBroadcast.status)
+            )
+            status = result.scalar_one()
+            await db.commit()
+        return BroadcastStatus(status)
+
+    async def _run(self, broadcast_id: uuid.UUID) -> None:
+        async with AsyncSessionLocal() as db:
+            broadcast = await db.get(EmailBroadcast, broadcast_id)
+            if broadcast is None or broadcast.status != BroadcastStatus.RUNNING:
+                return
+            case = await db.get(Case, broadcast.case_id)
+            query = recipient_query(broadcast, case)
+            context = _contribution_call_context(case)
+
+        semaphore = asyncio.Semaphore(settings.broadcast_concurrency)
+        sent = failed = 0
+        print(f"📣 Broadcast {broadcast_id} for {context['case_id']} started")
+
+        try:
+            # Dedicated session: the server-side cursor holds its connection until exhausted
+            async with AsyncSessionLocal() as stream_db:
+                result = await stream_db.stream(
+                    query.execution_options(yield_per=settings.broadcast_batch_size)
+                )
+                async for partition in result.partitions():
+                    batch = [tuple(row) for row in partition]
+                    errors = await asyncio.gather(*(self._send_one(semaphore, member, context) for member in batch))
+                    status = await self._record_batch(broadcast_id, batch, errors)
+                    batch_failed = sum(1 for error in errors if error)
+                    sent += len(batch) - batch_failed
+                    failed += batch_failed
+
+                    if status != BroadcastStatus.RUNNING:
+                        print(f"📣 Broadcast {broadcast_id} {status.value}, stopping")
+                        return
+        except asyncio.CancelledError:
+            print(f"📣 Broadcast {broadcast_id} interrupted after {sent} sent; will resume")
+            raise
+        except Exception as e:
+            # Left running; resumed by the next startup or the resume endpoint
+            print(f"❌ Broadcast {broadcast_id} failed: {str(e)}")
+            return
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(EmailBroadcast)
+                .where(EmailBroadcast.id == broadcast_id, EmailBroadcast.status == BroadcastStatus.RUNNING)
+                .values(status=BroadcastStatus.COMPLETED, completed_at=datetime.now(timezone.utc))
+            )
+            await db.commit()
+        print(f"📣 Broadcast {broadcast_id} completed: {sent} sent, {failed} failed")
+
+
+async def create_broadcast(
+    db: AsyncSession,
+    case: Case,
+    selector: BroadcastMemberSelector,
+    user_id: uuid.UUID
+) -> EmailBroadcast:
+    """
+    Create a contribution call broadcast for a case
+
+    The caller starts it with broadcast_runner.start() after the commit.
+    """
+    broadcast = EmailBroadcast(
+        case_id=case.id,
+        created_by_user_id=user_id,
+        selector=selector.model_dump(mode="json"),
+        status=BroadcastStatus.RUNNING,
+        heartbeat_at=datetime.now(timezone.utc)
+    )
+    db.add(broadcast)
+    await db.commit()
+    return broadcast
+
+
+# Create singleton instance
+broadcast_runner = BroadcastRunner()
@@ -1,54 +1,57 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import Optional
 
 from app.models import Case, VerificationContact, Member, User
+from app.models.case import case_number_seq
 from app.schemas.case import CaseCreate, VerificationContactCreate
+from app.services.email_outbox import queue_email
+from app.utils.loaders import CASE_DETAIL_OPTIONS
 
 
-def generate_case_id(db: Session) -> str:
+def format_case_id(case_number: int) -> str:
     """
-    Generate unique case ID in format: CASE-XXX
+    Format a case number as a case ID: CASE-XXX
 
     Example: CASE-001, CASE-002, etc.
     """
-    # Get the latest case
-    latest_case = (
-        db.query(Case)
-        .order_by(Case.case_id.desc())
-        .first()
-    )
+    return f"CASE-{case_number:03d}"
 
-    if latest_case:
-        # Extract number and increment
-        last_number = int(latest_case.case_id.split("-")[-1])
-        new_number = last_number + 1
-    else:
-        new_number = 1
 
-    # Format as 3-digit number
-    return f"CASE-{new_number:03d}"
+async def generate_case_number(db: AsyncSession) -> int:
+    """
+    Allocate the next case number from the case_number_seq sequence
 
+    O(1) and safe across concurrent submissions and workers.
+    """
+    return await db.scalar(select(case_number_seq.next_value()))
 
-def create_case_report(
-    db: Session,
+
+async def create_case_report(
+    db: AsyncSession,
     user: User,
     case_data: CaseCreate
 ) -> Case:
     """
     Create a new case report with verification contacts
+
+    Queues the reporter's confirmation and the admin notification in the
+    same transaction.
     """
     # Find member by member_id
-    member = db.query(Member).filter(Member.member_id == case_data.member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == case_data.member_id))
+    member = result.scalar_one_or_none()
     if not member:
         raise ValueError(f"Member with ID {case_data.member_id} not found")
 
-    # Generate unique case ID
-    case_id = generate_case_id(db)
+    # Allocate case number and derive the case ID from it
+    case_number = await generate_case_number(db)
 
     # Create case
     new_case = Case(
-        case_id=case_id,
+        case_id=format_case_id(case_number),
+        case_number=case_number,
         member_id=member.id,
         reported_by_user_id=user.id,
         case_type=case_data.case_type,
@@ -62,7 +65,7 @@ def create_case_report(
     )
 
     db.add(new_case)
-    db.flush()  # Get the case ID
+    await db.flush()  # Get the case ID
 
     # Add verification contacts
     verification_data = [
@@ -83,7 +86,30 @@ def create_case_report(
         )
         db.add(contact)
 
-    db.commit()
-    db.refresh(new_case)
+    # Send confirmation email to reporter and notify admin of new case
+    queue_email(
+        db,
+        "send_case_confirmation",
+        to_email=user.email,
+        case_id=new_case.case_id,
+        case_type=new_case.case_type
+    )
+    queue_email(
+        db,
+        "send_admin_notification",
+        case_id=new_case.case_id,
+        case_type=new_case.case_type,
+        member_name=new_case.affected_member_name,
+        urgency=new_case.urgency_level
+    )
 
-    return new_case
+    await db.commit()
+
+    # Reload with verification contacts for the detail response
+    result = await db.execute(
+        select(Case)
+        .where(Case.id == new_case.id)
+        .options(*CASE_DETAIL_OPTIONS)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
@@ -0,0 +1,209 @@
+"""
+Transactional email outbox
+
+Request handlers call queue_email() before committing, so the email is stored
+atomically with the change that triggers it and the response never waits on
+SMTP. EmailOutboxWorker drains the outbox in the background: it leases a
+batch of due entries, sends them over the pooled SMTP connections and retries
+failures with exponential backoff. An entry whose worker dies mid-send is
+retried once its lease expires, so delivery is at-least-once. Secret payload
+fields are removed once an entry is sent or given up on.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import EmailOutbox, EmailOutboxStatus
+from app.services.email_service import EmailService, email_service
+
+
+# Payload fields removed once an entry is sent or given up on, so secrets
+# such as initial passwords do not stay in the database
+SECRET_PAYLOAD_KEYS = ("initial_password",)
+
+
+def scrub_payload(payload: dict) -> dict:
+    """Payload without its secret fields"""
+    return {key: value for key, value in payload.items() if key not in SECRET_PAYLOAD_KEYS}
+
+
+def queue_email(db, kind: str, **payload: Any) -> EmailOutbox:
+    """
+    Queue an email in the caller's transaction
+
+    Works with both Session and AsyncSession; nothing is sent unless the
+    caller commits.
+
+    Args:
+        db: Database session
+        kind: EmailService method that sends the email (e.g. "send_welcome_email")
+        **payload: Keyword arguments for that method (must be JSON serializable)
+
+    Returns:
+        The pending outbox entry
+    """
+    if not kind.startswith("send_") or not callable(getattr(EmailService, kind, None)):
+        raise ValueError(f"Unknown email kind: {kind}")
+
+    entry = EmailOutbox(kind=kind, payload=payload, status=EmailOutboxStatus.PENDING)
+    db.add(entry)
+    db.info["email_outbox_queued"] = True
+    return entry
+
+
+def outbox_row(kind: str, **payload: Any) -> dict:
+    """Build an outbox row for multi-row inserts (``insert(EmailOutbox)``)"""
+    if not kind.startswith("send_") or not callable(getattr(EmailService, kind, None)):
+        raise ValueError(f"Unknown email kind: {kind}")
+    return {"kind": kind, "payload": payload, "status": EmailOutboxStatus.PENDING, "attempts": 0}
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after `attempts` failed deliveries"""
+    seconds = settings.email_outbox_retry_base_seconds * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, settings.email_outbox_retry_max_seconds))
+
+
+class EmailOutboxWorker:
+    """Background task that delivers queued emails"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Start draining the outbox on the running event loop"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        print("📬 Email outbox worker started")
+
+    async def stop(self) -> None:
+        """Stop the worker; entries being sent are retried after their lease"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        print("📭 Email outbox worker stopped")
+
+    def notify(self) -> None:
+        """Wake the worker (safe to call from any thread)"""
+        if self._loop is None or self._wakeup is None or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                delivered = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ Email outbox worker error: {str(e)}")
+                delivered = 0
+
+            # A full batch means more is probably waiting
+            if delivered >= settings.email_outbox_batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.email_outbox_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _claim_batch(self) -> List[EmailOutbox]:
+        """Lease due entries so no other worker picks them up meanwhile"""
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.status == EmailOutboxStatus.PENDING,
+                    EmailOutbox.next_attempt_at <= now
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(settings.email_outbox_batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            entries = result.scalars().all()
+            lease_until = now + timedelta(seconds=settings.email_outbox_lease_seconds)
+            for entry in entries:
+                entry.attempts += 1
+                entry.next_attempt_at = lease_until
+            await db.commit()
+            return list(entries)
+
+    async def _deliver(self, entry: EmailOutbox) -> Optional[str]:
+        """Send one entry; returns an error message on failure"""
+        try:
+            sent = await getattr(email_service, entry.kind)(**entry.payload)
+        except Exception as e:
+            return str(e) or e.__class__.__name__
+        return None if sent else "Email service reported a failed send"
+
+    async def drain_once(self) -> int:
+        """
+        Deliver one batch of due entries
+
+        Returns:
+            Number of entries attempted
+        """
+        entries = await self._claim_batch()
+        if not entries:
+            return 0
+
+        # Sends run concurrently, bounded by the SMTP connection pool
+        errors = await asyncio.gather(*(self._deliver(entry) for entry in entries))
+
+        now = datetime.now(timezone.utc)
+        sent = 0
+        async with AsyncSessionLocal() as db:
+            for entry, error in zip(entries, errors):
+                entry = await db.merge(entry, load=False)
+                if error is None:
+                    entry.status = EmailOutboxStatus.SENT
+                    entry.sent_at = now
+                    entry.last_error = None
+                    entry.payload = scrub_payload(entry.payload)
+                    sent += 1
+                elif entry.attempts >= settings.email_outbox_max_attempts:
+                    entry.status = EmailOutboxStatus.FAILED
+                    entry.last_error = error
+                    entry.payload = scrub_payload(entry.payload)
+                    print(f"❌ Giving up on {entry.kind} email {entry.id} after {entry.attempts} attempts: {error}")
+                else:
+                    entry.next_attempt_at = now + retry_delay(entry.attempts)
+                    entry.last_error = error
+            await db.commit()
+
+        print(f"📬 Email outbox: {sent}/{len(entries)} delivered")
+        return len(entries)
+
+
+# Create singleton instance
+email_outbox_worker = EmailOutboxWorker()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_outbox_worker(session):
+    if session.info.pop("email_outbox_queued", False):
+        email_outbox_worker.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_outbox_flag(session):
+    session.info.pop("email_outbox_queued", None)
@@ -1,20 +1,87 @@
+import base64
+import uuid
+from email.header import Header
+from email.utils import formatdate
 from typing import Optional
-import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from app.config import settings
+from app.services.email_templates import Markup, NOTES_FRAGMENT, render_email
+from app.services.smtp_pool import SMTPConnectionPool
+
+# Fixed per process; base64 bodies can never contain a line starting with "--"
+_MIME_BOUNDARY = f"=============== {uuid.uuid4().hex}=="
 
 
 class EmailService:
     """Email service using SMTP (Hostinger)"""
 
     def __init__(self):
+        self.pool = SMTPConnectionPool(
+            size=settings.smtp_pool_size,
+            health_check_seconds=settings.smtp_pool_health_check_seconds,
+            max_messages_per_connection=settings.smtp_pool_max_messages
+        )
         if settings.smtp_username and settings.smtp_password:
             self.configured = True
         else:
             self.configured = False
             print("⚠️  Email service not configured. Set SMTP_USERNAME and SMTP_PASSWORD to enable email notifications.")
 
+        # Static parts of every message (multipart/alternative with one HTML part)
+        self._message_id_domain = settings.email_from.rpartition("@")[2] or "localhost"
+        self._from_header = f"From: {settings.email_from}\r\n"
+        self._body_prefix = (
+            "MIME-Version: 1.0\r\n"
+            f'Content-Type: multipart/alternative; boundary="{_MIME_BOUNDARY}"\r\n'
+            "\r\n"
+            f"--{_MIME_BOUNDARY}\r\n"
+            'Content-Type: text/html; charset="utf-8"\r\n'
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n"
+        ).encode("ascii")
+        self._body_suffix = f"\r\n--{_MIME_BOUNDARY}--\r\n".encode("ascii")
+
+    @staticmethod
+    def _header_value(value: str) -> str:
+        # Header values must stay on one line (prevents header injection)
+        value = " ".join(value.splitlines())
+        if value.isascii():
+            return value
+        return Header(value, "utf-8").encode().replace("\n", "\r\n")
+
+    def build_message(self, to_email: str, subject: str, html_content: str) -> bytes:
+        """
+        Serialize an HTML email
+
+        Only the recipient, subject, date, message ID and body vary per
+        message; everything else is precomputed.
+        """
+        headers = (
+            f"{self._from_header}"
+            f"To: {self._header_value(to_email)}\r\n"
+            f"Subject: {self._header_value(subject)}\r\n"
+            f"Date: {formatdate(usegmt=True)}\r\n"
+            f"Message-ID: <{uuid.uuid4().hex}@{self._message_id_domain}>\r\n"
+        ).encode("utf-8")
+        body = base64.encodebytes(html_content.encode("utf-8")).replace(b"\n", b"\r\n")
+        return b"".join((headers, self._body_prefix, body, self._body_suffix))
+
+    async def deliver(self, to_email: str, subject: str, html_content: str) -> None:
+        """
+        Send an email, raising on failure (for callers that track delivery)
+
+        Raises:
+            RuntimeError: If the email service is not configured
+            aiosmtplib.SMTPException: If the server rejects the message
+            OSError: If the server cannot be reached
+        """
+        if not self.configured:
+            raise RuntimeError("Email service not configured")
+
+        message = self.build_message(to_email, subject, html_content)
+
+        # Send over a pooled, already authenticated SMTP connection
+        await self.pool.sendmail(settings.email_from, [to_email], message)
+
     async def send_email(
         self,
         to_email: str,
@@ -37,26 +104,7 @@ class EmailService:
             return False
 
         try:
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["From"] = settings.email_from
-            message["To"] = to_email
-            message["Subject"] = subject
-
-            # Attach HTML content
-            html_part = MIMEText(html_content, "html")
-            message.attach(html_part)
-
-            # Send email using SMTP
-            await aiosmtplib.send(
-                message,
-                hostname=settings.smtp_host,
-                port=settings.smtp_port,
-                username=settings.smtp_username,
-                password=settings.smtp_password,
-                use_tls=settings.smtp_use_tls,
-            )
-
+            await self.deliver(to_email, subject, html_content)
             print(f"✉️  Email sent to {to_email}")
             return True
         except Exception as e:
@@ -75,69 +123,17 @@ class EmailService:
 
         PIVOT v2.0: Includes initial password if provided (admin-created accounts)
         """
-        subject = "Welcome to GGDS Benevolent Fund - Your Account Details"
-
         # PIVOT v2.0: Different email for admin-created accounts
         if initial_password:
-            html = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                    <div style="max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9;">
-                        <div style="background-color: #0ec434; padding: 20px; text-align: center;">
-                            <h1 style="color: white; margin: 0;">GGDS Benevolent Fund</h1>
-                        </div>
-                        <div style="background-color: white; padding: 30px; margin-top: 20px; border-radius: 5px;">
-                            <h2 style="color: #273171;">Welcome, {member_name}!</h2>
-                            <p>Your account has been created by the administrator. Below are your login credentials:</p>
-
-                            <div style="background-color: #f0f8ff; padding: 20px; border-left: 4px solid #0ec434; margin: 20px 0;">
-                                <p style="margin: 5px 0;"><strong>Member ID:</strong> <code style="background: #e0e0e0; padding: 5px 10px; border-radius: 3px;">{member_id}</code></p>
-                                <p style="margin: 5px 0;"><strong>Initial Password:</strong> <code style="background: #e0e0e0; padding: 5px 10px; border-radius: 3px;">{initial_password}</code></p>
-                            </div>
-
-                            <div style="background-color: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0;">
-                                <p style="margin: 0;"><strong>⚠️ Important:</strong> On your first login, you will be required to complete your profile. This information is immutable and cannot be changed after submission, so please ensure all details are accurate.</p>
-                            </div>
-
-                            <h3 style="color: #273171;">Next Steps:</h3>
-                            <ol style="line-height: 1.8;">
-                                <li>Sign in using your Member ID and initial password</li>
-                                <li>Complete your profile with accurate information</li>
-                                <li>Review the profile carefully before submitting (cannot be changed)</li>
-                                <li>Change your password to something memorable</li>
-                            </ol>
-
-                            <p style="text-align: center; margin-top: 30px;">
-                                <a href="{settings.frontend_url}/signin" style="background-color: #0ec434; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block;">Sign In Now</a>
-                            </p>
-
-                            <p style="margin-top: 30px; color: #666; font-size: 14px;">For assistance, please contact us at {settings.admin_email}</p>
-                        </div>
-                        <div style="text-align: center; padding: 20px; color: #666; font-size: 12px;">
-                            <p>© 2025 GGDS Benevolent Fund. All rights reserved.</p>
-                        </div>
-                    </div>
-                </body>
-            </html>
-            """
+            subject, html = render_email(
+                "welcome_credentials",
+                member_name=member_name,
+                member_id=member_id,
+                initial_password=initial_password
+            )
         else:
             # Original welcome email for self-registered members (deprecated in PIVOT v2.0)
-            html = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                    <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                        <h2 style="color: #0ec434;">Welcome to GGDS Benevolent Fund</h2>
-                        <p>Dear {member_name},</p>
-                        <p>Your registration has been successfully received!</p>
-                        <p><strong>Your Member ID:</strong> {member_id}</p>
-                        <p>You can now access your dashboard and submit support cases when needed.</p>
-                        <p>If you have any questions, please contact us at {settings.admin_email}</p>
-                        <br>
-                        <p>Best regards,<br>GGDS Benevolent Fund Team</p>
-                    </div>
-                </body>
-            </html>
-            """
+            subject, html = render_email("welcome", member_name=member_name, member_id=member_id)
 
         return await self.send_email(to_email, subject, html)
 
@@ -148,23 +144,11 @@ class EmailService:
         case_type: str
     ) -> bool:
         """Send case submission confirmation"""
-        subject = f"Case Submitted: {case_id}"
-        html = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h2 style="color: #0ec434;">Case Submission Confirmation</h2>
-                    <p>Your support case has been successfully submitted.</p>
-                    <p><strong>Case ID:</strong> {case_id}</p>
-                    <p><strong>Case Type:</strong> {case_type.replace('_', ' ').title()}</p>
-                    <p>Your case is now under review. You will be notified of any status updates.</p>
-                    <p>You can track your case status in your dashboard.</p>
-                    <br>
-                    <p>Best regards,<br>GGDS Benevolent Fund Team</p>
-                </div>
-            </body>
-        </html>
-        """
+        subject, html = render_email(
+            "case_confirmation",
+            case_id=case_id,
+            case_type=case_type.replace('_', ' ').title()
+        )
         return await self.send_email(to_email, subject, html)
 
     async def send_case_status_update(
@@ -175,22 +159,12 @@ class EmailService:
         notes: Optional[str] = None
     ) -> bool:
         """Send case status update notification"""
-        subject = f"Case Status Update: {case_id}"
-        html = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h2 style="color: #0ec434;">Case Status Update</h2>
-                    <p><strong>Case ID:</strong> {case_id}</p>
-                    <p><strong>New Status:</strong> {new_status.replace('_', ' ').title()}</p>
-                    {f'<p><strong>Notes:</strong> {notes}</p>' if notes else ''}
-                    <p>You can view full case details in your dashboard.</p>
-                    <br>
-                    <p>Best regards,<br>GGDS Benevolent Fund Team</p>
-                </div>
-            </body>
-        </html>
-        """
+        subject, html = render_email(
+            "case_status_update",
+            case_id=case_id,
+            new_status=new_status.replace('_', ' ').title(),
+            notes=Markup(NOTES_FRAGMENT.render({"notes": notes})) if notes else ""
+        )
         return await self.send_email(to_email, subject, html)
 
     async def send_admin_notification(
@@ -201,23 +175,19 @@ class EmailService:
         urgency: str
     ) -> bool:
         """Send notification to admin about new case"""
-        subject = f"New Case Submitted: {case_id} [{urgency.upper()}]"
-        html = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h2 style="color: #273171;">New Case Requires Review</h2>
-                    <p><strong>Case ID:</strong> {case_id}</p>
-                    <p><strong>Case Type:</strong> {case_type.replace('_', ' ').title()}</p>
-                    <p><strong>Member:</strong> {member_name}</p>
-                    <p><strong>Urgency:</strong> {urgency.upper()}</p>
-                    <p>Please review this case in the admin dashboard.</p>
-                </div>
-            </body>
-        </html>
-        """
+        subject, html = render_email(
+            "admin_new_case",
+            case_id=case_id,
+            case_type=case_type.replace('_', ' ').title(),
+            member_name=member_name,
+            urgency=urgency.upper()
+        )
         return await self.send_email(settings.admin_email, subject, html)
 
+    async def close(self) -> None:
+        """Close pooled SMTP connections"""
+        await self.pool.close()
+
 
 # Create singleton instance
 email_service = EmailService()
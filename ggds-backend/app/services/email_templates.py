@@ -0,0 +1,248 @@
+"""
+Email template registry
+
+Each template is compiled once, at import, into static text segments and
+named slots. Site-wide values (frontend URL, admin email) are baked into the
+static segments, so rendering a message is a single join over a few strings
+with the per-message values HTML-escaped.
+"""
+
+import html
+from string import Formatter
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from app.config import settings
+
+# Same for every message, so compiled into the static segments
+SITE_CONTEXT = {
+    "frontend_url": settings.frontend_url,
+    "admin_email": settings.admin_email,
+}
+
+
+class Markup(str):
+    """Trusted HTML that is inserted into a template without escaping"""
+
+
+class CompiledTemplate:
+    """
+    Template text split into static segments and named slots
+
+    Uses str.format placeholder syntax ({name}; {{ for a literal brace).
+    Placeholders found in `constants` are substituted at compile time.
+    """
+
+    def __init__(self, source: str, constants: Optional[Mapping[str, str]] = None, escape: bool = True):
+        self.escape = escape
+        constants = constants or {}
+        segments: List[str] = []
+        fields: List[str] = []
+        literal: List[str] = []
+
+        for text, field, _, _ in Formatter().parse(source):
+            literal.append(text)
+            if field is None:
+                continue
+            if field in constants:
+                literal.append(self._escape(constants[field]))
+                continue
+            segments.append("".join(literal))
+            fields.append(field)
+            literal = []
+        segments.append("".join(literal))
+
+        self._head = segments[0]
+        self._slots: Tuple[Tuple[str, str], ...] = tuple(zip(fields, segments[1:]))
+        self.fields = frozenset(fields)
+
+    def _escape(self, value) -> str:
+        if value is None:
+            return ""
+        if not self.escape or isinstance(value, Markup):
+            return str(value)
+        return html.escape(str(value))
+
+    def render(self, context: Mapping[str, object]) -> str:
+        """
+        Render the template
+
+        Raises:
+            KeyError: If a placeholder is missing from the context
+        """
+        parts = [self._head]
+        for field, segment in self._slots:
+            parts.append(self._escape(context[field]))
+            parts.append(segment)
+        return "".join(parts)
+
+
+class EmailTemplate:
+    """Compiled subject line and HTML body of one email"""
+
+    def __init__(self, subject: str, html_source: str):
+        self.subject = CompiledTemplate(subject, SITE_CONTEXT, escape=False)
+        self.html = CompiledTemplate(html_source, SITE_CONTEXT)
+
+    def render(self, **context) -> Tuple[str, str]:
+        """Render to (subject, html)"""
+        return self.subject.render(context), self.html.render(context)
+
+
+# PIVOT v2.0: Admin-created accounts, with login credentials
+WELCOME_CREDENTIALS_HTML = """\
+<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9;">
+            <div style="background-color: #0ec434; padding: 20px; text-align: center;">
+                <h1 style="color: white; margin: 0;">GGDS Benevolent Fund</h1>
+            </div>
+            <div style="background-color: white; padding: 30px; margin-top: 20px; border-radius: 5px;">
+                <h2 style="color: #273171;">Welcome, {member_name}!</h2>
+                <p>Your account has been created by the administrator. Below are your login credentials:</p>
+
+                <div style="background-color: #f0f8ff; padding: 20px; border-left: 4px solid #0ec434; margin: 20px 0;">
+                    <p style="margin: 5px 0;"><strong>Member ID:</strong> <code style="background: #e0e0e0; padding: 5px 10px; border-radius: 3px;">{member_id}</code></p>
+                    <p style="margin: 5px 0;"><strong>Initial Password:</strong> <code style="background: #e0e0e0; padding: 5px 10px; border-radius: 3px;">{initial_password}</code></p>
+                </div>
+
+                <div style="background-color: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0;">
+                    <p style="margin: 0;"><strong>⚠️ Important:</strong> On your first login, you will be required to complete your profile. This information is immutable and cannot be changed after submission, so please ensure all details are accurate.</p>
+                </div>
+
+                <h3 style="color: #273171;">Next Steps:</h3>
+                <ol style="line-height: 1.8;">
+                    <li>Sign in using your Member ID and initial password</li>
+                    <li>Complete your profile with accurate information</li>
+                    <li>Review the profile carefully before submitting (cannot be changed)</li>
+                    <li>Change your password to something memorable</li>
+                </ol>
+
+                <p style="text-align: center; margin-top: 30px;">
+                    <a href="{frontend_url}/signin" style="background-color: #0ec434; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block;">Sign In Now</a>
+                </p>
+
+                <p style="margin-top: 30px; color: #666; font-size: 14px;">For assistance, please contact us at {admin_email}</p>
+            </div>
+            <div style="text-align: center; padding: 20px; color: #666; font-size: 12px;">
+                <p>© 2025 GGDS Benevolent Fund. All rights reserved.</p>
+            </div>
+        </div>
+    </body>
+</html>
+"""
+
+# Self-registered members (deprecated in PIVOT v2.0)
+WELCOME_HTML = """\
+<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+            <h2 style="color: #0ec434;">Welcome to GGDS Benevolent Fund</h2>
+            <p>Dear {member_name},</p>
+            <p>Your registration has been successfully received!</p>
+            <p><strong>Your Member ID:</strong> {member_id}</p>
+            <p>You can now access your dashboard and submit support cases when needed.</p>
+            <p>If you have any questions, please contact us at {admin_email}</p>
+            <br>
+            <p>Best regards,<br>GGDS Benevolent Fund Team</p>
+        </div>
+    </body>
+</html>
+"""
+
+CASE_CONFIRMATION_HTML = """\
+<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+            <h2 style="color: #0ec434;">Case Submission Confirmation</h2>
+            <p>Your support case has been successfully submitted.</p>
+            <p><strong>Case ID:</strong> {case_id}</p>
+            <p><strong>Case Type:</strong> {case_type}</p>
+            <p>Your case is now under review. You will be notified of any status updates.</p>
+            <p>You can track your case status in your dashboard.</p>
+            <br>
+            <p>Best regards,<br>GGDS Benevolent Fund Team</p>
+        </div>
+    </body>
+</html>
+"""
+
+CASE_STATUS_UPDATE_HTML = """\
+<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+            <h2 style="color: #0ec434;">Case Status Update</h2>
+            <p><strong>Case ID:</strong> {case_id}</p>
+            <p><strong>New Status:</strong> {new_status}</p>
+            {notes}
+            <p>You can view full case details in your dashboard.</p>
+            <br>
+            <p>Best regards,<br>GGDS Benevolent Fund Team</p>
+        </div>
+    </body>
+</html>
+"""
+
+ADMIN_NEW_CASE_HTML = """\
+<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+            <h2 style="color: #273171;">New Case Requires Review</h2>
+            <p><strong>Case ID:</strong> {case_id}</p>
+            <p><strong>Case Type:</strong> {case_type}</p>
+            <p><strong>Member:</strong> {member_name}</p>
+            <p><strong>Urgency:</strong> {urgency}</p>
+            <p>Please review this case in the admin dashboard.</p>
+        </div>
+    </body>
+</html>
+"""
+
+CONTRIBUTION_CALL_HTML = """\
+<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+            <h2 style="color: #0ec434;">Contribution Call</h2>
+            <p>Dear {member_name},</p>
+            <p>A case has been approved and members are asked to contribute.</p>
+            <p><strong>Case ID:</strong> {case_id}</p>
+            <p><strong>Case Type:</strong> {case_type}</p>
+            <p><strong>On behalf of:</strong> {affected_member_name}</p>
+            <p><strong>Contribute by:</strong> {due_date}</p>
+            <p style="text-align: center; margin-top: 30px;">
+                <a href="{frontend_url}/dashboard" style="background-color: #0ec434; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block;">View Case</a>
+            </p>
+            <p>If you have any questions, please contact us at {admin_email}</p>
+            <br>
+            <p>Best regards,<br>GGDS Benevolent Fund Team</p>
+        </div>
+    </body>
+</html>
+"""
+
+NOTES_FRAGMENT = CompiledTemplate("<p><strong>Notes:</strong> {notes}</p>")
+
+WELCOME_SUBJECT = "Welcome to GGDS Benevolent Fund - Your Account Details"
+
+# Compiled once at import
+TEMPLATES: Dict[str, EmailTemplate] = {
+    "welcome_credentials": EmailTemplate(WELCOME_SUBJECT, WELCOME_CREDENTIALS_HTML),
+    "welcome": EmailTemplate(WELCOME_SUBJECT, WELCOME_HTML),
+    "case_confirmation": EmailTemplate("Case Submitted: {case_id}", CASE_CONFIRMATION_HTML),
+    "case_status_update": EmailTemplate("Case Status Update: {case_id}", CASE_STATUS_UPDATE_HTML),
+    "admin_new_case": EmailTemplate("New Case Submitted: {case_id} [{urgency}]", ADMIN_NEW_CASE_HTML),
+    "contribution_call": EmailTemplate("Contribution Call: {case_id}", CONTRIBUTION_CALL_HTML),
+}
+
+
+def render_email(name: str, **context) -> Tuple[str, str]:
+    """
+    Render a registered email template
+
+    Args:
+        name: Template name (key of TEMPLATES)
+        **context: Placeholder values; wrap trusted HTML in Markup
+
+    Returns:
+        (subject, html)
+    """
+    return TEMPLATES[name].render(**context)
@@ -0,0 +1,198 @@
+"""
+Background image normalization for uploaded documents
+
+Phone photos of case evidence are often several megabytes. After an image
+document is uploaded, ImageProcessor stores two derivatives next to the
+original in Spaces: a downscaled, recompressed display copy and a thumbnail.
+Both are rotated according to the EXIF orientation and then saved without
+any EXIF data, which also drops GPS tags. The original is kept untouched as
+evidence; downloads serve the display copy and only admins can fetch the
+original. Locally stored images get no derivatives.
+
+Derivative keys are derived from the original's key, so documents sharing a
+content blob share its derivatives too. Documents still waiting for their
+derivatives after a restart are picked up again at startup.
+"""
+
+import asyncio
+import io
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Optional, Set, Tuple
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import Document, DocumentStatus
+from app.services.storage import spaces_storage
+
+# Refuse images that would decode to more than this many pixels
+Image.MAX_IMAGE_PIXELS = 50_000_000
+
+
+def is_processable(file_type: Optional[str]) -> bool:
+    """Whether derivatives are generated for a content type"""
+    return bool(file_type) and file_type.startswith("image/")
+
+
+def derivative_keys(s3_key: str) -> Tuple[str, str]:
+    """Display and thumbnail keys stored next to an original"""
+    return f"{s3_key}.display.jpg", f"{s3_key}.thumb.jpg"
+
+
+def _encode_jpeg(image: Image.Image, max_px: int, quality: int) -> bytes:
+    image = image.copy()
+    image.thumbnail((max_px, max_px), Image.LANCZOS)  # Only ever shrinks
+    out = io.BytesIO()
+    # No exif= argument, so nothing from the original's metadata is written
+    image.save(out, format="JPEG", quality=quality, optimize=True, progressive=True)
+    return out.getvalue()
+
+
+def render_derivatives(data: bytes) -> Tuple[bytes, bytes]:
+    """
+    Build the display copy and thumbnail of an image
+
+    Runs in a worker thread (Pillow releases the GIL while decoding and
+    resampling).
+
+    Returns:
+        (display JPEG, thumbnail JPEG)
+
+    Raises:
+        UnidentifiedImageError, Image.DecompressionBombError: If the image cannot be used
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        image.draft("RGB", (settings.image_display_max_px, settings.image_display_max_px))  # Faster JPEG decode
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+
+        display = _encode_jpeg(image, settings.image_display_max_px, settings.image_jpeg_quality)
+        thumbnail = _encode_jpeg(image, settings.image_thumbnail_px, settings.image_jpeg_quality)
+    return display, thumbnail
+
+
+class ImageProcessor:
+    """Generates image derivatives in background tasks of this worker process"""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.image_processing_workers,
+            thread_name_prefix="images"
+        )
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Also bounds how many originals are held in memory at once
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(settings.image_processing_workers)
+        return self._slots
+
+    def schedule(self, document_id: uuid.UUID) -> None:
+        """Generate derivatives for a committed document in the background"""
+        task = asyncio.create_task(self._process(document_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def resume_pending(self, limit: int = 500) -> List[uuid.UUID]:
+        """Schedule uploaded images that have no derivatives yet (called at startup)"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Document.id)
+                .where(
+                    Document.status == DocumentStatus.UPLOADED,
+                    Document.s3_key.is_not(None),
+                    Document.file_type.like("image/%"),
+                    Document.image_processed_at.is_(None)
+                )
+                .limit(limit)
+            )
+            document_ids = list(result.scalars().all())
+
+        for document_id in document_ids:
+            self.schedule(document_id)
+        if document_ids:
+            print(f"🖼️  Resuming image processing for {len(document_ids)} documents")
+        return document_ids
+
+    async def stop(self) -> None:
+        """Cancel in-flight processing; it is resumed on the next startup"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _mark_processed(
+        self,
+        document_id: uuid.UUID,
+        display_key: Optional[str],
+        thumbnail_key: Optional[str]
+    ) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(Document)
+                .where(Document.id == document_id)
+                .values(
+                    display_key=display_key,
+                    thumbnail_key=thumbnail_key,
+                    image_processed_at=datetime.now(timezone.utc)
+                )
+            )
+            await db.commit()
+
+    async def _process(self, document_id: uuid.UUID) -> None:
+        async with AsyncSessionLocal() as db:
+            document = await db.get(Document, document_id)
+            if (
+                document is None
+                or document.status != DocumentStatus.UPLOADED
+                or not document.s3_key
+                or not is_processable(document.file_type)
+                or document.image_processed_at is not None
+            ):
+                return
+            s3_key = document.s3_key
+
+        display_key, thumbnail_key = derivative_keys(s3_key)
+        try:
+            async with self._get_slots():
+                # Another document with the same content may have made them already
+                if not (
+                    await spaces_storage.exists(display_key)
+                    and await spaces_storage.exists(thumbnail_key)
+                ):
+                    data = await spaces_storage.read(s3_key)
+                    loop = asyncio.get_running_loop()
+                    display, thumbnail = await loop.run_in_executor(self._executor, render_derivatives, data)
+                    del data
+                    await spaces_storage.put_bytes(display_key, display, "image/jpeg")
+                    await spaces_storage.put_bytes(thumbnail_key, thumbnail, "image/jpeg")
+        except (UnidentifiedImageError, Image.DecompressionBombError) as e:
+            # Not retried: only admins can download the original
+            print(f"⚠️  Skipping derivatives for document {document_id}: {str(e)}")
+            await self._mark_processed(document_id, None, None)
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Left unprocessed; retried on the next startup
+            print(f"❌ Image processing failed for document {document_id}: {str(e)}")
+            return
+
+        await self._mark_processed(document_id, display_key, thumbnail_key)
+        print(f"🖼️  Derivatives ready for document {document_id}")
+
+
+# Create singleton instance
+image_processor = ImageProcessor()
@@ -0,0 +1,309 @@
+"""
+Bulk member onboarding from a CSV file
+
+Rows are read from the uploaded file in batches. Each batch is validated with
+two lookup queries, gets a block of member IDs from the sequence, has its
+initial passwords hashed in parallel and is written with multi-row inserts,
+together with the members' welcome emails in the outbox.
+"""
+
+import asyncio
+import csv
+import io
+import uuid
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.models import EmailOutbox, Member, MemberStatus, User, UserRole
+from app.schemas.member import AdminMemberCreate, MemberImportResponse, MemberImportRowResult
+from app.services.email_outbox import email_outbox_worker, outbox_row
+from app.utils.member_utils import allocate_member_ids, build_full_name
+from app.utils.security import get_password_hash_async
+
+REQUIRED_COLUMNS = ("first_name", "surname", "phone", "email")
+OPTIONAL_COLUMNS = ("middle_name",)
+
+# (CSV line number, raw row values)
+CsvRow = Tuple[int, Dict[str, Optional[str]]]
+
+
+def _normalize_header(name: Optional[str]) -> str:
+    return (name or "").strip().lower().replace(" ", "_")
+
+
+def _open_reader(file: UploadFile) -> Tuple[io.TextIOWrapper, csv.DictReader]:
+    file.file.seek(0)
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    if reader.fieldnames:
+        reader.fieldnames = [_normalize_header(name) for name in reader.fieldnames]
+    return text, reader
+
+
+def _scan_file(file: UploadFile) -> int:
+    """Check the header and count data rows without keeping them in memory"""
+    text, reader = _open_reader(file)
+    try:
+        missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"CSV is missing required columns: {', '.join(missing)}"
+            )
+        return sum(1 for _ in reader)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV file must be UTF-8 encoded"
+        )
+    finally:
+        text.detach()  # Leave the upload open for the import pass
+
+
+def _read_batch(reader: csv.DictReader, size: int) -> List[CsvRow]:
+    batch = []
+    for row in reader:
+        batch.append((reader.line_num, row))
+        if len(batch) >= size:
+            break
+    return batch
+
+
+def _validation_errors(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in error.errors()
+    ]
+
+
+async def _hash_initial_passwords(password: str, count: int) -> List[str]:
+    """Hash the initial password once per member (unique salts), a few at a time"""
+    # Stay within the hashing pool so logins are not rejected during an import
+    semaphore = asyncio.Semaphore(settings.password_hash_workers)
+
+    async def hash_one() -> str:
+        async with semaphore:
+            return await get_password_hash_async(password)
+
+    return await asyncio.gather(*(hash_one() for _ in range(count)))
+
+
+async def _insert_rows(
+    db: AsyncSession,
+    user_rows: List[dict],
+    member_rows: List[dict],
+    outbox_rows: List[dict]
+) -> bool:
+    """
+    Insert members with their users and welcome emails in a savepoint
+
+    Returns:
+        False if a row conflicts with an existing email or phone (nothing is inserted)
+    """
+    try:
+        async with db.begin_nested():
+            await db.execute(insert(User), user_rows)
+            await db.execute(insert(Member), member_rows)
+            await db.execute(insert(EmailOutbox), outbox_rows)
+    except IntegrityError:
+        return False
+    return True
+
+
+async def _import_batch(
+    db: AsyncSession,
+    rows: List[CsvRow],
+    seen_emails: Set[str],
+    seen_phones: Set[str],
+    initial_password: str
+) -> List[MemberImportRowResult]:
+    """
+    Validate and insert one batch of rows
+
+    Returns:
+        Row results in file order
+    """
+    results: Dict[int, MemberImportRowResult] = {}
+    candidates: List[Tuple[int, AdminMemberCreate]] = []
+
+    for line, raw in rows:
+        values = {
+            column: (raw.get(column) or "").strip() or None
+            for column in REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+        }
+        try:
+            member_data = AdminMemberCreate(**values)
+        except ValidationError as e:
+            results[line] = MemberImportRowResult(
+                row=line, status="failed", email=values["email"], errors=_validation_errors(e)
+            )
+            continue
+
+        errors = []
+        if member_data.email in seen_emails:
+            errors.append("Email appears more than once in the file")
+        if member_data.phone in seen_phones:
+            errors.append("Phone number appears more than once in the file")
+        seen_emails.add(member_data.email)
+        seen_phones.add(member_data.phone)
+
+        if errors:
+            results[line] = MemberImportRowResult(
+                row=line, status="failed", email=member_data.email, errors=errors
+            )
+        else:
+            candidates.append((line, member_data))
+
+    if candidates:
+        existing_emails = set((await db.scalars(
+            select(User.email).where(User.email.in_([data.email for _, data in candidates]))
+        )).all())
+        existing_phones = set((await db.scalars(
+            select(Member.phone).where(Member.phone.in_([data.phone for _, data in candidates]))
+        )).all())
+
+        valid = []
+        for line, member_data in candidates:
+            errors = []
+            if member_data.email in existing_emails:
+                errors.append("Email already registered")
+            if member_data.phone in existing_phones:
+                errors.append("Phone number already registered")
+
+            if errors:
+                results[line] = MemberImportRowResult(
+                    row=line, status="failed", email=member_data.email, errors=errors
+                )
+            else:
+                valid.append((line, member_data))
+        candidates = valid
+
+    if candidates:
+        member_ids = await allocate_member_ids(db, len(candidates))
+        hashed_passwords = await _hash_initial_passwords(initial_password, len(candidates))
+
+        user_rows = []
+        member_rows = []
+        outbox_rows = []
+        for (line, member_data), member_id, hashed_password in zip(candidates, member_ids, hashed_passwords):
+            user_id = uuid.uuid4()
+            full_name = build_full_name(member_data.first_name, member_data.middle_name, member_data.surname)
+            user_rows.append({
+                "id": user_id,
+                "email": member_data.email,
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "role": UserRole.MEMBER,
+            })
+            member_rows.append({
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "member_id": member_id,
+                "full_name": full_name,
+                "email": member_data.email,
+                "phone": member_data.phone,
+                "status": MemberStatus.ACTIVE,
+                "profile_completed": False,  # PIVOT v2.0: Must complete profile on first login
+                "is_first_login": True,
+                "on_probation": False,
+                "join_date": date.today(),
+            })
+            outbox_rows.append(outbox_row(
+                "send_welcome_email",
+                to_email=member_data.email,
+                member_name=full_name,
+                member_id=member_id,
+                initial_password=initial_password
+            ))
+
+        inserted = set(range(len(candidates)))
+        if not await _insert_rows(db, user_rows, member_rows, outbox_rows):
+            # Another request registered some of these emails/phones since
+            # the lookup; insert row by row so only those rows fail
+            inserted = {
+                index for index in inserted
+                if await _insert_rows(db, user_rows[index:index + 1], member_rows[index:index + 1], outbox_rows[index:index + 1])
+            }
+        await db.commit()
+
+        for index, (line, member_data) in enumerate(candidates):
+            if index in inserted:
+                results[line] = MemberImportRowResult(
+                    row=line, status="created", email=member_data.email, member_id=member_rows[index]["member_id"]
+                )
+            else:
+                results[line] = MemberImportRowResult(
+                    row=line,
+                    status="failed",
+                    email=member_data.email,
+                    errors=["Conflicts with a member created during the import, please retry this row"]
+                )
+        if inserted:
+            email_outbox_worker.notify()
+
+    return [results[line] for line, _ in rows]
+
+
+async def import_members_from_csv(
+    db: AsyncSession,
+    file: UploadFile,
+    initial_password: str
+) -> MemberImportResponse:
+    """
+    Create member accounts from a CSV upload
+
+    The CSV needs a header row with first_name, surname, phone and email
+    columns (middle_name is optional). Each batch is committed on its own, so
+    a bad row never blocks the rest of the file.
+
+    Args:
+        db: Database session
+        file: Uploaded CSV file
+        initial_password: Initial password given to every created member
+
+    Returns:
+        Import report with one result per row
+
+    Raises:
+        HTTPException: If the header is invalid or the file has too many rows
+    """
+    total_rows = await run_in_threadpool(_scan_file, file)
+    if total_rows > settings.member_import_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV has {total_rows} rows; the maximum per import is {settings.member_import_max_rows}"
+        )
+
+    results: List[MemberImportRowResult] = []
+    seen_emails: Set[str] = set()
+    seen_phones: Set[str] = set()
+
+    text, reader = _open_reader(file)
+    try:
+        while True:
+            rows = await run_in_threadpool(_read_batch, reader, settings.member_import_batch_size)
+            if not rows:
+                break
+
+            results.extend(await _import_batch(
+                db, rows, seen_emails, seen_phones, initial_password
+            ))
+    finally:
+        text.detach()
+
+    created = sum(1 for result in results if result.status == "created")
+    return MemberImportResponse(
+        total_rows=len(results),
+        created=created,
+        failed=len(results) - created,
+        initial_password=initial_password,
+        results=results
+    )
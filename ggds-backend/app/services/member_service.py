@@ -1,9 +1,12 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import Optional
 
 from app.models import Member, FamilyMember, NextOfKin, User
+from app.models.member import member_number_seq
 from app.schemas.member import MemberCreate, FamilyMemberCreate, NextOfKinCreate
+from app.services.email_outbox import queue_email
 
 
 def generate_member_id(db: Session) -> str:
@@ -11,27 +14,15 @@ def generate_member_id(db: Session) -> str:
     Generate unique member ID in format: GGDS-YYYY-XXX
 
     Example: GGDS-2025-001
+
+    The number comes from the shared member_number_seq sequence, so it never
+    collides with admin-created GGDS-XXXX IDs or concurrent registrations.
     """
     year = datetime.now().year
-    prefix = f"GGDS-{year}-"
-
-    # Get the latest member for this year
-    latest_member = (
-        db.query(Member)
-        .filter(Member.member_id.like(f"{prefix}%"))
-        .order_by(Member.member_id.desc())
-        .first()
-    )
-
-    if latest_member:
-        # Extract number and increment
-        last_number = int(latest_member.member_id.split("-")[-1])
-        new_number = last_number + 1
-    else:
-        new_number = 1
+    new_number = db.scalar(select(member_number_seq.next_value()))
 
     # Format as 3-digit number
-    return f"{prefix}{new_number:03d}"
+    return f"GGDS-{year}-{new_number:03d}"
 
 
 def create_member_registration(
@@ -41,6 +32,8 @@ def create_member_registration(
 ) -> Member:
     """
     Create a complete member registration with family and next of kin
+
+    Queues the welcome email in the same transaction.
     """
     # Generate unique member ID
     member_id = generate_member_id(db)
@@ -98,6 +91,14 @@ def create_member_registration(
         )
         db.add(next_of_kin)
 
+    queue_email(
+        db,
+        "send_welcome_email",
+        to_email=new_member.email,
+        member_name=new_member.full_name,
+        member_id=new_member.member_id
+    )
+
     db.commit()
     db.refresh(new_member)
 
@@ -1,10 +1,18 @@
 """
 Digital Ocean Spaces Service for file storage and management
 Spaces is S3-compatible, so we use boto3 with a custom endpoint
+
+boto3 is blocking. Async code should go through async_s3_service, which runs
+the calls on a dedicated thread pool sized to the client's connection pool.
 """
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional, BinaryIO
+from typing import AsyncIterator, Optional, BinaryIO, Dict, List
 import uuid
 from datetime import datetime, timedelta
 import mimetypes
@@ -23,12 +31,32 @@ class S3Service:
             aws_access_key_id=settings.spaces_access_key,
             aws_secret_access_key=settings.spaces_secret_key,
             endpoint_url=settings.spaces_endpoint_url,
-            region_name=settings.spaces_region
+            region_name=settings.spaces_region,
+            config=Config(
+                max_pool_connections=settings.spaces_max_pool_connections,
+                connect_timeout=settings.spaces_connect_timeout_seconds,
+                read_timeout=settings.spaces_read_timeout_seconds,
+                retries={'max_attempts': settings.spaces_max_attempts, 'mode': 'standard'},
+                tcp_keepalive=True
+            )
         )
         self.bucket_name = settings.spaces_bucket
         self.endpoint_url = settings.spaces_endpoint_url
         self.region = settings.spaces_region
 
+    def build_file_key(self, filename: str, folder: str = "documents") -> str:
+        """Unique object key under a folder, keeping the original extension"""
+        file_extension = os.path.splitext(filename)[1]
+        return f"{folder}/{uuid.uuid4()}{file_extension}"
+
+    def file_url(self, file_key: str) -> str:
+        """
+        Public URL of an object
+
+        Format: https://bucket-name.region.digitaloceanspaces.com/file-key
+        """
+        return f"https://{self.bucket_name}.{self.region}.digitaloceanspaces.com/{file_key}"
+
     def upload_file(
         self,
         file_obj: BinaryIO,
@@ -53,10 +81,7 @@ class S3Service:
                 'filename': str   # Original filename
             }
         """
-        # Generate unique filename
-        file_extension = os.path.splitext(filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        file_key = f"{folder}/{unique_filename}"
+        file_key = self.build_file_key(filename, folder)
 
         # Detect content type if not provided
         if not content_type:
@@ -79,13 +104,9 @@ class S3Service:
                 }
             )
 
-            # Generate file URL for Digital Ocean Spaces
-            # Format: https://bucket-name.region.digitaloceanspaces.com/file-key
-            file_url = f"https://{self.bucket_name}.{self.region}.digitaloceanspaces.com/{file_key}"
-
             return {
                 'file_key': file_key,
-                'file_url': file_url,
+                'file_url': self.file_url(file_key),
                 'bucket': self.bucket_name,
                 'filename': filename
             }
@@ -93,6 +114,118 @@ class S3Service:
         except ClientError as e:
             raise Exception(f"Failed to upload file to Digital Ocean Spaces: {str(e)}")
 
+    def put_object(
+        self,
+        file_key: str,
+        body: bytes,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> dict:
+        """
+        Store a small object with a single PUT
+
+        Args:
+            file_key: S3 object key
+            body: Object contents
+            content_type: MIME type of the object
+            metadata: User metadata stored with the object
+
+        Returns:
+            dict: {'file_key': str, 'file_url': str, 'etag': str}
+        """
+        try:
+            response = self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                Body=body,
+                ContentType=content_type,
+                Metadata=metadata or {}
+            )
+            return {
+                'file_key': file_key,
+                'file_url': self.file_url(file_key),
+                'etag': response.get('ETag')
+            }
+        except ClientError as e:
+            raise Exception(f"Failed to upload file to Digital Ocean Spaces: {str(e)}")
+
+    def create_multipart_upload(
+        self,
+        file_key: str,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Start a multipart upload
+
+        Returns:
+            str: Upload ID to pass to upload_part / complete / abort
+        """
+        try:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                ContentType=content_type,
+                Metadata=metadata or {}
+            )
+            return response['UploadId']
+        except ClientError as e:
+            raise Exception(f"Failed to start multipart upload: {str(e)}")
+
+    def upload_part(self, file_key: str, upload_id: str, part_number: int, body: bytes) -> dict:
+        """
+        Upload one part of a multipart upload
+
+        Every part except the last must be at least 5MB.
+
+        Returns:
+            dict: {'PartNumber': int, 'ETag': str}, as complete_multipart_upload expects
+        """
+        try:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return {'PartNumber': part_number, 'ETag': response['ETag']}
+        except ClientError as e:
+            raise Exception(f"Failed to upload part {part_number}: {str(e)}")
+
+    def complete_multipart_upload(self, file_key: str, upload_id: str, parts: List[dict]) -> dict:
+        """
+        Assemble the uploaded parts into the final object
+
+        Returns:
+            dict: {'file_key': str, 'file_url': str, 'etag': str}
+        """
+        try:
+            response = self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+            return {
+                'file_key': file_key,
+                'file_url': self.file_url(file_key),
+                'etag': response.get('ETag')
+            }
+        except ClientError as e:
+            raise Exception(f"Failed to complete multipart upload: {str(e)}")
+
+    def abort_multipart_upload(self, file_key: str, upload_id: str) -> None:
+        """Discard a multipart upload and its stored parts (best effort)"""
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id
+            )
+        except ClientError as e:
+            print(f"Failed to abort multipart upload {upload_id}: {str(e)}")
+
     def generate_presigned_url(
         self,
         file_key: str,
@@ -121,6 +254,19 @@ class S3Service:
         except ClientError as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
 
+    def generate_presigned_urls(self, file_keys: List[str], expiration: int = 3600) -> Dict[str, str]:
+        """
+        Generate download URLs for many objects at once
+
+        Args:
+            file_keys: S3 object keys
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            dict: Presigned URL per key
+        """
+        return {file_key: self.generate_presigned_url(file_key, expiration) for file_key in file_keys}
+
     def generate_presigned_upload_url(
         self,
         file_key: str,
@@ -160,6 +306,141 @@ class S3Service:
         except ClientError as e:
             raise Exception(f"Failed to generate presigned upload URL: {str(e)}")
 
+    def generate_presigned_part_url(
+        self,
+        file_key: str,
+        upload_id: str,
+        part_number: int,
+        expiration: int = 3600
+    ) -> str:
+        """
+        Generate a presigned URL for uploading one part of a multipart upload
+
+        Args:
+            file_key: S3 object key
+            upload_id: ID from create_multipart_upload
+            part_number: 1-based part number
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            str: Presigned URL for a PUT request; the response carries the part's ETag
+        """
+        try:
+            return self.s3_client.generate_presigned_url(
+                'upload_part',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': file_key,
+                    'UploadId': upload_id,
+                    'PartNumber': part_number
+                },
+                ExpiresIn=expiration
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to generate presigned part URL: {str(e)}")
+
+    def read_object(self, file_key: str) -> bytes:
+        """
+        Read a whole object into memory (only for objects known to be small)
+
+        Returns:
+            bytes: Object contents
+        """
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=file_key
+            )
+            return response['Body'].read()
+        except ClientError as e:
+            raise Exception(f"Failed to read file from Digital Ocean Spaces: {str(e)}")
+
+    def read_range(self, file_key: str, start: int, end: int) -> bytes:
+        """
+        Read bytes start..end (inclusive) of an object
+
+        Returns:
+            bytes: The requested range (shorter if the object is smaller)
+        """
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                Range=f"bytes={start}-{end}"
+            )
+            return response['Body'].read()
+        except ClientError as e:
+            raise Exception(f"Failed to read file from Digital Ocean Spaces: {str(e)}")
+
+    def open_object(
+        self,
+        file_key: str,
+        byte_range: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        if_match: Optional[str] = None
+    ) -> dict:
+        """
+        Start reading an object (or part of it) without loading it
+
+        The caller reads the body in chunks and must close it. Conditional
+        and range failures are returned as a status rather than raised.
+
+        Args:
+            file_key: S3 object key
+            byte_range: HTTP Range value for a single range (e.g. "bytes=0-1023")
+            if_none_match: ETags the caller already has (304 if one matches)
+            if_match: Only read the object if its ETag matches (412 otherwise)
+
+        Returns:
+            dict: {
+                'status': int,  # 200, 206, 304, 404, 412 or 416
+                'body': Optional[StreamingBody],  # Set for 200 and 206
+                'size': Optional[int],  # Bytes in the body (object size for 416)
+                'content_range': Optional[str],  # "bytes start-end/total" for 206
+                'content_type': Optional[str],
+                'etag': Optional[str],
+                'last_modified': Optional[datetime]
+            }
+        """
+        params = {'Bucket': self.bucket_name, 'Key': file_key}
+        if byte_range:
+            params['Range'] = byte_range
+        if if_none_match:
+            params['IfNoneMatch'] = if_none_match
+        if if_match:
+            params['IfMatch'] = if_match
+
+        try:
+            response = self.s3_client.get_object(**params)
+        except ClientError as e:
+            status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            if status not in (304, 404, 412, 416):
+                raise Exception(f"Failed to read file from Digital Ocean Spaces: {str(e)}")
+
+            result = {
+                'status': status,
+                'body': None,
+                'size': None,
+                'content_range': None,
+                'content_type': None,
+                'etag': e.response.get('ResponseMetadata', {}).get('HTTPHeaders', {}).get('etag'),
+                'last_modified': None
+            }
+            if status == 416:
+                # The size is needed for the Content-Range of the error response
+                result['size'] = self.get_file_metadata(file_key)['content_length']
+            return result
+
+        return {
+            'status': 206 if response.get('ContentRange') else 200,
+            'body': response['Body'],
+            'size': response['ContentLength'],
+            'content_range': response.get('ContentRange'),
+            'content_type': response.get('ContentType'),
+            'etag': response.get('ETag'),
+            'last_modified': response.get('LastModified')
+        }
+
     def delete_file(self, file_key: str) -> bool:
         """
         Delete a file from S3
@@ -217,15 +498,65 @@ class S3Service:
                 'content_type': response.get('ContentType'),
                 'content_length': response.get('ContentLength'),
                 'last_modified': response.get('LastModified'),
+                'etag': response.get('ETag'),
                 'metadata': response.get('Metadata', {})
             }
         except ClientError as e:
             raise Exception(f"Failed to get file metadata: {str(e)}")
 
+    def list_files_page(
+        self,
+        prefix: str = "",
+        continuation_token: Optional[str] = None,
+        max_keys: int = 1000
+    ) -> dict:
+        """
+        List one page of files (at most 1000 per request)
+
+        Args:
+            prefix: Filter files by prefix (folder path)
+            continuation_token: next_token from the previous page
+            max_keys: Maximum number of files in the page
+
+        Returns:
+            dict: {
+                'files': list,  # File information dictionaries
+                'next_token': Optional[str]  # None on the last page
+            }
+        """
+        params = {
+            'Bucket': self.bucket_name,
+            'Prefix': prefix,
+            'MaxKeys': min(max_keys, 1000)
+        }
+        if continuation_token:
+            params['ContinuationToken'] = continuation_token
+
+        try:
+            response = self.s3_client.list_objects_v2(**params)
+        except ClientError as e:
+            raise Exception(f"Failed to list files: {str(e)}")
+
+        files = []
+        for obj in response.get('Contents', []):
+            files.append({
+                'key': obj['Key'],
+                'size': obj['Size'],
+                'last_modified': obj['LastModified'],
+                'url': self.file_url(obj['Key'])
+            })
+
+        return {
+            'files': files,
+            'next_token': response.get('NextContinuationToken') if response.get('IsTruncated') else None
+        }
+
     def list_files(self, prefix: str = "", max_keys: int = 1000) -> list:
         """
         List files in S3 bucket with optional prefix
 
+        Follows continuation tokens, so more than 1000 files can be listed.
+
         Args:
             prefix: Filter files by prefix (folder path)
             max_keys: Maximum number of files to return
@@ -233,26 +564,140 @@ class S3Service:
         Returns:
             list: List of file information dictionaries
         """
+        files = []
+        token = None
+        while len(files) < max_keys:
+            page = self.list_files_page(prefix, token, max_keys - len(files))
+            files.extend(page['files'])
+            token = page['next_token']
+            if not token:
+                break
+        return files
+
+    def delete_files(self, file_keys: List[str]) -> dict:
+        """
+        Delete many files with DeleteObjects (1000 keys per request)
+
+        Args:
+            file_keys: S3 object keys
+
+        Returns:
+            dict: {
+                'deleted': list,  # Keys that are gone
+                'errors': dict    # Error message per key that could not be deleted
+            }
+        """
+        deleted = []
+        errors = {}
+        for start in range(0, len(file_keys), 1000):
+            batch = file_keys[start:start + 1000]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+            except ClientError as e:
+                errors.update({key: str(e) for key in batch})
+                continue
+
+            # Quiet mode only reports failures
+            failed = {error['Key']: error.get('Message', error.get('Code', '')) for error in response.get('Errors', [])}
+            errors.update(failed)
+            deleted.extend(key for key in batch if key not in failed)
+
+        return {'deleted': deleted, 'errors': errors}
+
+
+class AsyncS3Service:
+    """
+    Non-blocking facade over S3Service
+
+    Each call runs on a dedicated thread pool with one thread per pooled HTTP
+    connection, so transfers to Spaces overlap with other requests without
+    competing with FastAPI's default threadpool.
+
+    Presigning is local CPU work with no network round trip, so a single
+    generate_presigned_url stays synchronous on S3Service; only batches are
+    signed here.
+    """
+
+    def __init__(self, service: S3Service, max_workers: int):
+        self.service = service
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="spaces")
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def upload_file(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.upload_file, *args, **kwargs)
+
+    async def put_object(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.put_object, *args, **kwargs)
+
+    async def create_multipart_upload(self, *args, **kwargs) -> str:
+        return await self._run(self.service.create_multipart_upload, *args, **kwargs)
+
+    async def upload_part(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.upload_part, *args, **kwargs)
+
+    async def complete_multipart_upload(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.complete_multipart_upload, *args, **kwargs)
+
+    async def abort_multipart_upload(self, *args, **kwargs) -> None:
+        return await self._run(self.service.abort_multipart_upload, *args, **kwargs)
+
+    async def read_object(self, *args, **kwargs) -> bytes:
+        return await self._run(self.service.read_object, *args, **kwargs)
+
+    async def read_range(self, *args, **kwargs) -> bytes:
+        return await self._run(self.service.read_range, *args, **kwargs)
+
+    async def open_object(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.open_object, *args, **kwargs)
+
+    async def iter_object(self, file_key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Read an object chunk by chunk; only one chunk is in memory at a time"""
+        response = await self.open_object(file_key)
+        if response['body'] is None:
+            raise Exception(f"Failed to read file from Digital Ocean Spaces: HTTP {response['status']}")
+        async for chunk in self.iter_body(response['body'], chunk_size):
+            yield chunk
+
+    async def iter_body(self, body, chunk_size: int) -> AsyncIterator[bytes]:
+        """Read an opened object body chunk by chunk, closing it at the end"""
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
+            while chunk := await self._run(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
 
-            files = []
-            for obj in response.get('Contents', []):
-                files.append({
-                    'key': obj['Key'],
-                    'size': obj['Size'],
-                    'last_modified': obj['LastModified'],
-                    'url': f"https://{self.bucket_name}.{self.region}.digitaloceanspaces.com/{obj['Key']}"
-                })
+    async def generate_presigned_urls(self, *args, **kwargs) -> Dict[str, str]:
+        return await self._run(self.service.generate_presigned_urls, *args, **kwargs)
 
-            return files
-        except ClientError as e:
-            raise Exception(f"Failed to list files: {str(e)}")
+    async def delete_file(self, *args, **kwargs) -> bool:
+        return await self._run(self.service.delete_file, *args, **kwargs)
+
+    async def file_exists(self, *args, **kwargs) -> bool:
+        return await self._run(self.service.file_exists, *args, **kwargs)
+
+    async def get_file_metadata(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.get_file_metadata, *args, **kwargs)
+
+    async def list_files(self, *args, **kwargs) -> list:
+        return await self._run(self.service.list_files, *args, **kwargs)
+
+    async def list_files_page(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.list_files_page, *args, **kwargs)
+
+    async def delete_files(self, *args, **kwargs) -> dict:
+        return await self._run(self.service.delete_files, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Stop the storage threads (queued calls are cancelled)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Create global Spaces service instance
 s3_service = S3Service()
+async_s3_service = AsyncS3Service(s3_service, max_workers=settings.spaces_max_pool_connections)
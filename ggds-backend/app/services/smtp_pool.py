@@ -0,0 +1,172 @@
+"""
+Pool of persistent, authenticated SMTP connections
+
+Opening a connection to the SMTP server costs a TCP handshake, STARTTLS and
+AUTH, which dominates the time to send a single message. The pool keeps a few
+logged-in connections open and hands them out per message, checking idle
+connections with NOOP and reconnecting when the server has dropped them.
+"""
+
+import asyncio
+import time
+from email.message import Message
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import aiosmtplib
+
+from app.config import settings
+
+
+class _PooledConnection:
+    """An SMTP client plus the bookkeeping the pool needs"""
+
+    def __init__(self, smtp: aiosmtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+        self.messages_sent = 0
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of logged-in SMTP connections
+
+    At most `size` messages are in flight at once; further senders wait for a
+    connection. Connections are reused until the server drops them or they
+    reach `max_messages_per_connection`.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        health_check_seconds: float,
+        max_messages_per_connection: int,
+        hostname: Optional[str] = None,
+        port: Optional[int] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: Optional[bool] = None
+    ):
+        self.size = max(1, size)
+        self.health_check_seconds = health_check_seconds
+        self.max_messages_per_connection = max_messages_per_connection
+        self.hostname = hostname or settings.smtp_host
+        self.port = port or settings.smtp_port
+        self.username = username if username is not None else settings.smtp_username
+        self.password = password if password is not None else settings.smtp_password
+        self.use_tls = settings.smtp_use_tls if use_tls is None else use_tls
+
+        self._idle: List[_PooledConnection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.connections_opened = 0
+        self.messages_sent = 0
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore belongs to the running event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        return self._slots
+
+    async def _connect(self) -> _PooledConnection:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username or None,
+            password=self.password or None,
+            use_tls=self.use_tls,
+            timeout=settings.smtp_timeout_seconds,
+        )
+        await smtp.connect()  # Also runs STARTTLS and AUTH
+        self.connections_opened += 1
+        return _PooledConnection(smtp)
+
+    async def _close(self, conn: _PooledConnection) -> None:
+        try:
+            await conn.smtp.quit()
+        except Exception:
+            conn.smtp.close()
+
+    async def _is_healthy(self, conn: _PooledConnection) -> bool:
+        if not conn.smtp.is_connected:
+            return False
+        if conn.messages_sent >= self.max_messages_per_connection:
+            return False
+        if time.monotonic() - conn.last_used < self.health_check_seconds:
+            return True
+
+        # Idle for a while: the server may have timed the session out
+        try:
+            await conn.smtp.noop()
+            return True
+        except (aiosmtplib.SMTPException, OSError):
+            return False
+
+    async def _checkout(self) -> _PooledConnection:
+        while self._idle:
+            conn = self._idle.pop()
+            if await self._is_healthy(conn):
+                return conn
+            await self._close(conn)
+        return await self._connect()
+
+    def _checkin(self, conn: _PooledConnection) -> None:
+        conn.last_used = time.monotonic()
+        conn.messages_sent += 1
+        self.messages_sent += 1
+        self._idle.append(conn)
+
+    async def _send(self, send: Callable[[aiosmtplib.SMTP], Awaitable]) -> None:
+        """
+        Run a send call on a pooled connection
+
+        A connection that turns out to be dead is replaced and the message is
+        retried once on a fresh connection.
+
+        Raises:
+            aiosmtplib.SMTPException: If the server rejects the message
+            OSError: If the server cannot be reached
+        """
+        async with self._get_slots():
+            conn = await self._checkout()
+            try:
+                await send(conn.smtp)
+            except aiosmtplib.SMTPResponseException:
+                # Server rejected this message; the session itself is still usable
+                self._checkin(conn)
+                raise
+            except OSError:
+                # Dropped connection (includes SMTPServerDisconnected and timeouts)
+                await self._close(conn)
+                conn = await self._connect()
+                try:
+                    await send(conn.smtp)
+                except Exception:
+                    await self._close(conn)
+                    raise
+            except Exception:
+                await self._close(conn)
+                raise
+
+            self._checkin(conn)
+
+    async def send_message(self, message: Message) -> None:
+        """Send an email.message.Message over a pooled connection"""
+        await self._send(lambda smtp: smtp.send_message(message))
+
+    async def sendmail(self, sender: str, recipients: Sequence[str], message: bytes) -> None:
+        """Send an already serialized message over a pooled connection"""
+        await self._send(lambda smtp: smtp.sendmail(sender, list(recipients), message))
+
+    async def close(self) -> None:
+        """Close all idle connections"""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._close(conn)
+
+    def stats(self) -> Dict[str, int]:
+        """Pool counters for health checks and benchmarks"""
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "connections_opened": self.connections_opened,
+            "messages_sent": self.messages_sent,
+        }
@@ -0,0 +1,467 @@
+"""
+Storage backends for uploaded documents
+
+Documents are stored in Digital Ocean Spaces (SpacesStorage) or on the local
+filesystem (LocalStorage) for self-hosted deployments and as the fallback when
+Spaces is unreachable. STORAGE_BACKEND picks the primary backend.
+
+Both backends take and return files as a stream of chunks, so neither
+needs a whole file in memory, and address files by key. Local keys fan out
+over directories named after the content hash prefix (cases/ab/cd/<file>),
+which keeps any single directory small. Local downloads are served with
+FileResponse, which streams from disk and hands the path to the server for
+zero-copy sending where the server supports it; byte ranges are read from
+disk directly. Spaces downloads redirect to
+presigned URLs, or are proxied with ranged GetObject calls where clients
+cannot reach the bucket.
+"""
+
+import os
+import re
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from email.utils import format_datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional
+from urllib.parse import quote
+
+from fastapi import HTTPException
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+
+from app.config import settings
+from app.services.s3_service import async_s3_service, s3_service
+from app.utils.cache import TTLCache
+
+# Returns the next chunk of a file, b"" at the end
+ChunkSource = Callable[[], Awaitable[bytes]]
+
+
+def fanout_key(folder: str, sha256: str, filename: str) -> str:
+    """Key spreading files over hash-prefix directories: folder/ab/cd/filename"""
+    return f"{folder}/{sha256[:2]}/{sha256[2:4]}/{filename}"
+
+
+_SINGLE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def single_byte_range(header: Optional[str]) -> Optional[str]:
+    """
+    Range header value to pass on to storage
+
+    Returns None for multiple or malformed ranges, which are ignored (the
+    whole file is sent, as HTTP allows).
+    """
+    match = _SINGLE_RANGE.match((header or "").replace(" ", ""))
+    if not match or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if start and end and int(end) < int(start):
+        return None
+    return f"bytes={start}-{end}"
+
+
+def content_disposition(filename: str, disposition_type: str = "inline") -> str:
+    """Content-Disposition value, RFC 5987 encoded for non-ASCII names"""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition_type}; filename*=utf-8''{quoted}"
+    return f'{disposition_type}; filename="{filename}"'
+
+
+class StorageBackend(ABC):
+    """Where document files live"""
+
+    name: str
+
+    @abstractmethod
+    async def put_stream(
+        self,
+        key: str,
+        read_chunk: ChunkSource,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Store a file read chunk by chunk; nothing is left behind on failure"""
+
+    @abstractmethod
+    async def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        """Store a small file held in memory"""
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes:
+        """Read a whole (small) file"""
+
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Read a file chunk by chunk (close the iterator if you stop early)"""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Whether a file is stored under the key"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete a file; True if it is gone afterwards"""
+
+    @abstractmethod
+    async def download_response(
+        self,
+        key: str,
+        filename: str,
+        content_type: str,
+        request_headers: Optional[Mapping[str, str]] = None
+    ) -> Response:
+        """Response that delivers the file to the client (honouring Range where supported)"""
+
+
+class SpacesStorage(StorageBackend):
+    """Digital Ocean Spaces, through the non-blocking S3 client"""
+
+    name = "spaces"
+
+    def __init__(self):
+        # Signed download URLs by key, dropped a safety margin before they expire.
+        # The cache TTL is only an upper bound; each entry expires with its own URL.
+        self.url_cache = TTLCache(
+            max_size=settings.presigned_url_cache_size,
+            ttl=7 * 24 * 3600  # Longest validity SigV4 allows
+        )
+
+    async def put_stream(
+        self,
+        key: str,
+        read_chunk: ChunkSource,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Stream a file to Spaces, holding at most one multipart part in memory
+
+        Files that fit in a single part are stored with one PUT; larger ones
+        use a multipart upload, which is aborted if anything goes wrong.
+        """
+        metadata = {**(metadata or {}), "uploaded_at": datetime.utcnow().isoformat()}
+        part_bytes = settings.upload_part_bytes
+
+        buffer = bytearray()
+        while len(buffer) < part_bytes:
+            chunk = await read_chunk()
+            if not chunk:
+                break
+            buffer += chunk
+
+        if len(buffer) < part_bytes:
+            await async_s3_service.put_object(key, bytes(buffer), content_type, metadata)
+            return
+
+        upload_id = await async_s3_service.create_multipart_upload(key, content_type, metadata)
+        parts = []
+        try:
+            while True:
+                if len(buffer) >= part_bytes or (buffer and not chunk):
+                    body = bytes(buffer[:part_bytes])
+                    del buffer[:part_bytes]
+                    parts.append(await async_s3_service.upload_part(key, upload_id, len(parts) + 1, body))
+                elif not chunk:
+                    break
+                else:
+                    chunk = await read_chunk()
+                    buffer += chunk
+            await async_s3_service.complete_multipart_upload(key, upload_id, parts)
+        except BaseException:
+            await async_s3_service.abort_multipart_upload(key, upload_id)
+            raise
+
+    async def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        await async_s3_service.put_object(key, data, content_type)
+
+    async def read(self, key: str) -> bytes:
+        return await async_s3_service.read_object(key)
+
+    def iter_chunks(self, key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        return async_s3_service.iter_object(key, chunk_size)
+
+    async def exists(self, key: str) -> bool:
+        return await async_s3_service.file_exists(key)
+
+    async def delete(self, key: str) -> bool:
+        self.url_cache.pop(key)
+        return await async_s3_service.delete_file(key)
+
+    def presigned_url(self, key: str, expiration: int = 3600) -> str:
+        """
+        Download URL for an object, reused while it stays valid for longer
+        than the safety margin (so it may expire sooner than `expiration`)
+        """
+        url = self.url_cache.get(key)
+        if url is None:
+            url = s3_service.generate_presigned_url(key, expiration)
+            self.url_cache.set(key, url, ttl=expiration - settings.presigned_url_safety_margin_seconds)
+        return url
+
+    async def presigned_urls(self, keys: List[str], expiration: int = 3600) -> Dict[str, str]:
+        """Download URLs for many objects; cache misses are signed in one batch off the event loop"""
+        urls = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            urls[key] = self.url_cache.get(key)
+            if urls[key] is None:
+                missing.append(key)
+
+        if missing:
+            signed = await async_s3_service.generate_presigned_urls(missing, expiration)
+            ttl = expiration - settings.presigned_url_safety_margin_seconds
+            for key, url in signed.items():
+                urls[key] = url
+                self.url_cache.set(key, url, ttl=ttl)
+        return urls
+
+    async def download_response(
+        self,
+        key: str,
+        filename: str,
+        content_type: str,
+        request_headers: Optional[Mapping[str, str]] = None
+    ) -> Response:
+        """
+        Redirect to a presigned URL, so the bytes never pass through the API,
+        or stream the file through the API if SPACES_PROXY_DOWNLOADS is set
+        """
+        if settings.spaces_proxy_downloads:
+            return await self.proxy_response(key, filename, content_type, request_headers or {})
+        return RedirectResponse(self.presigned_url(key), status_code=307)
+
+    async def proxy_response(
+        self,
+        key: str,
+        filename: str,
+        content_type: str,
+        request_headers: Mapping[str, str]
+    ) -> Response:
+        """
+        Stream an object through the API with one GetObject call
+
+        Range, If-Range and If-None-Match are passed on to Spaces, so a
+        resumed download or a PDF viewer fetching a few pages only transfers
+        the requested bytes, and a cached copy costs no transfer at all.
+
+        Raises:
+            HTTPException: If the object does not exist
+        """
+        byte_range = single_byte_range(request_headers.get("range"))
+        if_range = request_headers.get("if-range")
+        if byte_range and if_range and not if_range.startswith('"'):
+            byte_range = None  # Date or weak validator: send the whole file
+        if_none_match = request_headers.get("if-none-match")
+
+        obj = await async_s3_service.open_object(
+            key,
+            byte_range=byte_range,
+            if_none_match=if_none_match,
+            if_match=if_range if byte_range and if_range else None
+        )
+        if obj["status"] == 412:
+            # The file changed since the client's partial copy
+            obj = await async_s3_service.open_object(key, if_none_match=if_none_match)
+
+        headers = {"cache-control": "private, no-cache"}
+        if obj["etag"]:
+            headers["etag"] = obj["etag"]
+
+        if obj["status"] == 304:
+            return Response(status_code=304, headers=headers)
+        if obj["status"] == 404:
+            raise HTTPException(status_code=404, detail="File not found in storage")
+        if obj["status"] == 416:
+            return Response(status_code=416, headers={"content-range": f"bytes */{obj['size']}"})
+
+        headers.update({
+            "accept-ranges": "bytes",
+            "content-length": str(obj["size"]),
+            "content-disposition": content_disposition(filename)
+        })
+        if obj["content_range"]:
+            headers["content-range"] = obj["content_range"]
+        if obj["last_modified"]:
+            headers["last-modified"] = format_datetime(obj["last_modified"], usegmt=True)
+
+        return StreamingResponse(
+            async_s3_service.iter_body(obj["body"], settings.download_chunk_bytes),
+            status_code=obj["status"],
+            media_type=content_type,
+            headers=headers
+        )
+
+
+class LocalStorage(StorageBackend):
+    """Files under a local directory"""
+
+    name = "local"
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def path(self, key: str) -> str:
+        """
+        Filesystem path for a key
+
+        Raises:
+            ValueError: If the key points outside the storage directory
+        """
+        path = os.path.abspath(os.path.join(self.root, key))
+        if os.path.commonpath([path, self.root]) != self.root:
+            raise ValueError(f"Storage key escapes the storage directory: {key}")
+        return path
+
+    def key_for_path(self, path: str) -> str:
+        """Key of a file recorded by path (Document.local_path)"""
+        key = os.path.relpath(os.path.abspath(path), self.root)
+        self.path(key)  # Validates
+        return key
+
+    async def put_stream(
+        self,
+        key: str,
+        read_chunk: ChunkSource,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Write to a temporary file chunk by chunk and move it into place"""
+        path = self.path(key)
+        temp_path = f"{path}.{uuid.uuid4().hex}.part"
+
+        def _open():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            return open(temp_path, "wb")
+
+        f = await run_in_threadpool(_open)
+        try:
+            try:
+                while chunk := await read_chunk():
+                    await run_in_threadpool(f.write, chunk)
+            finally:
+                await run_in_threadpool(f.close)
+            await run_in_threadpool(os.replace, temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    async def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        chunks = iter((data, b""))
+
+        async def read_chunk() -> bytes:
+            return next(chunks)
+
+        await self.put_stream(key, read_chunk, content_type)
+
+    async def read(self, key: str) -> bytes:
+        def _read():
+            with open(self.path(key), "rb") as f:
+                return f.read()
+        return await run_in_threadpool(_read)
+
+    async def iter_chunks(self, key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        f = await run_in_threadpool(open, self.path(key), "rb")
+        try:
+            while chunk := await run_in_threadpool(f.read, chunk_size):
+                yield chunk
+        finally:
+            await run_in_threadpool(f.close)
+
+    async def exists(self, key: str) -> bool:
+        return await run_in_threadpool(os.path.isfile, self.path(key))
+
+    async def delete(self, key: str) -> bool:
+        def _delete() -> bool:
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+            return True
+        return await run_in_threadpool(_delete)
+
+    async def download_response(
+        self,
+        key: str,
+        filename: str,
+        content_type: str,
+        request_headers: Optional[Mapping[str, str]] = None
+    ) -> Response:
+        """
+        Serve the file from disk
+
+        Whole files go out through FileResponse. A single byte range is
+        answered here with a 206, since FileResponse only honours Range from
+        Starlette 0.39 on; an If-Range that matches neither the ETag nor the
+        modification time gets the whole file.
+
+        Raises:
+            HTTPException: If the file does not exist
+        """
+        path = self.path(key)
+        try:
+            stat = await run_in_threadpool(os.stat, path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found in storage")
+
+        response = FileResponse(
+            path,
+            media_type=content_type,
+            filename=filename,
+            stat_result=stat,
+            headers={"accept-ranges": "bytes"},
+            content_disposition_type="inline"
+        )
+
+        request_headers = request_headers or {}
+        byte_range = single_byte_range(request_headers.get("range"))
+        if_range = request_headers.get("if-range")
+        if not byte_range or (if_range and if_range not in (response.headers["etag"], response.headers["last-modified"])):
+            return response
+
+        size = stat.st_size
+        start, end = byte_range[len("bytes="):].split("-")
+        if not start:
+            start, end = max(size - int(end), 0), size - 1
+        else:
+            start, end = int(start), min(int(end), size - 1) if end else size - 1
+        if start > end or start >= size:
+            return Response(status_code=416, headers={"content-range": f"bytes */{size}"})
+
+        headers = dict(response.headers)
+        headers.update({
+            "content-length": str(end - start + 1),
+            "content-range": f"bytes {start}-{end}/{size}"
+        })
+        return StreamingResponse(
+            self._iter_range(path, start, end - start + 1, settings.download_chunk_bytes),
+            status_code=206,
+            headers=headers
+        )
+
+    async def _iter_range(self, path: str, start: int, length: int, chunk_size: int) -> AsyncIterator[bytes]:
+        """Read length bytes from start in chunks"""
+        f = await run_in_threadpool(open, path, "rb")
+        try:
+            await run_in_threadpool(f.seek, start)
+            while length > 0:
+                chunk = await run_in_threadpool(f.read, min(chunk_size, length))
+                if not chunk:
+                    break
+                length -= len(chunk)
+                yield chunk
+        finally:
+            await run_in_threadpool(f.close)
+
+
+# Create singleton instances
+spaces_storage = SpacesStorage()
+local_storage = LocalStorage(settings.local_storage_dir)
+
+
+def primary_storage() -> StorageBackend:
+    """Backend new uploads go to (STORAGE_BACKEND)"""
+    return local_storage if settings.storage_backend == "local" else spaces_storage
@@ -0,0 +1,434 @@
+"""
+Storage garbage collection
+
+Uploads create Document rows that are only kept if they are linked to a case
+or member, and direct uploads that are never completed stay pending. Stored
+objects can also outlive their rows when a delete fails half way. The
+collector runs periodically in the background (and on demand from the admin
+API) and works in three phases:
+
+1. Stale documents: pending direct uploads never completed and rows older
+   than STORAGE_GC_ORPHAN_DOCUMENT_HOURS uploaded without a case or member
+   are deleted in batches, along with files not shared through a blob.
+2. Unreferenced blobs: blobs no document references are marked as
+   deleting, then deleted along with their objects and image derivatives.
+3. Bucket sweep: the bucket is listed page by page with continuation tokens,
+   each page is checked against documents and blobs in one query, and
+   objects nothing references are deleted with DeleteObjects.
+
+Objects and blobs younger than STORAGE_GC_MIN_OBJECT_AGE_HOURS are never
+touched, which covers uploads whose rows are not committed yet. Only one
+worker process collects at a time (PostgreSQL advisory lock).
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import and_, delete, func, or_, select, text, union, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal, async_engine
+from app.models import Document, DocumentStatus, StoredBlob
+from app.services.image_service import derivative_keys
+from app.services.s3_service import async_s3_service
+from app.services.storage import spaces_storage
+from app.services.upload_service import upload_service
+
+# Key of the advisory lock held while collecting
+GC_LOCK_KEY = 0x67676473_6763
+
+# Bucket prefixes the application writes to; nothing else is swept
+MANAGED_PREFIXES = ("blobs/", "cases/", "members/", "general/", "documents/")
+
+# Suffixes of image derivatives (see image_service.derivative_keys)
+DERIVATIVE_SUFFIXES = derivative_keys("")
+
+
+def owner_key(key: str) -> str:
+    """Key of the original an object belongs to (itself unless it is a derivative)"""
+    for suffix in DERIVATIVE_SUFFIXES:
+        if key.endswith(suffix):
+            return key[:-len(suffix)]
+    return key
+
+
+def _is_content_key(key: str) -> bool:
+    """Whether a key is a content-addressed blob key (blobs/ab/<sha256>)"""
+    parts = key.split("/")
+    return len(parts) == 3 and parts[0] == "blobs" and len(parts[2]) == 64
+
+
+def _new_report(dry_run: bool) -> Dict:
+    return {
+        "dry_run": dry_run,
+        "documents_deleted": 0,
+        "blobs_deleted": 0,
+        "objects_scanned": 0,
+        "objects_deleted": 0,
+        "bytes_reclaimed": 0,
+        "errors": 0,
+        "duration_seconds": 0.0,
+    }
+
+
+class StorageGarbageCollector:
+    """Deletes stale documents and unreferenced stored files"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Collect every STORAGE_GC_INTERVAL_HOURS on the running event loop"""
+        if self._task is not None or not settings.storage_gc_interval_hours:
+            return
+        self._task = asyncio.create_task(self._run())
+        print("🧹 Storage garbage collector started")
+
+    async def stop(self) -> None:
+        """Stop collecting; an interrupted run is safe to repeat"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        # Sleep first, so deploys restarting every worker do not trigger a run
+        while True:
+            await asyncio.sleep(settings.storage_gc_interval_hours * 3600)
+            try:
+                await self.collect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ Storage garbage collection failed: {str(e)}")
+
+    async def collect(self, dry_run: bool = False) -> Optional[Dict]:
+        """
+        Run all phases once
+
+        Args:
+            dry_run: Only count what would be deleted
+
+        Returns:
+            Report with counts and reclaimed bytes, or None if another worker
+            is collecting
+        """
+        # Session-level lock on a dedicated connection, so no transaction
+        # stays open for the whole run
+        async with async_engine.connect() as conn:
+            locked = await conn.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": GC_LOCK_KEY})
+            await conn.commit()
+            if not locked:
+                return None
+
+            try:
+                return await self._collect(dry_run)
+            finally:
+                try:
+                    await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": GC_LOCK_KEY})
+                    await conn.commit()
+                except BaseException:
+                    # Closing the connection releases the lock
+                    await conn.invalidate()
+                    raise
+
+    async def _collect(self, dry_run: bool) -> Dict:
+        started = time.perf_counter()
+        report = _new_report(dry_run)
+        now = datetime.now(timezone.utc)
+
+        for phase in (self._collect_documents, self._collect_blobs, self._sweep_bucket):
+            try:
+                await phase(report, now, dry_run)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The remaining phases do not depend on this one
+                report["errors"] += 1
+                print(f"❌ Storage GC {phase.__name__} failed: {str(e)}")
+
+        report["duration_seconds"] = round(time.perf_counter() - started, 3)
+        print(
+            f"🧹 Storage GC{' (dry run)' if dry_run else ''}: "
+            f"{report['documents_deleted']} documents, {report['blobs_deleted']} blobs, "
+            f"{report['objects_deleted']}/{report['objects_scanned']} objects, "
+            f"{report['bytes_reclaimed']} bytes reclaimed, {report['errors']} errors"
+        )
+        return report
+
+    def _stale_documents(self, now: datetime):
+        """Filter matching documents the collector deletes"""
+        conditions = [and_(
+            Document.status == DocumentStatus.PENDING,
+            Document.uploaded_at < now - timedelta(hours=settings.storage_gc_pending_upload_hours)
+        )]
+        if settings.storage_gc_orphan_document_hours:
+            conditions.append(and_(
+                Document.case_id.is_(None),
+                Document.member_id.is_(None),
+                Document.uploaded_at < now - timedelta(hours=settings.storage_gc_orphan_document_hours)
+            ))
+        return or_(*conditions)
+
+    async def _collect_documents(self, report: Dict, now: datetime, dry_run: bool) -> None:
+        """Phase 1: delete stale documents in batches"""
+        stale = self._stale_documents(now)
+
+        if dry_run:
+            async with AsyncSessionLocal() as db:
+                row = (await db.execute(
+                    select(
+                        func.count(Document.id),
+                        func.coalesce(
+                            func.sum(Document.file_size)
+                            .filter(Document.blob_id.is_(None), Document.status == DocumentStatus.UPLOADED),
+                            0
+                        )
+                    ).where(stale)
+                )).one()
+            report["documents_deleted"] += row[0]
+            report["bytes_reclaimed"] += row[1]
+            return
+
+        batch_size = settings.storage_gc_batch_size
+        while True:
+            async with AsyncSessionLocal() as db:
+                batch = select(Document.id).where(stale).limit(batch_size).with_for_update(skip_locked=True)
+                result = await db.execute(
+                    delete(Document)
+                    .where(Document.id.in_(batch.scalar_subquery()))
+                    .returning(
+                        Document.s3_key,
+                        Document.local_path,
+                        Document.blob_id,
+                        Document.status,
+                        Document.upload_id,
+                        Document.image_processed_at,
+                        Document.file_size
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                rows = result.all()
+                await db.commit()
+
+            if not rows:
+                return
+            report["documents_deleted"] += len(rows)
+
+            # The rows are gone; files that fail to delete now are swept in phase 3
+            sizes: Dict[str, int] = {}
+            for row in rows:
+                if row.blob_id:
+                    continue
+                if row.status == DocumentStatus.PENDING:
+                    if row.upload_id:
+                        await async_s3_service.abort_multipart_upload(row.s3_key, row.upload_id)
+                    sizes[row.s3_key] = 0
+                elif row.s3_key:
+                    sizes[row.s3_key] = row.file_size
+                    if row.image_processed_at:
+                        sizes.update(dict.fromkeys(derivative_keys(row.s3_key), 0))
+                elif row.local_path:
+                    if await upload_service.delete_file(local_path=row.local_path):
+                        report["bytes_reclaimed"] += row.file_size
+                    else:
+                        report["errors"] += 1
+
+            if sizes:
+                await self._delete_objects(report, sizes, count_objects=False)
+
+            if len(rows) < batch_size:
+                return
+
+    async def _collect_blobs(self, report: Dict, now: datetime, dry_run: bool) -> None:
+        """Phase 2: delete blobs no document references, with their objects"""
+        unreferenced = and_(
+            StoredBlob.deleting_at.is_(None),
+            ~select(Document.id).where(Document.blob_id == StoredBlob.id).exists(),
+            StoredBlob.updated_at < now - timedelta(hours=settings.storage_gc_min_object_age_hours)
+        )
+
+        if dry_run:
+            async with AsyncSessionLocal() as db:
+                row = (await db.execute(
+                    select(func.count(StoredBlob.id), func.coalesce(func.sum(StoredBlob.size), 0))
+                    .where(unreferenced)
+                )).one()
+            report["blobs_deleted"] += row[0]
+            report["bytes_reclaimed"] += row[1]
+            return
+
+        # Also retry deletions an earlier run did not finish
+        claimable = or_(unreferenced, StoredBlob.deleting_at < now - timedelta(hours=1))
+        batch_size = settings.storage_gc_batch_size
+        while True:
+            # Mark the batch as deleting and commit before touching Spaces,
+            # so no row lock is held during the deletes. Uploads of the same
+            # content wait for the rows to go, then store it again.
+            async with AsyncSessionLocal() as db:
+                batch = select(StoredBlob.id).where(claimable).limit(batch_size).with_for_update(skip_locked=True)
+                result = await db.execute(
+                    update(StoredBlob)
+                    .where(StoredBlob.id.in_(batch.scalar_subquery()))
+                    .values(deleting_at=func.now())
+                    .returning(StoredBlob.id, StoredBlob.s3_key, StoredBlob.size)
+                    .execution_options(synchronize_session=False)
+                )
+                blobs = result.all()
+                await db.commit()
+            if not blobs:
+                return
+
+            sizes = {}
+            for blob in blobs:
+                sizes[blob.s3_key] = blob.size
+                sizes.update(dict.fromkeys(derivative_keys(blob.s3_key), 0))
+            failed = set(await self._delete_objects(report, sizes, count_objects=False))
+
+            # Rows whose object could not be deleted stay marked and are retried
+            deleted_ids = [blob.id for blob in blobs if blob.s3_key not in failed]
+            await self._drop_blob_rows(StoredBlob.id.in_(deleted_ids))
+
+            report["blobs_deleted"] += len(deleted_ids)
+            # Stop rather than retry the same failing batch forever
+            if not deleted_ids or len(blobs) < batch_size:
+                return
+
+    async def _drop_blob_rows(self, condition) -> None:
+        """Delete blob rows marked as deleting once their objects are gone"""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                delete(StoredBlob)
+                .where(condition, StoredBlob.deleting_at.is_not(None))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _claim_blob_objects(self, owners: Dict[str, int]) -> Set[str]:
+        """
+        Mark unregistered content objects as deleting before the sweep deletes them
+
+        An upload registers its blob after storing the object, so without a
+        claim the sweep could delete an object that was just stored again.
+        A conflicting row means the content was registered meanwhile.
+
+        Args:
+            owners: Size per blobs/ab/<sha256> key
+
+        Returns:
+            Claimed keys
+        """
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "sha256": key.rsplit("/", 1)[1],
+                "s3_key": key,
+                "size": size,
+                "content_type": "application/octet-stream",
+                "deleting_at": func.now(),
+            }
+            for key, size in owners.items()
+        ]
+        if not rows:
+            return set()
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                pg_insert(StoredBlob)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[StoredBlob.sha256])
+                .returning(StoredBlob.s3_key)
+            )
+            claimed = set(result.scalars().all())
+            await db.commit()
+        return claimed
+
+    async def _sweep_bucket(self, report: Dict, now: datetime, dry_run: bool) -> None:
+        """Phase 3: delete objects in the bucket that nothing references"""
+        cutoff = now - timedelta(hours=settings.storage_gc_min_object_age_hours)
+
+        for prefix in MANAGED_PREFIXES:
+            token = None
+            while True:
+                page = await async_s3_service.list_files_page(prefix, token)
+                files = page["files"]
+                report["objects_scanned"] += len(files)
+
+                candidates = [f for f in files if f["last_modified"] < cutoff]
+                if candidates:
+                    owners = list({owner_key(f["key"]) for f in candidates})
+                    async with AsyncSessionLocal() as db:
+                        result = await db.execute(union(
+                            select(Document.s3_key).where(Document.s3_key.in_(owners)),
+                            select(StoredBlob.s3_key).where(StoredBlob.s3_key.in_(owners))
+                        ))
+                        referenced = set(result.scalars().all())
+
+                    orphans = {
+                        f["key"]: f["size"]
+                        for f in candidates
+                        if owner_key(f["key"]) not in referenced
+                    }
+                    if orphans and dry_run:
+                        report["objects_deleted"] += len(orphans)
+                        report["bytes_reclaimed"] += sum(orphans.values())
+                    elif orphans:
+                        await self._delete_orphans(report, orphans)
+
+                token = page["next_token"]
+                if not token:
+                    break
+
+    async def _delete_orphans(self, report: Dict, orphans: Dict[str, int]) -> None:
+        """Delete unreferenced objects found by the sweep"""
+        blob_owners = {
+            owner_key(key): orphans.get(owner_key(key), 0)
+            for key in orphans
+            if _is_content_key(owner_key(key))
+        }
+        claimed = await self._claim_blob_objects(blob_owners)
+
+        deletable = {
+            key: size
+            for key, size in orphans.items()
+            if owner_key(key) not in blob_owners or owner_key(key) in claimed
+        }
+        failed = set(await self._delete_objects(report, deletable, count_objects=True))
+
+        # Claims on objects that could not be deleted are retried by phase 2
+        await self._drop_blob_rows(StoredBlob.s3_key.in_(claimed - failed))
+
+    async def _delete_objects(self, report: Dict, sizes: Dict[str, int], count_objects: bool) -> List[str]:
+        """
+        Bulk-delete objects and add them to the report
+
+        Args:
+            sizes: Size in bytes per key (0 where unknown)
+            count_objects: Count them in objects_deleted (bucket sweep)
+
+        Returns:
+            Keys that could not be deleted
+        """
+        result = await async_s3_service.delete_files(list(sizes))
+        for key in result["deleted"]:
+            spaces_storage.url_cache.pop(key)
+            report["bytes_reclaimed"] += sizes[key]
+        if count_objects:
+            report["objects_deleted"] += len(result["deleted"])
+
+        for key, error in result["errors"].items():
+            print(f"⚠️  Storage GC could not delete {key}: {error}")
+        report["errors"] += len(result["errors"])
+        return list(result["errors"])
+
+
+# Create singleton instance
+storage_gc = StorageGarbageCollector()
@@ -1,22 +1,280 @@
+import asyncio
+import hashlib
 import os
 import uuid
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
 from fastapi import UploadFile, HTTPException
 from app.config import settings
-from app.services.s3_service import s3_service
+from app.models import Document, DocumentStatus
+from app.services.blob_service import BlobReference, content_key, register_blobs, touch_blobs
+from app.services.image_service import derivative_keys
+from app.services.s3_service import async_s3_service, s3_service
+from app.services.storage import fanout_key, local_storage, primary_storage, spaces_storage
+
+
+# Polls while the garbage collector deletes content that is being uploaded again
+BLOB_DELETE_WAIT_ATTEMPTS = 10
+BLOB_DELETE_WAIT_SECONDS = 0.5
+
+ALLOWED_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png", ".doc", ".docx", ".gif", ".bmp", ".txt"}
+
+IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/bmp"}
+
+# Content types accepted for each extension (phones often save PNGs as .jpg)
+EXTENSION_CONTENT_TYPES = {
+    ".pdf": {"application/pdf"},
+    ".jpg": IMAGE_TYPES,
+    ".jpeg": IMAGE_TYPES,
+    ".png": IMAGE_TYPES,
+    ".gif": IMAGE_TYPES,
+    ".bmp": IMAGE_TYPES,
+    ".doc": {"application/msword"},
+    ".docx": {"application/vnd.openxmlformats-officedocument.wordprocessingml.document"},
+    ".txt": {"text/plain"},
+}
+
+# Leading bytes of each supported format
+MAGIC_NUMBERS = (
+    (b"%PDF-", "application/pdf"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/msword"),
+    (b"PK\x03\x04", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+)
+
+
+class UploadRejected(HTTPException):
+    """A direct upload that did not match its declaration; the object is deleted"""
+
+    def __init__(self, detail: str):
+        super().__init__(status_code=400, detail=detail)
+
+
+def sniff_content_type(head: bytes, file_ext: str) -> Optional[str]:
+    """
+    Detect a file's content type from its first bytes
+
+    Args:
+        head: First chunk of the file
+        file_ext: Lowercased extension, used only to tell plain text apart
+
+    Returns:
+        MIME type, or None if the content is not a supported format
+    """
+    for magic, content_type in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return content_type
+    if file_ext == ".txt" and b"\x00" not in head:
+        return "text/plain"
+    return None
+
+
+class ChunkedUpload:
+    """
+    Reads an UploadFile chunk by chunk
+
+    Enforces the size limit as it goes and hashes the content on the fly, so
+    the caller never needs the whole file in memory.
+    """
+
+    def __init__(self, file: UploadFile, max_bytes: int, chunk_bytes: int):
+        self.file = file
+        self.max_bytes = max_bytes
+        self.chunk_bytes = chunk_bytes
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+    async def rewind(self) -> None:
+        """Start over from the beginning of the file"""
+        await self.file.seek(0)
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+    async def read(self) -> bytes:
+        """
+        Next chunk of the file, or b"" at the end
+
+        Raises:
+            HTTPException: If the file grows past the size limit
+        """
+        chunk = await self.file.read(self.chunk_bytes)
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds maximum allowed size of {self.max_bytes // (1024 * 1024)}MB"
+            )
+        self._sha256.update(chunk)
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
 
 
 class UploadService:
     """
-    File upload service with Digital Ocean Spaces integration
+    File upload service storing documents in Digital Ocean Spaces or, as the
+    configured backend or a fallback, on the local filesystem
     """
 
-    def __init__(self):
-        self.use_spaces = True  # Always use Digital Ocean Spaces for file storage
+    def validate_extension(self, filename: Optional[str]) -> str:
+        """
+        Check a file name against the allowed extensions
+
+        Returns:
+            The lowercased extension
+
+        Raises:
+            HTTPException: 400 if the file type is not allowed
+        """
+        file_ext = os.path.splitext(filename or "")[1].lower()
 
-        # Fallback to local storage if Digital Ocean Spaces is not available
-        self.upload_dir = "uploads"
-        os.makedirs(self.upload_dir, exist_ok=True)
+        if file_ext not in ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File type {file_ext} not allowed. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            )
+        return file_ext
+
+    async def _read_upload(self, file: UploadFile) -> Tuple[ChunkedUpload, str, str]:
+        """
+        Validate a file and hash it, reading it once chunk by chunk
+
+        Returns:
+            (upload rewound by the caller before storing, content type, extension)
+
+        Raises:
+            HTTPException: 400 if the file is empty, too large or not what its extension says
+        """
+        file_ext = self.validate_extension(file.filename)
+
+        upload = ChunkedUpload(file, settings.upload_max_bytes, settings.upload_chunk_bytes)
+        await upload.rewind()
+        first_chunk = await upload.read()
+        if not first_chunk:
+            raise HTTPException(status_code=400, detail="File is empty")
+
+        content_type = sniff_content_type(first_chunk, file_ext)
+        if content_type not in EXTENSION_CONTENT_TYPES[file_ext]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File content does not match its {file_ext} extension"
+            )
+
+        # Hash the whole file before touching Spaces. It is already spooled
+        # locally, and known content skips the upload entirely.
+        while await upload.read():
+            pass
+        return upload, content_type, file_ext
+
+    def _blob_result(
+        self,
+        file: UploadFile,
+        upload: ChunkedUpload,
+        content_type: str,
+        blob: BlobReference
+    ) -> dict:
+        return {
+            "file_id": str(uuid.uuid4()),  # Generate unique ID for tracking
+            "file_name": file.filename,
+            "file_type": content_type,
+            "file_size": upload.size,
+            "sha256": upload.sha256,
+            "blob_id": blob.blob_id,
+            "s3_key": blob.s3_key,
+            "s3_url": s3_service.file_url(blob.s3_key),
+            "local_path": None
+        }
+
+    async def _store_locally(
+        self,
+        file: UploadFile,
+        upload: ChunkedUpload,
+        content_type: str,
+        file_ext: str,
+        folder: str
+    ) -> dict:
+        file_id = str(uuid.uuid4())
+        key = fanout_key(folder, upload.sha256, f"{file_id}{file_ext}")
+        await upload.rewind()
+        await local_storage.put_stream(key, upload.read, content_type)
+
+        return {
+            "file_id": file_id,
+            "file_name": file.filename,
+            "file_type": content_type,
+            "file_size": upload.size,
+            "sha256": upload.sha256,
+            "blob_id": None,
+            "local_path": local_storage.path(key),
+            "s3_key": None,
+            "s3_url": None
+        }
+
+    async def store_blobs(
+        self,
+        uploads: Dict[str, Tuple[ChunkedUpload, str]]
+    ) -> Dict[str, Union[BlobReference, Exception]]:
+        """
+        Make sure content is stored in Spaces and can be referenced
+
+        Content that is already stored is reused without uploading it again.
+        New content is streamed to Spaces first (at most
+        UPLOAD_BATCH_CONCURRENCY objects at a time) and registered
+        afterwards, so no row lock is held during a transfer. Content the
+        garbage collector is deleting is stored again once it is gone.
+
+        Args:
+            uploads: Hashed upload and content type per SHA-256
+
+        Returns:
+            Per SHA-256: the blob to reference, or the exception that kept
+            the content from being stored
+        """
+        results: Dict[str, Union[BlobReference, Exception]] = {}
+        pending = set(uploads)
+        slots = asyncio.Semaphore(settings.upload_batch_concurrency)
+
+        async def put(sha256: str) -> None:
+            upload, content_type = uploads[sha256]
+            async with slots:
+                await upload.rewind()
+                await spaces_storage.put_stream(content_key(sha256), upload.read, content_type, {"sha256": sha256})
+
+        for _ in range(BLOB_DELETE_WAIT_ATTEMPTS):
+            stored, deleting = await touch_blobs(list(pending))
+            results.update(stored)
+            pending -= set(stored)
+
+            missing = [sha256 for sha256 in pending if sha256 not in deleting]
+            outcomes = await asyncio.gather(*(put(sha256) for sha256 in missing), return_exceptions=True)
+            uploaded = []
+            for sha256, outcome in zip(missing, outcomes):
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    results[sha256] = outcome
+                    pending.discard(sha256)
+                else:
+                    upload, content_type = uploads[sha256]
+                    uploaded.append((sha256, upload.size, content_type))
+
+            registered = await register_blobs(uploaded)
+            results.update(registered)
+            pending -= set(registered)
+
+            if not pending:
+                return results
+            await asyncio.sleep(BLOB_DELETE_WAIT_SECONDS)
+
+        for sha256 in pending:
+            results[sha256] = Exception("Stored content is being deleted, try again")
+        return results
 
     async def upload_file(
         self,
@@ -24,84 +282,282 @@ class UploadService:
         folder: str = "general"
     ) -> dict:
         """
-        Upload a file to Digital Ocean Spaces
+        Upload a file to the configured storage backend
+
+        The file is streamed in chunks: the size limit is enforced while
+        reading, the content type is sniffed from the first chunk and a
+        SHA-256 is computed on the way through. Content that is already
+        stored is not uploaded again; the document shares the existing blob.
 
         Args:
             file: The file to upload
-            folder: Folder/prefix for organizing files (e.g., 'documents', 'cases', 'members')
+            folder: Top-level folder for locally stored files (e.g. 'cases', 'members')
 
         Returns:
-            Dictionary with file information
+            Dictionary with file information (blob_id is set for Spaces uploads,
+            local_path for local ones)
 
         Raises:
             HTTPException: If upload fails
         """
-        # Validate file type
-        allowed_extensions = {".pdf", ".jpg", ".jpeg", ".png", ".doc", ".docx", ".gif", ".bmp", ".txt"}
-        file_ext = os.path.splitext(file.filename)[1].lower()
+        upload, content_type, file_ext = await self._read_upload(file)
 
-        if file_ext not in allowed_extensions:
+        if primary_storage() is spaces_storage:
+            try:
+                blob = (await self.store_blobs({upload.sha256: (upload, content_type)}))[upload.sha256]
+                if isinstance(blob, Exception):
+                    raise blob
+                return self._blob_result(file, upload, content_type, blob)
+
+            except Exception as e:
+                # Fallback to local storage if Digital Ocean Spaces fails
+                print(f"Digital Ocean Spaces upload failed: {str(e)}. Falling back to local storage...")
+
+        return await self._store_locally(file, upload, content_type, file_ext, folder)
+
+    async def upload_files(
+        self,
+        files: List[UploadFile],
+        folder: str = "general"
+    ) -> List[dict]:
+        """
+        Upload several files at once
+
+        Files are validated, hashed and stored concurrently, at most
+        UPLOAD_BATCH_CONCURRENCY at a time, so the caller can insert every
+        document and commit once. A file that fails validation does not stop
+        the others.
+
+        Args:
+            files: The files to upload
+            folder: Top-level folder for locally stored files (e.g. 'cases', 'members')
+
+        Returns:
+            One dictionary per file, in order: upload_file's result, or
+            file_name, error and status_code for a rejected file
+        """
+        slots = asyncio.Semaphore(settings.upload_batch_concurrency)
+        results: List[Optional[dict]] = [None] * len(files)
+
+        async def read(file: UploadFile):
+            async with slots:
+                try:
+                    return await self._read_upload(file)
+                except HTTPException as e:
+                    return e
+
+        prepared = await asyncio.gather(*(read(file) for file in files))
+        valid = []
+        for i, item in enumerate(prepared):
+            if isinstance(item, HTTPException):
+                results[i] = {"file_name": files[i].filename, "error": item.detail, "status_code": item.status_code}
+            else:
+                valid.append(i)
+
+        to_local = valid
+        if valid and primary_storage() is spaces_storage:
+            # Content that appears twice in the batch is stored once
+            uploads = {prepared[i][0].sha256: (prepared[i][0], prepared[i][1]) for i in valid}
+            try:
+                blobs = await self.store_blobs(uploads)
+            except Exception as e:
+                blobs = {sha256: e for sha256 in uploads}
+
+            to_local = []
+            for blob in blobs.values():
+                if isinstance(blob, Exception):
+                    print(f"Digital Ocean Spaces upload failed: {str(blob)}. Falling back to local storage...")
+            for i in valid:
+                upload, content_type, _ = prepared[i]
+                blob = blobs[upload.sha256]
+                if isinstance(blob, Exception):
+                    to_local.append(i)
+                else:
+                    results[i] = self._blob_result(files[i], upload, content_type, blob)
+
+        async def store_locally(i: int) -> dict:
+            upload, content_type, file_ext = prepared[i]
+            async with slots:
+                return await self._store_locally(files[i], upload, content_type, file_ext, folder)
+
+        for i, result in zip(to_local, await asyncio.gather(*(store_locally(i) for i in to_local))):
+            results[i] = result
+        return results
+
+    async def create_direct_upload(
+        self,
+        file_name: str,
+        file_type: str,
+        file_size: int,
+        folder: str = "general"
+    ) -> dict:
+        """
+        Prepare a direct-to-Spaces upload for the client
+
+        Files up to one part are sent with a single presigned PUT; larger ones
+        get a multipart upload with a presigned URL per part.
+
+        Args:
+            file_name: Original file name
+            file_type: MIME type the client will upload with
+            file_size: Declared size in bytes
+            folder: Folder/prefix for organizing files
+
+        Returns:
+            Dictionary with s3_key, method, url or upload_id/part_size/parts, and expires_in
+
+        Raises:
+            HTTPException: If the file type or size is not allowed
+        """
+        if primary_storage() is not spaces_storage:
+            raise HTTPException(status_code=400, detail="Direct uploads require Spaces storage")
+
+        file_ext = self.validate_extension(file_name)
+        if file_type not in EXTENSION_CONTENT_TYPES[file_ext]:
             raise HTTPException(
                 status_code=400,
-                detail=f"File type {file_ext} not allowed. Allowed types: {', '.join(allowed_extensions)}"
+                detail=f"Content type {file_type} not allowed for {file_ext} files"
             )
-
-        # Validate file size (10MB max)
-        max_size = 10 * 1024 * 1024  # 10MB in bytes
-        file_content = await file.read()
-        if len(file_content) > max_size:
+        if file_size > settings.upload_max_bytes:
             raise HTTPException(
                 status_code=400,
-                detail=f"File size exceeds maximum allowed size of 10MB"
+                detail=f"File size exceeds maximum allowed size of {settings.upload_max_bytes // (1024 * 1024)}MB"
             )
 
-        # Reset file pointer for reading
-        await file.seek(0)
-
-        try:
-            # Upload to Digital Ocean Spaces
-            result = s3_service.upload_file(
-                file_obj=file.file,
-                filename=file.filename,
-                folder=folder,
-                content_type=file.content_type
-            )
+        file_key = s3_service.build_file_key(file_name, folder)
+        expiration = settings.upload_presign_expiration_seconds
+        part_bytes = settings.upload_part_bytes
 
+        if file_size <= part_bytes:
+            presigned = s3_service.generate_presigned_upload_url(file_key, file_type, expiration)
             return {
-                "file_id": str(uuid.uuid4()),  # Generate unique ID for tracking
-                "file_name": result['filename'],
-                "file_type": file.content_type or "application/octet-stream",
-                "file_size": len(file_content),
-                "s3_key": result['file_key'],
-                "s3_url": result['file_url'],
-                "local_path": None
+                "s3_key": file_key,
+                "method": "PUT",
+                "url": presigned["url"],
+                "upload_id": None,
+                "part_size": None,
+                "parts": [],
+                "expires_in": expiration
             }
 
-        except Exception as e:
-            # Fallback to local storage if Digital Ocean Spaces fails
-            print(f"Digital Ocean Spaces upload failed: {str(e)}. Falling back to local storage...")
+        metadata = {
+            "original_filename": file_name,
+            "uploaded_at": datetime.utcnow().isoformat()
+        }
+        upload_id = await async_s3_service.create_multipart_upload(file_key, file_type, metadata)
+        part_count = -(-file_size // part_bytes)
+        return {
+            "s3_key": file_key,
+            "method": "MULTIPART",
+            "url": None,
+            "upload_id": upload_id,
+            "part_size": part_bytes,
+            "parts": [
+                {
+                    "part_number": n,
+                    "url": s3_service.generate_presigned_part_url(file_key, upload_id, n, expiration)
+                }
+                for n in range(1, part_count + 1)
+            ],
+            "expires_in": expiration
+        }
 
-            file_id = str(uuid.uuid4())
-            safe_filename = f"{file_id}{file_ext}"
+    async def complete_direct_upload(
+        self,
+        s3_key: str,
+        file_name: str,
+        file_size: int,
+        upload_id: Optional[str] = None,
+        parts: Optional[list] = None
+    ) -> dict:
+        """
+        Verify a direct upload once the client reports it finished
 
-            folder_path = os.path.join(self.upload_dir, folder)
-            os.makedirs(folder_path, exist_ok=True)
+        Completes the multipart upload if there is one, then checks the stored
+        object with head_object and sniffs its first bytes. Objects that do not
+        match what was declared are deleted.
 
-            file_path = os.path.join(folder_path, safe_filename)
-            await file.seek(0)
+        Args:
+            s3_key: Object key handed out by create_direct_upload
+            file_name: Original file name
+            file_size: Declared size in bytes
+            upload_id: Multipart upload ID, if the upload was multipart
+            parts: [(part_number, etag), ...] for multipart uploads
 
-            with open(file_path, "wb") as f:
-                f.write(await file.read())
+        Returns:
+            Dictionary with the verified file_size, file_type and s3_url
 
-            return {
-                "file_id": file_id,
-                "file_name": file.filename,
-                "file_type": file.content_type or "application/octet-stream",
-                "file_size": len(file_content),
-                "local_path": file_path,
-                "s3_key": None,
-                "s3_url": None
-            }
+        Raises:
+            HTTPException: 400 if the object is missing or the parts cannot be
+                completed
+            UploadRejected: If the object does not match (it has been deleted)
+        """
+        if upload_id:
+            if not parts:
+                raise HTTPException(status_code=400, detail="Uploaded parts are required to complete a multipart upload")
+            try:
+                await async_s3_service.complete_multipart_upload(
+                    s3_key,
+                    upload_id,
+                    [{"PartNumber": number, "ETag": etag} for number, etag in sorted(parts)]
+                )
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"Could not complete upload: {str(e)}")
+
+        try:
+            head = await async_s3_service.get_file_metadata(s3_key)
+        except Exception:
+            raise HTTPException(status_code=400, detail="File has not been uploaded yet")
+
+        file_ext = os.path.splitext(file_name)[1].lower()
+        size = head["content_length"] or 0
+        problem = None
+        if size != file_size:
+            problem = f"Uploaded size {size} does not match declared size {file_size}"
+        else:
+            content_type = sniff_content_type(await async_s3_service.read_range(s3_key, 0, 511), file_ext)
+            if content_type not in EXTENSION_CONTENT_TYPES.get(file_ext, ()):
+                problem = f"File content does not match its {file_ext} extension"
+
+        if problem:
+            await self.delete_file(s3_key=s3_key)
+            raise UploadRejected(problem)
+
+        return {
+            "file_size": size,
+            "file_type": content_type,
+            "s3_url": s3_service.file_url(s3_key)
+        }
+
+    async def delete_document_file(self, document: Document) -> None:
+        """
+        Remove the stored file of a document that is being deleted
+
+        Shared blobs are left to the storage garbage collector, which deletes
+        them once no document references them. Call after the document
+        deletion is committed.
+        """
+        if document.blob_id:
+            return
+        if document.status == DocumentStatus.PENDING:
+            await self.abort_direct_upload(document.s3_key, document.upload_id)
+        else:
+            await self.delete_file(
+                s3_key=document.s3_key,
+                local_path=document.local_path
+            )
+            if document.s3_key and document.image_processed_at:
+                await self._delete_derivatives(document.s3_key)
+
+    async def _delete_derivatives(self, s3_key: str) -> None:
+        for derivative_key in derivative_keys(s3_key):
+            await self.delete_file(s3_key=derivative_key)
+
+    async def abort_direct_upload(self, s3_key: str, upload_id: Optional[str]) -> None:
+        """Discard an unfinished direct upload and anything stored for it"""
+        if upload_id:
+            await async_s3_service.abort_multipart_upload(s3_key, upload_id)
+        await self.delete_file(s3_key=s3_key)
 
     async def generate_presigned_url(
         self,
@@ -111,6 +567,10 @@ class UploadService:
         """
         Generate a presigned URL for Digital Ocean Spaces object
 
+        A previously signed URL is reused while it stays valid for longer than
+        the safety margin, so the returned URL may expire sooner than
+        `expiration`.
+
         Args:
             s3_key: Spaces object key
             expiration: URL expiration time in seconds (default: 1 hour)
@@ -119,11 +579,34 @@ class UploadService:
             Presigned URL string or None if generation fails
         """
         try:
-            return s3_service.generate_presigned_url(s3_key, expiration)
+            return spaces_storage.presigned_url(s3_key, expiration)
         except Exception as e:
             print(f"Failed to generate presigned URL: {str(e)}")
             return None
 
+    async def generate_presigned_urls(
+        self,
+        s3_keys: List[str],
+        expiration: int = 3600
+    ) -> Dict[str, Optional[str]]:
+        """
+        Generate presigned URLs for many objects, e.g. a case's documents
+
+        Cached URLs are reused; the rest are signed together off the event loop.
+
+        Args:
+            s3_keys: Spaces object keys
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            Presigned URL per key (empty if signing failed)
+        """
+        try:
+            return await spaces_storage.presigned_urls(s3_keys, expiration)
+        except Exception as e:
+            print(f"Failed to generate presigned URLs: {str(e)}")
+            return {}
+
     async def delete_file(
         self,
         s3_key: Optional[str] = None,
@@ -142,15 +625,14 @@ class UploadService:
         # Try Digital Ocean Spaces first
         if s3_key:
             try:
-                return s3_service.delete_file(s3_key)
+                return await spaces_storage.delete(s3_key)
             except Exception as e:
                 print(f"Failed to delete from Digital Ocean Spaces: {str(e)}")
 
         # Fallback to local storage
-        if local_path and os.path.exists(local_path):
+        if local_path:
             try:
-                os.remove(local_path)
-                return True
+                return await local_storage.delete(local_storage.key_for_path(local_path))
             except Exception as e:
                 print(f"Failed to delete local file: {str(e)}")
                 return False
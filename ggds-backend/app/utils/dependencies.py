@@ -1,27 +1,36 @@
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models import User
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from app.database import get_async_db
+from app.models import User, Member
 from app.utils.security import verify_token
+from app.utils.user_cache import get_cached_principal, cache_principal
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
 
-async def get_current_user(
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> Tuple[User, Optional[Member]]:
     """
-    Dependency to get the current authenticated user from JWT token
+    Dependency to resolve the authenticated user and their member profile
+
+    Shared by get_current_user and get_current_member (FastAPI resolves it
+    once per request). Both rows come from the principal cache or from a
+    single joined query.
 
     Args:
         credentials: HTTP Authorization credentials containing the bearer token
         db: Database session
 
     Returns:
-        User object
+        Tuple of (User, Member or None)
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -51,9 +60,26 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
-    print(f"🗄️ DEBUG: User from DB: {user}")
+    # Get user and member from cache, falling back to one joined query
+    principal = get_cached_principal(user_id)
+    if principal is not None:
+        user, member = principal
+        user = await db.merge(user, load=False)
+        if member is not None:
+            member = await db.merge(member, load=False)
+        print(f"🗄️ DEBUG: User from cache: {user}")
+    else:
+        result = await db.execute(
+            select(User)
+            .options(joinedload(User.member))
+            .where(User.id == user_id)
+        )
+        user = result.scalar_one_or_none()
+        member = user.member if user is not None else None
+        print(f"🗄️ DEBUG: User from DB: {user}")
+        if user is not None:
+            cache_principal(user, member)
+
     if user is None:
         print("❌ DEBUG: User not found in database")
         raise HTTPException(
@@ -68,10 +94,73 @@ async def get_current_user(
             detail="Inactive user",
         )
 
+    # Link both sides so user.member / member.user never trigger a lazy load
+    set_committed_value(user, "member", member)
+    if member is not None:
+        set_committed_value(member, "user", user)
+
     print(f"✅ DEBUG: User authenticated successfully: {user.email}, role: {user.role}")
+    return user, member
+
+
+async def get_current_user(
+    principal: Tuple[User, Optional[Member]] = Depends(get_current_principal)
+) -> User:
+    """
+    Dependency to get the current authenticated user from JWT token
+
+    Args:
+        principal: Resolved (user, member) from get_current_principal
+
+    Returns:
+        User object
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user, _ = principal
     return user
 
 
+async def get_optional_current_member(
+    principal: Tuple[User, Optional[Member]] = Depends(get_current_principal)
+) -> Optional[Member]:
+    """
+    Dependency to get the current user's member profile, if they have one
+
+    Args:
+        principal: Resolved (user, member) from get_current_principal
+
+    Returns:
+        Member object (with member.user loaded) or None
+    """
+    _, member = principal
+    return member
+
+
+async def get_current_member(
+    member: Optional[Member] = Depends(get_optional_current_member)
+) -> Member:
+    """
+    Dependency to get the current user's member profile
+
+    Args:
+        member: Member from get_optional_current_member
+
+    Returns:
+        Member object (with member.user loaded)
+
+    Raises:
+        HTTPException: If the user has no member profile
+    """
+    if member is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Member profile not found"
+        )
+    return member
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -0,0 +1,27 @@
+"""
+Relationship loader options for API responses
+
+Each option set eager-loads exactly the relationships a response schema
+serializes, so detail endpoints run a fixed number of queries regardless of
+how many family members, contacts or documents a record has.
+"""
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.models import Case, Member
+
+# MemberDetailResponse: member + family_members + next_of_kin (3 queries)
+MEMBER_DETAIL_OPTIONS = (
+    selectinload(Member.family_members),
+    selectinload(Member.next_of_kin),
+)
+
+# CaseDetailResponse: case + verification_contacts (2 queries)
+CASE_DETAIL_OPTIONS = (
+    selectinload(Case.verification_contacts),
+)
+
+# Case status changes: case + reporter in one query (reporter is emailed)
+CASE_WITH_REPORTER_OPTIONS = (
+    joinedload(Case.reported_by_user),
+)
@@ -3,51 +3,57 @@ PIVOT v2.0: Member utility functions
 Includes member ID generation and initial password generation
 """
 
-import secrets
-import string
-from sqlalchemy.orm import Session
-from app.models import Member
+from typing import List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.member import member_number_seq
 
 
-def generate_member_id(db: Session) -> str:
+def format_member_id(number: int) -> str:
+    """Format a member number as GGDS-XXXX with zero padding"""
+    return f"GGDS-{number:04d}"
+
+
+async def generate_member_id(db: AsyncSession) -> str:
     """
     Generate a unique member ID in format GGDS-XXXX
 
+    Numbers come from the member_number_seq database sequence, so allocation
+    is O(1) and safe across concurrent requests and workers.
+
     Args:
-        db: Database session to check for existing IDs
+        db: Database session
 
     Returns:
         Unique member ID string (e.g., "GGDS-0001", "GGDS-0002", etc.)
     """
-    # Get the highest existing member number
-    last_member = (
-        db.query(Member)
-        .filter(Member.member_id.like("GGDS-%"))
-        .order_by(Member.member_id.desc())
-        .first()
+    number = await db.scalar(select(member_number_seq.next_value()))
+    return format_member_id(number)
+
+
+async def allocate_member_ids(db: AsyncSession, count: int) -> List[str]:
+    """
+    Allocate a block of unique member IDs in a single round trip
+
+    Args:
+        db: Database session
+        count: Number of IDs to allocate
+
+    Returns:
+        List of member ID strings in ascending order
+    """
+    if count <= 0:
+        return []
+
+    result = await db.execute(
+        select(member_number_seq.next_value()).select_from(func.generate_series(1, count))
     )
+    return [format_member_id(number) for number in sorted(result.scalars().all())]
+
 
-    if last_member and last_member.member_id:
-        # Extract number from "GGDS-0001" format
-        try:
-            last_number = int(last_member.member_id.split("-")[1])
-            next_number = last_number + 1
-        except (IndexError, ValueError):
-            # If parsing fails, start from 1
-            next_number = 1
-    else:
-        # No existing members, start from 1
-        next_number = 1
-
-    # Format as GGDS-XXXX with zero padding
-    member_id = f"GGDS-{next_number:04d}"
-
-    # Double-check uniqueness (in case of race conditions)
-    while db.query(Member).filter(Member.member_id == member_id).first():
-        next_number += 1
-        member_id = f"GGDS-{next_number:04d}"
-
-    return member_id
+def build_full_name(first_name: str, middle_name: Optional[str], surname: str) -> str:
+    """Join name parts into a full name, skipping a missing middle name"""
+    return " ".join(part for part in (first_name, middle_name, surname) if part)
 
 
 def generate_initial_password() -> str:
@@ -0,0 +1,164 @@
+"""
+Per-request database query instrumentation
+
+Counts SQL statements and total database time using SQLAlchemy engine events,
+and flags statement shapes that repeat within one request (typically N+1 lazy
+loads). Also provides query budget helpers for tests.
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Collapse expanded IN-lists so "IN (%(id_1)s, %(id_2)s)" and "IN (%(id_1)s)" share a shape
+_PLACEHOLDER = r"(?:%\([^)]*\)s|%s|\?|\$\d+|:\w+)"
+_PLACEHOLDER_LIST_RE = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions compare equal"""
+    shape = _PLACEHOLDER_LIST_RE.sub("(?)", statement)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Statement count, total database time and statement shapes for one unit of work"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0  # Seconds
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record one executed statement"""
+        self.count += 1
+        self.total_time += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statement shapes executed at least `threshold` times (likely N+1)
+
+        Returns:
+            List of (statement shape, execution count), most repeated first
+        """
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block of code issues more queries than its budget allows"""
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+
+def install_query_counter(engine: Engine) -> None:
+    """
+    Attach the query counter to an engine
+
+    For async engines pass `async_engine.sync_engine`.
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count queries issued inside the block
+
+    Usage:
+        with track_queries() as stats:
+            ...
+        print(stats.count, stats.total_time)
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def check_query_budget(
+    stats: QueryStats,
+    max_queries: int,
+    n_plus_one_threshold: Optional[int] = None
+) -> None:
+    """
+    Assert that recorded queries fit within a budget
+
+    Args:
+        stats: Recorded query statistics
+        max_queries: Maximum number of statements allowed
+        n_plus_one_threshold: Fail if any statement shape repeats this many times
+
+    Raises:
+        QueryBudgetExceeded: If the budget is exceeded or an N+1 pattern is found
+    """
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, got {stats.count}: "
+            + "; ".join(f"{count}x {shape[:120]}" for shape, count in stats.shapes.most_common(5))
+        )
+
+    if n_plus_one_threshold:
+        repeated = stats.repeated_statements(n_plus_one_threshold)
+        if repeated:
+            shape, count = repeated[0]
+            raise QueryBudgetExceeded(f"Possible N+1: {count}x {shape[:200]}")
+
+
+@contextmanager
+def query_budget(max_queries: int, n_plus_one_threshold: Optional[int] = None) -> Iterator[QueryStats]:
+    """
+    Fail if the block issues more than `max_queries` statements
+
+    Usage:
+        with query_budget(3):
+            await get_member_detail(db, member_id)
+    """
+    with track_queries() as stats:
+        yield stats
+    check_query_budget(stats, max_queries, n_plus_one_threshold)
+
+
+def assert_response_query_budget(response, max_queries: int) -> None:
+    """
+    Assert a route's query budget from the X-DB-Query-Count response header
+    (only sent when DEBUG is on)
+
+    Usage:
+        response = client.get(f"/api/members/{member_id}", headers=auth)
+        assert_response_query_budget(response, 4)
+    """
+    count = int(response.headers["X-DB-Query-Count"])
+    if count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{response.request.method} {response.request.url.path}: "
+            f"expected at most {max_queries} queries, got {count}"
+        )
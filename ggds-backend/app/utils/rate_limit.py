@@ -0,0 +1,28 @@
+"""
+Asyncio rate limiter
+"""
+
+import asyncio
+
+
+class RateLimiter:
+    """
+    Spaces callers evenly to at most `rate` acquisitions per second
+
+    A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Wait for the next free slot"""
+        if not self.interval:
+            return
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -1,9 +1,21 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 import bcrypt
 from app.config import settings
 
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="bcrypt"
+)
+_hash_stats_lock = threading.Lock()
+_hash_stats = {"queued": 0, "active": 0, "completed": 0, "rejected": 0}
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
@@ -17,6 +29,67 @@ def get_password_hash(password: str) -> str:
     return hashed.decode('utf-8')
 
 
+def _run_tracked(fn, *args):
+    with _hash_stats_lock:
+        _hash_stats["queued"] -= 1
+        _hash_stats["active"] += 1
+    try:
+        return fn(*args)
+    finally:
+        with _hash_stats_lock:
+            _hash_stats["active"] -= 1
+            _hash_stats["completed"] += 1
+
+
+def _release_cancelled(future) -> None:
+    if future.cancelled():
+        with _hash_stats_lock:
+            _hash_stats["queued"] -= 1
+
+
+async def _run_in_hash_pool(fn, *args):
+    """
+    Run a bcrypt call in the password hashing pool
+
+    Raises:
+        HTTPException: 503 if too many hashes are already waiting
+    """
+    with _hash_stats_lock:
+        if _hash_stats["queued"] >= settings.password_hash_max_queue:
+            _hash_stats["rejected"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        _hash_stats["queued"] += 1
+
+    future = _hash_executor.submit(_run_tracked, fn, *args)
+    future.add_done_callback(_release_cancelled)
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop"""
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop"""
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
+def password_hash_stats() -> Dict[str, int]:
+    """
+    Password hashing pool metrics
+
+    Returns:
+        Dictionary with worker count, queued/active hashes and totals
+    """
+    with _hash_stats_lock:
+        return {"workers": settings.password_hash_workers, **_hash_stats}
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
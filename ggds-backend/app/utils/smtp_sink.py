@@ -0,0 +1,128 @@
+"""
+In-process SMTP sink for local development and benchmarks
+
+Speaks enough ESMTP (EHLO, AUTH, MAIL, RCPT, DATA, RSET, NOOP, QUIT) for
+aiosmtplib and the SMTP connection pool, accepts every message and counts
+connections and deliveries instead of relaying anything. An optional per-reply
+latency approximates the round trips to a real provider, which is what
+connection reuse saves.
+
+Usage:
+    sink = SMTPSink(latency=0.02)
+    await sink.start()
+    # point SMTP_HOST / SMTP_PORT at sink.host / sink.port
+    ...
+    await sink.stop()
+"""
+
+import asyncio
+from typing import List, Optional
+
+
+class SMTPSink:
+    """Asyncio SMTP server that accepts and discards (or keeps) messages"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        keep_messages: bool = False
+    ):
+        self.host = host
+        self.port = port  # 0 picks a free port on start()
+        self.latency = latency  # Seconds added before every reply
+        self.keep_messages = keep_messages
+
+        self.messages: List[bytes] = []
+        self.connections = 0
+        self.active_connections = 0
+        self.messages_received = 0
+        self.bytes_received = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Start listening"""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and close client connections"""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    def reset_counters(self) -> None:
+        self.messages.clear()
+        self.connections = 0
+        self.messages_received = 0
+        self.bytes_received = 0
+
+    async def _reply(self, writer: asyncio.StreamWriter, line: bytes) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        writer.write(line)
+        await writer.drain()
+
+    async def _read_data(self, reader: asyncio.StreamReader) -> bytes:
+        lines = []
+        while True:
+            line = await reader.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            if line.startswith(b".."):
+                line = line[1:]  # Undo dot-stuffing
+            lines.append(line)
+        return b"".join(lines)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self.active_connections += 1
+        try:
+            await self._reply(writer, b"220 smtp-sink ESMTP ready\r\n")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                command = line[:4].upper()
+                if command in (b"EHLO", b"HELO"):
+                    await self._reply(
+                        writer,
+                        b"250-smtp-sink\r\n250-8BITMIME\r\n250-SIZE 52428800\r\n250 AUTH PLAIN LOGIN\r\n"
+                    )
+                elif command == b"AUTH":
+                    # Any credentials are accepted; just walk through the challenges
+                    parts = line.split()
+                    mechanism = parts[1].upper() if len(parts) > 1 else b""
+                    if mechanism == b"LOGIN":
+                        if len(parts) == 2:
+                            await self._reply(writer, b"334 VXNlcm5hbWU6\r\n")
+                            await reader.readline()
+                        await self._reply(writer, b"334 UGFzc3dvcmQ6\r\n")
+                        await reader.readline()
+                    elif len(parts) == 2:
+                        await self._reply(writer, b"334 \r\n")
+                        await reader.readline()
+                    await self._reply(writer, b"235 2.7.0 Authentication successful\r\n")
+                elif command == b"DATA":
+                    await self._reply(writer, b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    data = await self._read_data(reader)
+                    self.messages_received += 1
+                    self.bytes_received += len(data)
+                    if self.keep_messages:
+                        self.messages.append(data)
+                    await self._reply(writer, b"250 2.0.0 OK queued\r\n")
+                elif command == b"QUIT":
+                    await self._reply(writer, b"221 2.0.0 Bye\r\n")
+                    break
+                else:
+                    # MAIL, RCPT, RSET, NOOP and anything else
+                    await self._reply(writer, b"250 2.0.0 OK\r\n")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_connections -= 1
+            writer.close()
@@ -0,0 +1,104 @@
+"""
+Cache of authenticated principals (user + member rows) keyed by token subject
+
+The auth dependencies run on nearly every request; caching the resolved user
+and member rows takes both lookups out of that hot path. Entries are
+invalidated whenever a User or Member row is inserted, updated or deleted
+through the ORM (deactivation, role change, password change, suspension,
+profile completion). The cache is per worker process and only sees ORM
+writes: other workers, and bulk or Core UPDATE statements, pick up changes
+only when entries expire after USER_CACHE_TTL_SECONDS, which is kept short
+for that reason. Code issuing such statements should call
+invalidate_principal() for the users it changes.
+"""
+
+import copy
+from typing import Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.models import Member, User
+from app.utils.cache import TTLCache
+
+user_cache = TTLCache(
+    max_size=settings.user_cache_max_size,
+    ttl=settings.user_cache_ttl_seconds
+)
+
+_USER_COLUMNS = [attr.key for attr in inspect(User).column_attrs]
+_MEMBER_COLUMNS = [attr.key for attr in inspect(Member).column_attrs]
+
+
+def _detached(model, snapshot: dict):
+    instance = model(**copy.deepcopy(snapshot))
+    make_transient_to_detached(instance)
+    return instance
+
+
+def get_cached_principal(user_id: str) -> Optional[Tuple[User, Optional[Member]]]:
+    """
+    Get a cached user and member as detached instances
+
+    Each call builds fresh instances, so callers can merge them into their own
+    session (``session.merge(obj, load=False)``) without sharing state.
+
+    Returns:
+        (User, Member or None), or None on cache miss
+    """
+    entry = user_cache.get(user_id)
+    if entry is None:
+        return None
+
+    user_snapshot, member_snapshot = entry
+    member = _detached(Member, member_snapshot) if member_snapshot is not None else None
+    return _detached(User, user_snapshot), member
+
+
+def cache_principal(user: User, member: Optional[Member]) -> None:
+    """Store a loaded user's (and member's) column values under the user ID"""
+    user_snapshot = {key: getattr(user, key) for key in _USER_COLUMNS}
+    member_snapshot = (
+        {key: getattr(member, key) for key in _MEMBER_COLUMNS} if member is not None else None
+    )
+    user_cache.set(str(user.id), (user_snapshot, member_snapshot))
+
+
+def invalidate_principal(user_id) -> None:
+    """Drop a user (and their member row) from the cache"""
+    user_cache.pop(str(user_id))
+
+
+def _changed_user_ids(session) -> set:
+    user_ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            user_ids.add(str(obj.id))
+        elif isinstance(obj, Member) and obj.user_id is not None:
+            user_ids.add(str(obj.user_id))
+    return user_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_principals(session, flush_context):
+    """Invalidate principals changed in this flush, and again once the transaction commits"""
+    changed = _changed_user_ids(session)
+    if not changed:
+        return
+
+    for user_id in changed:
+        invalidate_principal(user_id)
+    session.info.setdefault("changed_user_ids", set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session):
+    # A concurrent request may have re-cached the old rows between flush and commit
+    for user_id in session.info.pop("changed_user_ids", ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_principals(session):
+    session.info.pop("changed_user_ids", None)
@@ -0,0 +1,127 @@
+"""
+Streaming ZIP archives
+
+stream_zip() writes a ZIP archive on the fly from files read chunk by chunk
+and yields it in pieces, so an archive starts downloading immediately and
+neither the archive nor any file in it is ever held in memory or written to
+disk. zipfile supports unseekable output by putting each entry's CRC and
+sizes in a data descriptor after its data.
+
+Entries are stored uncompressed: uploaded documents are PDFs and images
+that are already compressed, and storing keeps the event loop free of
+deflate work.
+
+Usage:
+    entries = [ZipEntry("report.pdf", size, modified, lambda: storage.iter_chunks(key, 256 * 1024))]
+    return StreamingResponse(stream_zip(entries), media_type="application/zip")
+"""
+
+import zipfile
+from contextlib import aclosing
+from datetime import datetime
+from typing import AsyncIterator, Callable, Iterable, List, NamedTuple
+
+
+class ZipEntry(NamedTuple):
+    """A file to add to an archive"""
+    name: str
+    size: int  # Expected size in bytes (picks ZIP64 for huge files)
+    modified: datetime
+    open: Callable[[], AsyncIterator[bytes]]  # Called when the entry is written
+
+
+class _ZipBuffer:
+    """Write-only, unseekable file object collecting ZipFile output until it is yielded"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.pending = 0  # Bytes written but not yet drained
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        self.pending += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.pending = 0
+        return data
+
+
+def unique_name(name: str, used: set) -> str:
+    """
+    Archive-safe file name, numbered if it is already taken
+
+    Directory parts are dropped so no entry can extract outside the target
+    directory; `used` is updated.
+    """
+    name = name.replace("\\", "/").rsplit("/", 1)[-1].strip() or "file"
+    stem, dot, ext = name.rpartition(".")
+    if not stem:
+        stem, dot, ext = name, "", ""
+
+    candidate = name
+    number = 2
+    while candidate.lower() in used:
+        candidate = f"{stem} ({number}){dot}{ext}"
+        number += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+async def stream_zip(entries: Iterable[ZipEntry], flush_bytes: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """
+    Build a ZIP archive while it is being sent
+
+    Files that cannot be read (or stop part way) are listed in
+    INCOMPLETE_FILES.txt at the end of the archive, since the response has
+    already started and can no longer fail.
+
+    Args:
+        entries: Files to add, in order
+        flush_bytes: Yield once this much archive data is buffered
+
+    Yields:
+        Consecutive pieces of the archive
+    """
+    buffer = _ZipBuffer()
+    incomplete = []
+
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for entry in entries:
+            info = zipfile.ZipInfo(entry.name, date_time=max(entry.modified.timetuple()[:6], (1980, 1, 1, 0, 0, 0)))
+            info.compress_type = zipfile.ZIP_STORED
+            info.file_size = entry.size
+
+            with archive.open(info, "w") as member:
+                try:
+                    async with aclosing(entry.open()) as chunks:
+                        async for chunk in chunks:
+                            member.write(chunk)
+                            if buffer.pending >= flush_bytes:
+                                yield buffer.drain()
+                except Exception as e:
+                    print(f"⚠️  Could not add {entry.name} to archive: {str(e)}")
+                    incomplete.append(entry.name)
+
+            if buffer.pending >= flush_bytes:
+                yield buffer.drain()
+
+        if incomplete:
+            archive.writestr(
+                "INCOMPLETE_FILES.txt",
+                "These files could not be read from storage and are missing or truncated:\n"
+                + "".join(f"{name}\n" for name in incomplete)
+            )
+
+    # Closing the archive wrote the central directory
+    yield buffer.drain()
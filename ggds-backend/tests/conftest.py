@@ -0,0 +1,182 @@
+"""
+Shared test fixtures
+
+Route tests run the app against the PostgreSQL database in TEST_DATABASE_URL.
+Its tables are dropped and recreated, so never point it at real data. Tests
+that need the database are skipped when it is not set.
+"""
+
+import os
+import tempfile
+from datetime import date
+
+import pytest
+from botocore.exceptions import ClientError
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+# Settings are read when app.config is first imported
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ["DATABASE_READ_URL"] = ""
+    os.environ["DEBUG"] = "true"  # Query count headers
+    os.environ["SMTP_USERNAME"] = ""  # Never send email
+    os.environ["STORAGE_GC_INTERVAL_HOURS"] = "0"
+    os.environ["STORAGE_BACKEND"] = "local"  # Uploads go to a throwaway directory
+    os.environ["LOCAL_STORAGE_DIR"] = tempfile.mkdtemp(prefix="ggds-test-uploads-")
+    os.environ.setdefault("SECRET_KEY", "test-secret-key")
+    os.environ.setdefault("SMTP_PASSWORD", "")
+    os.environ.setdefault("SPACES_BUCKET", "test")
+    os.environ.setdefault("SPACES_ACCESS_KEY", "test")
+    os.environ.setdefault("SPACES_SECRET_KEY", "test")
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient for the app on a freshly created test database"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    from fastapi.testclient import TestClient
+    from app.database import Base, engine
+    from app.main import app
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as test_client:
+        yield test_client
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def seed(client):
+    """
+    An admin and a member with family, next of kin, covered persons and cases
+
+    Returns:
+        Dictionary with auth headers ("admin", "member") and the member's
+        "member_id" and first "case_id" as used in URLs
+    """
+    from app.database import SessionLocal
+    from app.models import (
+        Case, CaseStatus, CaseType, CoveredPerson, FamilyMember, FamilyType,
+        Member, MemberStatus, NextOfKin, Relationship, User, UserRole
+    )
+    from app.utils.security import create_access_token
+
+    db = SessionLocal()
+    try:
+        admin = User(email="admin@example.com", hashed_password="x", role=UserRole.ADMIN)
+        user = User(email="member@example.com", hashed_password="x", role=UserRole.MEMBER)
+        db.add_all([admin, user])
+        db.flush()
+
+        member = Member(
+            user_id=user.id,
+            member_id="GGDS-0001",
+            full_name="Test Member",
+            date_of_birth=date(1980, 1, 1),
+            id_number="12345678",
+            phone="+254700000000",
+            email=user.email,
+            status=MemberStatus.ACTIVE,
+            profile_completed=True
+        )
+        db.add(member)
+        db.flush()
+
+        db.add_all([
+            FamilyMember(member_id=member.id, family_type=FamilyType.NUCLEAR, name=f"Relative {i}", relationship=Relationship.CHILD, date_of_birth=date(2010, 1, 1))
+            for i in range(5)
+        ])
+        db.add_all([
+            CoveredPerson(member_id=member.id, name=f"Covered {i}", relationship="child", date_of_birth=date(2010, 1, 1))
+            for i in range(5)
+        ])
+        db.add(NextOfKin(member_id=member.id, name="Kin", relationship="spouse", phone="+254700000001"))
+
+        cases = [
+            Case(
+                case_id=f"CASE-{i:03d}",
+                case_number=i,
+                member_id=member.id,
+                reported_by_user_id=user.id,
+                case_type=CaseType.BEREAVEMENT,
+                description="Description",
+                reporting_reason="Reason",
+                affected_member_name="Test Member",
+                relationship_to_reporter="self",
+                incident_date=date(2025, 1, i),
+                status=CaseStatus.APPROVED if i % 2 else CaseStatus.PENDING
+            )
+            for i in range(1, 8)
+        ]
+        db.add_all(cases)
+        db.commit()
+
+        return {
+            "admin": {"Authorization": f"Bearer {create_access_token({'sub': str(admin.id)})}"},
+            "member": {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"},
+            "member_id": member.member_id,
+            "case_id": cases[0].case_id,
+        }
+    finally:
+        db.close()
+
+
+class FakeBucket:
+    """In-memory stand-in for the S3 client (the calls uploads and downloads make)"""
+
+    def __init__(self):
+        self.objects = {}
+        self.next_object = b""  # What the client "uploaded" for the next multipart upload
+        self.uploads = 0
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"https://bucket.example/{Params['Key']}?op={operation}"
+
+    def create_multipart_upload(self, **kwargs):
+        self.uploads += 1
+        return {"UploadId": f"upload-{self.uploads}"}
+
+    def complete_multipart_upload(self, **kwargs):
+        self.objects[kwargs["Key"]] = self.next_object
+        return {}
+
+    def abort_multipart_upload(self, **kwargs):
+        return {}
+
+    def head_object(self, **kwargs):
+        if kwargs["Key"] not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ContentLength": len(self.objects[kwargs["Key"]]), "ContentType": "", "ETag": '"etag"'}
+
+    def get_object(self, **kwargs):
+        start, end = kwargs["Range"][len("bytes="):].split("-")
+        return {"Body": _Body(self.objects[kwargs["Key"]][int(start):int(end) + 1])}
+
+    def delete_object(self, **kwargs):
+        self.objects.pop(kwargs["Key"], None)
+        return {}
+
+
+class _Body:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def read(self, *args):
+        return self.data
+
+
+@pytest.fixture
+def bucket(client, monkeypatch):
+    """In-memory bucket behind Spaces storage, with 16 byte multipart parts"""
+    from app.config import settings
+    from app.services.s3_service import s3_service
+
+    fake = FakeBucket()
+    monkeypatch.setattr(s3_service, "s3_client", fake)
+    monkeypatch.setattr(settings, "storage_backend", "spaces")
+    monkeypatch.setattr(settings, "upload_part_bytes", 16)
+    return fake
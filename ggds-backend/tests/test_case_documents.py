@@ -0,0 +1,138 @@
+"""
+Document routes
+
+Uploads name the case they belong to and the admin archive of a case
+contains exactly those files. Image downloads never hand the original (with
+its EXIF and GPS metadata) to anyone but admins.
+"""
+
+import io
+import zipfile
+
+import pytest
+from PIL import Image
+
+
+def test_uploads_are_linked_to_the_case_archive(client, seed):
+    case_id = seed["case_id"]
+
+    response = client.post(
+        "/api/upload",
+        params={"case_id": case_id},
+        files={"file": ("certificate.pdf", b"%PDF-1.4 certificate", "application/pdf")},
+        headers=seed["member"]
+    )
+    assert response.status_code == 200, response.text
+
+    response = client.post(
+        "/api/upload/batch",
+        params={"case_id": case_id},
+        files=[
+            ("files", ("permit.pdf", b"%PDF-1.4 permit", "application/pdf")),
+            ("files", ("notes.exe", b"MZ", "application/octet-stream")),
+        ],
+        headers=seed["member"]
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["uploaded"] == 1
+
+    # Not part of the case
+    response = client.post(
+        "/api/upload",
+        files={"file": ("other.pdf", b"%PDF-1.4 other", "application/pdf")},
+        headers=seed["member"]
+    )
+    assert response.status_code == 200, response.text
+
+    response = client.get(f"/api/admin/cases/{case_id}/documents/archive", headers=seed["admin"])
+    assert response.status_code == 200, response.text
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert sorted(archive.namelist()) == ["certificate.pdf", "permit.pdf"]
+        assert archive.read("permit.pdf") == b"%PDF-1.4 permit"
+
+
+def test_upload_to_unknown_case_is_rejected(client, seed):
+    response = client.post(
+        "/api/upload",
+        params={"case_id": "CASE-999"},
+        files={"file": ("certificate.pdf", b"%PDF-1.4 certificate", "application/pdf")},
+        headers=seed["member"]
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("method, path", [
+    ("GET", "/api/upload/not-a-uuid"),
+    ("GET", "/api/upload/not-a-uuid/download"),
+    ("DELETE", "/api/upload/not-a-uuid"),
+])
+def test_document_routes_reject_malformed_ids(client, seed, method, path):
+    response = client.request(method, path, headers=seed["member"])
+    assert response.status_code == 422
+
+
+def _png() -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", (4, 4), "red").save(out, format="PNG")
+    return out.getvalue()
+
+
+def test_image_downloads_serve_the_display_copy(client, seed, bucket, monkeypatch):
+    from app.database import SessionLocal
+    from app.models import Document
+    from app.services.image_service import image_processor
+
+    monkeypatch.setattr(image_processor, "schedule", lambda document_id: None)
+    content = _png()
+    bucket.next_object = content
+
+    response = client.post(
+        "/api/upload/presign",
+        json={"file_name": "photo.png", "file_type": "image/png", "file_size": len(content)},
+        headers=seed["member"]
+    )
+    presigned = response.json()
+    response = client.post(
+        f"/api/upload/{presigned['document_id']}/complete",
+        json={"parts": [{"part_number": part["part_number"], "etag": "etag"} for part in presigned["parts"]]},
+        headers=seed["member"]
+    )
+    assert response.status_code == 200, response.text
+    url = f"/api/upload/{presigned['document_id']}/download"
+
+    # Not processed yet
+    assert client.get(url, headers=seed["member"], follow_redirects=False).status_code == 409
+    assert client.get(url, params={"original": True}, headers=seed["member"]).status_code == 403
+
+    db = SessionLocal()
+    try:
+        document = db.get(Document, presigned["document_id"])
+        document.display_key = f"{document.s3_key}.display.jpg"
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(url, headers=seed["member"], follow_redirects=False)
+    assert response.status_code == 307
+    assert ".display.jpg" in response.headers["location"]
+
+    response = client.get(url, params={"original": True}, headers=seed["admin"], follow_redirects=False)
+    assert response.status_code == 307
+    assert ".display.jpg" not in response.headers["location"]
+
+
+def test_local_image_originals_are_admin_only(client, seed):
+    response = client.post(
+        "/api/upload",
+        files={"file": ("photo.png", _png(), "image/png")},
+        headers=seed["member"]
+    )
+    assert response.status_code == 200, response.text
+    url = f"/api/upload/{response.json()['document_id']}/download"
+
+    # Locally stored images have no display copy
+    assert client.get(url, headers=seed["member"]).status_code == 404
+    response = client.get(url, headers=seed["admin"])
+    assert response.status_code == 200
+    assert response.content == _png()
@@ -0,0 +1,56 @@
+"""
+Direct-to-Spaces uploads
+
+The client side of a multipart upload (PUT of each part) is simulated by
+the in-memory bucket writing the assembled object when the upload is
+completed.
+"""
+
+
+def _presign(client, headers, content: bytes):
+    response = client.post(
+        "/api/upload/presign",
+        json={"file_name": "report.pdf", "file_type": "application/pdf", "file_size": len(content)},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["method"] == "MULTIPART"
+    return response.json()
+
+
+def _complete(client, headers, presigned):
+    return client.post(
+        f"/api/upload/{presigned['document_id']}/complete",
+        json={"parts": [{"part_number": part["part_number"], "etag": "etag"} for part in presigned["parts"]]},
+        headers=headers
+    )
+
+
+def test_rejected_multipart_upload_can_be_retried(client, seed, bucket):
+    content = b"%PDF-1.4 a multipart report"
+
+    # The client sends something else than it declared
+    presigned = _presign(client, seed["member"], content)
+    bucket.next_object = b"GIF89a" + b"0" * (len(content) - 6)
+    response = _complete(client, seed["member"], presigned)
+    assert response.status_code == 400
+    assert "Request a new upload" in response.json()["detail"]
+    assert presigned["s3_key"] not in bucket.objects
+
+    # The used-up upload is gone rather than stuck pending
+    response = client.get(f"/api/upload/{presigned['document_id']}", headers=seed["member"])
+    assert response.status_code == 404
+
+    # Starting over works
+    presigned = _presign(client, seed["member"], content)
+    bucket.next_object = content
+    response = _complete(client, seed["member"], presigned)
+    assert response.status_code == 200, response.text
+
+    response = client.get(f"/api/upload/{presigned['document_id']}", headers=seed["member"])
+    assert response.json()["status"] == "uploaded"
+
+
+def test_complete_with_malformed_id_is_rejected(client, seed):
+    response = client.post("/api/upload/not-a-uuid/complete", json={"parts": []}, headers=seed["member"])
+    assert response.status_code == 422
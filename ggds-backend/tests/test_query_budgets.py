@@ -0,0 +1,69 @@
+"""
+Query budgets for the hot routes
+
+A route whose statement count grows with the number of rows it returns
+(typically a lazy-loaded relationship serialized per row) fails here before
+it reaches production. Budgets are per request with a warm user cache
+(authentication costs no queries) and do not depend on the seeded row counts.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.utils.query_counter import (
+    QueryBudgetExceeded,
+    assert_response_query_budget,
+    install_query_counter,
+    query_budget,
+)
+
+
+def test_query_budget_counts_statements():
+    engine = create_engine("sqlite://")
+    install_query_counter(engine)
+
+    with engine.connect() as connection:
+        with query_budget(2) as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        assert stats.count == 2
+
+        with pytest.raises(QueryBudgetExceeded):
+            with query_budget(1):
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+
+def test_query_budget_flags_repeated_statements():
+    engine = create_engine("sqlite://")
+    install_query_counter(engine)
+
+    with engine.connect() as connection:
+        with pytest.raises(QueryBudgetExceeded, match="N\\+1"):
+            with query_budget(10, n_plus_one_threshold=3):
+                for value in range(3):
+                    connection.execute(text("SELECT :value"), {"value": value})
+
+
+@pytest.mark.parametrize("role, path, max_queries", [
+    ("member", "/api/dashboard/stats", 3),
+    ("member", "/api/dashboard/profile", 3),
+    ("member", "/api/dashboard/cases", 1),
+    ("member", "/api/members/me/profile", 3),
+    ("admin", "/api/members/{member_id}", 3),
+    ("admin", "/api/members", 1),
+    ("member", "/api/cases", 2),
+    ("member", "/api/cases/{case_id}", 2),
+    ("member", "/api/covered-persons", 1),
+    ("admin", "/api/admin/members", 1),
+    ("admin", "/api/admin/cases", 1),
+])
+def test_route_query_budget(client, seed, role, path, max_queries):
+    url = path.format(**seed)
+
+    # The first request fills the user cache
+    client.get(url, headers=seed[role])
+    response = client.get(url, headers=seed[role])
+
+    assert response.status_code == 200, response.text
+    assert_response_query_budget(response, max_queries)
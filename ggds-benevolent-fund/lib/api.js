@@ -5,6 +5,11 @@
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api';
 
+// Read-your-writes pin: after a write the backend returns this header, and
+// sending it back keeps our next reads off a lagging read replica
+const PRIMARY_PIN_HEADER = 'X-Primary-Until';
+let primaryPin = null;
+
 /**
  * Generic API request function
  * @param {string} endpoint - API endpoint (without /api prefix)
@@ -29,6 +34,10 @@ async function apiRequest(endpoint, options = {}) {
     }
   }
 
+  if (primaryPin) {
+    defaultHeaders[PRIMARY_PIN_HEADER] = primaryPin;
+  }
+
   const config = {
     ...options,
     headers: {
@@ -40,6 +49,11 @@ async function apiRequest(endpoint, options = {}) {
   try {
     const response = await fetch(url, config);
 
+    const pin = response.headers.get(PRIMARY_PIN_HEADER);
+    if (pin) {
+      primaryPin = pin;
+    }
+
     // Handle non-JSON responses
     const contentType = response.headers.get('content-type');
     let data;
@@ -320,6 +334,22 @@ export const uploadAPI = {
       body: formData,
     });
   },
+
+  /**
+   * Upload several files in one request (results are reported per file)
+   */
+  uploadMany: async (files) => {
+    const formData = new FormData();
+    for (const file of files) {
+      formData.append('files', file);
+    }
+
+    return apiRequest('/upload/batch', {
+      method: 'POST',
+      headers: {}, // Let browser set Content-Type for FormData
+      body: formData,
+    });
+  },
 };
 
 // Contributions API